@@ -1,5 +1,6 @@
 """Flow component operations utilities for Langflow."""
 
+from datetime import datetime, timezone
 from typing import Any
 from uuid import UUID
 
@@ -7,6 +8,7 @@ from lfx.graph.graph.base import Graph
 from lfx.log.logger import logger
 
 from langflow.helpers.flow import get_flow_by_id_or_endpoint_name
+from langflow.processing.graph_cache import invalidate_graph_templates
 from langflow.services.database.models.flow.model import Flow
 from langflow.services.deps import session_scope
 
@@ -277,9 +279,11 @@ async def update_component_field_value(
 
             # Update the flow data
             db_flow.data = flow_data
+            db_flow.updated_at = datetime.now(timezone.utc)
             session.add(db_flow)
             await session.commit()
             await session.refresh(db_flow)
+        invalidate_graph_templates(flow_id_str)
 
     except Exception as e:  # noqa: BLE001
         await logger.aerror(f"Error updating field {field_name} in {component_id} of {flow_id_or_name}: {e}")
@@ -0,0 +1,34 @@
+"""add column 'starter_project_fingerprint' to flow
+
+Revision ID: f584024fde34
+Revises: 182e5471b900
+Create Date: 2026-10-16 23:58:12.401276
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+from langflow.utils import migration
+
+# revision identifiers, used by Alembic.
+revision: str = "f584024fde34"
+down_revision: str | None = "182e5471b900"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    conn = op.get_bind()
+    with op.batch_alter_table("flow", schema=None) as batch_op:
+        if not migration.column_exists(table_name="flow", column_name="starter_project_fingerprint", conn=conn):
+            batch_op.add_column(sa.Column("starter_project_fingerprint", sa.String(), nullable=True))
+
+
+def downgrade() -> None:
+    conn = op.get_bind()
+    with op.batch_alter_table("flow", schema=None) as batch_op:
+        if migration.column_exists(table_name="flow", column_name="starter_project_fingerprint", conn=conn):
+            batch_op.drop_column("starter_project_fingerprint")
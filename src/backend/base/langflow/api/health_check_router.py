@@ -6,6 +6,7 @@ from pydantic import BaseModel
 from sqlmodel import select
 
 from langflow.api.utils import DbSession
+from langflow.initial_setup.startup import StartupReport, get_startup_report
 from langflow.services.database.models.flow.model import Flow
 from langflow.services.deps import get_chat_service
 
@@ -63,3 +64,10 @@ async def health_check(
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=response.model_dump())
     response.status = "ok"
     return response
+
+
+# /health_check/startup reports how long each startup step took
+# It only holds step names and timings, never error messages
+@health_check_router.get("/health_check/startup")
+async def startup_report() -> StartupReport:
+    return get_startup_report()
@@ -15,12 +15,14 @@ from lfx.utils.validate_cloud import raise_error_if_astra_cloud_disable_componen
 from sqlalchemy import delete
 from sqlmodel.ext.asyncio.session import AsyncSession
 
+from langflow.processing.graph_cache import invalidate_graph_templates
 from langflow.services.auth.utils import get_current_active_user, get_current_active_user_mcp
 from langflow.services.database.models.flow.model import Flow
 from langflow.services.database.models.message.model import MessageTable
 from langflow.services.database.models.transactions.model import TransactionTable
 from langflow.services.database.models.user.model import User
 from langflow.services.database.models.vertex_builds.model import VertexBuildTable
+from langflow.services.deps import get_vertex_build_logger_service
 from langflow.services.store.utils import get_lf_version_from_pypi
 from langflow.utils.constants import LANGFLOW_GLOBAL_VAR_HEADER_PREFIX
 
@@ -313,8 +315,10 @@ async def cascade_delete_flow(session: AsyncSession, flow_id: uuid.UUID) -> None
         # used elsewhere to search for these messages.
         await session.exec(delete(MessageTable).where(MessageTable.flow_id == flow_id))
         await session.exec(delete(TransactionTable).where(TransactionTable.flow_id == flow_id))
+        get_vertex_build_logger_service().discard(flow_id)
         await session.exec(delete(VertexBuildTable).where(VertexBuildTable.flow_id == flow_id))
         await session.exec(delete(Flow).where(Flow.id == flow_id))
+        invalidate_graph_templates(flow_id)
     except Exception as e:
         msg = f"Unable to cascade delete flow: {flow_id}"
         raise RuntimeError(msg, e) from e
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import asyncio
+import copy
 import time
 from collections.abc import AsyncGenerator
 from http import HTTPStatus
@@ -42,6 +43,7 @@ from langflow.exceptions.api import APIException, InvalidChatInputError
 from langflow.exceptions.serialization import SerializationError
 from langflow.helpers.flow import get_flow_by_id_or_endpoint_name
 from langflow.interface.initialize.loading import update_params_with_load_from_db_fields
+from langflow.processing.graph_cache import fingerprint_tweaks, graph_template_cache
 from langflow.processing.process import process_tweaks, run_graph_internal
 from langflow.schema.graph import Tweaks
 from langflow.services.auth.utils import api_key_security, get_current_active_user, get_webhook_user
@@ -150,11 +152,17 @@ async def simple_run_flow(
         if flow.data is None:
             msg = f"Flow {flow_id_str} has no data"
             raise ValueError(msg)
-        graph_data = flow.data.copy()
-        graph_data = process_tweaks(graph_data, input_request.tweaks or {}, stream=stream)
-        graph = Graph.from_payload(
-            graph_data, flow_id=flow_id_str, user_id=str(user_id), flow_name=flow.name, context=context
+        tweaks = input_request.tweaks or {}
+        tweaks_dict = tweaks.model_dump() if isinstance(tweaks, Tweaks) else tweaks
+
+        def build_template() -> Graph:
+            graph_data = process_tweaks(copy.deepcopy(flow.data), tweaks, stream=stream)
+            return Graph.from_payload(graph_data, flow_id=flow_id_str, user_id=str(user_id), flow_name=flow.name)
+
+        template_key = graph_template_cache.make_key(
+            flow_id_str, flow.updated_at, str(user_id), fingerprint_tweaks(tweaks_dict, stream=stream)
         )
+        graph = graph_template_cache.get_graph(template_key, build_template, user_id=str(user_id), context=context)
         if run_id is None:
             run_id = str(uuid4())
         graph.set_run_id(run_id)
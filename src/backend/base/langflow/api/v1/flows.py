@@ -25,6 +25,7 @@ from langflow.api.utils import CurrentActiveUser, DbSession, cascade_delete_flow
 from langflow.api.v1.schemas import FlowListCreate
 from langflow.helpers.user import get_user_by_flow_id_or_endpoint_name
 from langflow.initial_setup.constants import STARTER_FOLDER_NAME
+from langflow.processing.graph_cache import invalidate_graph_templates
 from langflow.services.database.models.flow.model import (
     AccessTypeEnum,
     Flow,
@@ -466,6 +467,7 @@ async def update_flow(
         await session.flush()
         await session.refresh(db_flow)
         await _save_flow_to_fs(db_flow, current_user.id, storage_service)
+        invalidate_graph_templates(db_flow.id)
 
         # Convert to FlowRead while session is still active to avoid detached instance errors
         flow_read = FlowRead.model_validate(db_flow, from_attributes=True)
@@ -1,11 +1,12 @@
+import asyncio
 import json
 import shutil
 from http import HTTPStatus
 from pathlib import Path
 
-import pandas as pd
 from fastapi import APIRouter, HTTPException
-from langchain_chroma import Chroma
+from lfx.base.knowledge_bases.kb_handles import invalidate_kb_handles
+from lfx.base.knowledge_bases.kb_stats import read_kb_stats, rebuild_kb_stats
 from lfx.log import logger
 from pydantic import BaseModel
 
@@ -17,6 +18,9 @@ router = APIRouter(tags=["Knowledge Bases"], prefix="/knowledge_bases")
 
 _KNOWLEDGE_BASES_DIR: Path | None = None
 
+# Stats manifest rebuilds in progress, by knowledge base path
+_KB_STATS_REBUILDS: dict[Path, asyncio.Task] = {}
+
 
 def _get_knowledge_bases_dir() -> Path:
     """Lazy load the knowledge bases directory from settings."""
@@ -171,42 +175,26 @@ def detect_embedding_model(kb_path: Path) -> str:
     return "Unknown"
 
 
-def get_text_columns(df: pd.DataFrame, schema_data: list | None = None) -> list[str]:
-    """Get the text columns to analyze for word/character counts."""
-    # First try schema-defined text columns
-    if schema_data:
-        text_columns = [
-            col["column_name"]
-            for col in schema_data
-            if col.get("vectorize", False) and col.get("data_type") == "string"
-        ]
-        if text_columns:
-            return [col for col in text_columns if col in df.columns]
-
-    # Fallback to common text column names
-    common_names = ["text", "content", "document", "chunk"]
-    text_columns = [col for col in df.columns if col.lower() in common_names]
-    if text_columns:
-        return text_columns
-
-    # Last resort: all string columns
-    return [col for col in df.columns if df[col].dtype == "object"]
-
-
-def calculate_text_metrics(df: pd.DataFrame, text_columns: list[str]) -> tuple[int, int]:
-    """Calculate total words and characters from text columns."""
-    total_words = 0
-    total_characters = 0
-
-    for col in text_columns:
-        if col not in df.columns:
-            continue
+def _rebuild_kb_stats(kb_path: Path) -> None:
+    try:
+        rebuild_kb_stats(kb_path)
+    except Exception:  # noqa: BLE001
+        logger.exception("Error rebuilding stats of knowledge base '%s'", kb_path.name)
 
-        text_series = df[col].astype(str).fillna("")
-        total_characters += int(text_series.str.len().sum().item())
-        total_words += int(text_series.str.split().str.len().sum().item())
 
-    return total_words, total_characters
+def _schedule_kb_stats_rebuild(kb_path: Path) -> None:
+    """Rebuild the stats manifest of a knowledge base in a worker thread, once at a time per knowledge base."""
+    if kb_path in _KB_STATS_REBUILDS:
+        return
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        # Not called from the event loop, so there is nothing to keep responsive
+        _rebuild_kb_stats(kb_path)
+        return
+    task = loop.create_task(asyncio.to_thread(_rebuild_kb_stats, kb_path))
+    _KB_STATS_REBUILDS[kb_path] = task
+    task.add_done_callback(lambda _: _KB_STATS_REBUILDS.pop(kb_path, None))
 
 
 def get_kb_metadata(kb_path: Path) -> dict:
@@ -235,61 +223,26 @@ def get_kb_metadata(kb_path: Path) -> dict:
             except (OSError, json.JSONDecodeError) as _:
                 logger.exception("Error reading embedding metadata file '%s'", metadata_file)
 
-        # Fallback to detection if not found in metadata file
-        if metadata["embedding_provider"] == "Unknown":
-            metadata["embedding_provider"] = detect_embedding_provider(kb_path)
-        if metadata["embedding_model"] == "Unknown":
-            metadata["embedding_model"] = detect_embedding_model(kb_path)
-
-        # Read schema for text column information
-        schema_data = None
-        schema_file = kb_path / "schema.json"
-        if schema_file.exists():
-            try:
-                with schema_file.open("r", encoding="utf-8") as f:
-                    schema_data = json.load(f)
-                    if not isinstance(schema_data, list):
-                        schema_data = None
-            except (ValueError, TypeError, OSError) as _:
-                logger.exception("Error reading schema file '%s'", schema_file)
-
-        # Create vector store
-        chroma = Chroma(
-            persist_directory=str(kb_path),
-            collection_name=kb_path.name,
-        )
-
-        # Access the raw collection
-        collection = chroma._collection  # noqa: SLF001
-
-        # Fetch all documents and metadata
-        results = collection.get(include=["documents", "metadatas"])
-
-        # Convert to pandas DataFrame
-        source_chunks = pd.DataFrame(
-            {
-                "document": results["documents"],
-                "metadata": results["metadatas"],
-            }
-        )
-
-        # Process the source data for metadata
-        try:
-            metadata["chunks"] = len(source_chunks)
-
-            # Get text columns and calculate metrics
-            text_columns = get_text_columns(source_chunks, schema_data)
-            if text_columns:
-                words, characters = calculate_text_metrics(source_chunks, text_columns)
-                metadata["words"] = words
-                metadata["characters"] = characters
-
-                # Calculate average chunk size
-                if int(metadata["chunks"]) > 0:
-                    metadata["avg_chunk_size"] = round(int(characters) / int(metadata["chunks"]), 1)
-
-        except (OSError, ValueError, TypeError) as _:
-            logger.exception("Error processing Chroma DB '%s'", kb_path.name)
+        # Chunk, word and character counts come from the manifest kept up to date by ingestion
+        stats = read_kb_stats(kb_path)
+
+        # Fallback to the manifest, then to detection, if not found in metadata file
+        for key, detect in (
+            ("embedding_provider", detect_embedding_provider),
+            ("embedding_model", detect_embedding_model),
+        ):
+            if metadata[key] == "Unknown":
+                metadata[key] = (stats or {}).get(key) or detect(kb_path)
+
+        if stats is None:
+            # Knowledge bases created before the manifest existed are counted once, in the background
+            _schedule_kb_stats_rebuild(kb_path)
+        else:
+            metadata["chunks"] = int(stats.get("chunks", 0))
+            metadata["words"] = int(stats.get("words", 0))
+            metadata["characters"] = int(stats.get("characters", 0))
+            if int(metadata["chunks"]) > 0:
+                metadata["avg_chunk_size"] = round(int(metadata["characters"]) / int(metadata["chunks"]), 1)
 
     except (OSError, ValueError, TypeError) as _:
         logger.exception("Error processing knowledge base directory '%s'", kb_path)
@@ -398,6 +351,7 @@ async def delete_knowledge_base(kb_name: str, current_user: CurrentActiveUser) -
 
         # Delete the entire knowledge base directory
         shutil.rmtree(kb_path)
+        invalidate_kb_handles(kb_path)
 
     except HTTPException:
         raise
@@ -428,6 +382,7 @@ async def delete_knowledge_bases_bulk(request: BulkDeleteRequest, current_user:
             try:
                 # Delete the entire knowledge base directory
                 shutil.rmtree(kb_path)
+                invalidate_kb_handles(kb_path)
                 deleted_count += 1
             except (OSError, PermissionError) as e:
                 await logger.aexception("Error deleting knowledge base '%s': %s", kb_name, e)
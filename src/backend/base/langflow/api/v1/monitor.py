@@ -8,6 +8,7 @@ from sqlalchemy import delete
 from sqlmodel import col, select
 
 from langflow.api.utils import DbSession, custom_params
+from langflow.memory import aflush_messages, message_write_buffer
 from langflow.schema.message import MessageResponse
 from langflow.services.auth.utils import get_current_active_user
 from langflow.services.database.models.flow.model import Flow
@@ -20,6 +21,7 @@ from langflow.services.database.models.vertex_builds.crud import (
     get_vertex_builds_by_flow_id,
 )
 from langflow.services.database.models.vertex_builds.model import VertexBuildMapModel
+from langflow.services.deps import get_vertex_build_logger_service
 
 router = APIRouter(prefix="/monitor", tags=["Monitor"])
 
@@ -27,6 +29,7 @@ router = APIRouter(prefix="/monitor", tags=["Monitor"])
 @router.get("/builds", dependencies=[Depends(get_current_active_user)])
 async def get_vertex_builds(flow_id: Annotated[UUID, Query()], session: DbSession) -> VertexBuildMapModel:
     try:
+        await get_vertex_build_logger_service().flush()
         vertex_builds = await get_vertex_builds_by_flow_id(session, flow_id)
         return VertexBuildMapModel.from_list_of_dicts(vertex_builds)
     except Exception as e:
@@ -36,6 +39,7 @@ async def get_vertex_builds(flow_id: Annotated[UUID, Query()], session: DbSessio
 @router.delete("/builds", status_code=204, dependencies=[Depends(get_current_active_user)])
 async def delete_vertex_builds(flow_id: Annotated[UUID, Query()], session: DbSession) -> None:
     try:
+        get_vertex_build_logger_service().discard(flow_id)
         await delete_vertex_builds_by_flow_id(session, flow_id)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e)) from e
@@ -74,6 +78,11 @@ async def get_messages(
     order_by: Annotated[str | None, Query()] = "timestamp",
 ) -> list[MessageResponse]:
     try:
+        decoded_session_id = None
+        if session_id:
+            from urllib.parse import unquote
+
+            decoded_session_id = unquote(session_id)
         # Use JOIN instead of subquery for better performance
         stmt = select(MessageTable)
         stmt = stmt.join(Flow, MessageTable.flow_id == Flow.id)
@@ -81,10 +90,7 @@ async def get_messages(
 
         if flow_id:
             stmt = stmt.where(MessageTable.flow_id == flow_id)
-        if session_id:
-            from urllib.parse import unquote
-
-            decoded_session_id = unquote(session_id)
+        if decoded_session_id:
             stmt = stmt.where(MessageTable.session_id == decoded_session_id)
         if sender:
             stmt = stmt.where(MessageTable.sender == sender)
@@ -102,6 +108,8 @@ async def get_messages(
 @router.delete("/messages", status_code=204, dependencies=[Depends(get_current_active_user)])
 async def delete_messages(message_ids: list[UUID], session: DbSession) -> None:
     try:
+        for message_id in message_ids:
+            message_write_buffer.discard(message_id)
         await session.exec(delete(MessageTable).where(MessageTable.id.in_(message_ids)))  # type: ignore[attr-defined]
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e)) from e
@@ -144,6 +152,7 @@ async def update_session_id(
     session: DbSession,
 ) -> list[MessageResponse]:
     try:
+        await aflush_messages(old_session_id)
         # Get all messages with the old session ID
         stmt = select(MessageTable).where(MessageTable.session_id == old_session_id)
         messages = (await session.exec(stmt)).all()
@@ -177,6 +186,7 @@ async def delete_messages_session(
     session: DbSession,
 ):
     try:
+        message_write_buffer.pop_session(session_id)
         await session.exec(
             delete(MessageTable)
             .where(col(MessageTable.session_id) == session_id)
@@ -5,6 +5,7 @@ from lfx.events.event_manager import (
     EventCallback,
     EventManager,
     PartialEventCallback,
+    TokenCoalescer,
     create_default_event_manager,
     create_stream_tokens_event_manager,
 )
@@ -13,6 +14,7 @@ __all__ = [
     "EventCallback",
     "EventManager",
     "PartialEventCallback",
+    "TokenCoalescer",
     "create_default_event_manager",
     "create_stream_tokens_event_manager",
 ]
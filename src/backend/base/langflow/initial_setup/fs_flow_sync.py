@@ -0,0 +1,213 @@
+"""Synchronization of file-backed flows with the database.
+
+A flow saved with an ``fs_path`` follows its file: when the file changes, its name, description, data,
+locked flag and folder are written to the flow. Changes are detected with filesystem notifications from
+watchfiles when it is installed, and by polling the modification times of the files otherwise. Only the
+ids and paths of the flows are read from the database to track the files. A flow row is only loaded once
+its file changed, and all the changes noticed together are written in one transaction.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections import defaultdict
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+from uuid import UUID
+
+import orjson
+from lfx.log.logger import logger
+from sqlmodel import col, select
+
+from langflow.processing.graph_cache import invalidate_graph_templates
+from langflow.services.database.models.flow.model import Flow
+from langflow.services.deps import get_storage_service, session_scope
+
+if TYPE_CHECKING:
+    from sqlmodel.ext.asyncio.session import AsyncSession
+
+try:
+    from watchfiles import awatch
+except ImportError:
+    awatch = None
+
+# Milliseconds during which a burst of file changes is gathered before the flows are updated
+FLOW_FILE_DEBOUNCE_MS = 200
+SYNCED_FLOW_FIELDS = ("name", "description", "data", "locked")
+
+
+def _stat_mtimes(paths: list[str]) -> dict[str, float | None]:
+    """Return the modification time of every file, or None for files that cannot be read."""
+    mtimes: dict[str, float | None] = {}
+    for path in paths:
+        try:
+            mtimes[path] = Path(path).stat().st_mtime
+        except OSError:
+            mtimes[path] = None
+    return mtimes
+
+
+def _read_flow_files(paths: list[str]) -> dict[str, Any]:
+    """Return the parsed content of every file, or the exception raised while reading it."""
+    contents: dict[str, Any] = {}
+    for path in paths:
+        try:
+            contents[path] = orjson.loads(Path(path).read_bytes())
+        except (OSError, orjson.JSONDecodeError) as exc:
+            contents[path] = exc
+    return contents
+
+
+async def update_flows_from_files(session: AsyncSession, updates: dict[UUID, dict[str, Any]]) -> None:
+    """Write the content of flow files to their flows.
+
+    Args:
+        session (AsyncSession): The database session for executing queries.
+        updates (dict[UUID, dict[str, Any]]): The parsed content of the flow files by flow id.
+    """
+    stmt = select(Flow).where(col(Flow.id).in_(list(updates)))
+    for flow in (await session.exec(stmt)).all():
+        update_data = updates[flow.id]
+        changed = False
+        for field_name in SYNCED_FLOW_FIELDS:
+            if (new_value := update_data.get(field_name)) and getattr(flow, field_name) != new_value:
+                setattr(flow, field_name, new_value)
+                changed = True
+        if folder_id := update_data.get("folder_id"):
+            flow.folder_id = UUID(folder_id)
+        if changed:
+            # The run API keys its prepared graphs on updated_at
+            flow.updated_at = datetime.now(timezone.utc)
+            invalidate_graph_templates(flow.id)
+    await session.flush()
+
+
+class FlowFileSync:
+    """Keeps file-backed flows in sync with their files.
+
+    Attributes:
+        polling_interval (float): Seconds between two reads of the file-backed flows from the database, and
+            between two checks of every file when the files are polled.
+        watch (bool): Whether the files are watched with filesystem notifications.
+    """
+
+    def __init__(self, polling_interval: float, *, watch: bool = True):
+        self.polling_interval = polling_interval
+        self.watch = watch and awatch is not None
+        self._paths: dict[UUID, str] = {}
+        self._flows_by_path: dict[str, set[UUID]] = {}
+        self._mtimes: dict[UUID, float] = {}
+
+    async def run(self) -> None:
+        """Synchronize the flows until cancelled."""
+        await self.refresh()
+        while True:
+            directories = self._watched_directories() if self.watch else set()
+            if directories:
+                await self._watch(directories)
+                continue
+            await self.check(set(self._paths))
+            await asyncio.sleep(self.polling_interval)
+            await self.refresh()
+
+    async def refresh(self) -> set[UUID]:
+        """Read the paths of the file-backed flows and return the flows that are new or moved to another file."""
+        storage_service = get_storage_service()
+        async with session_scope() as session:
+            stmt = select(Flow.id, Flow.fs_path, Flow.user_id).where(col(Flow.fs_path).is_not(None))
+            rows = (await session.exec(stmt)).all()
+        paths = {}
+        for flow_id, fs_path, user_id in rows:
+            path = Path(fs_path)
+            if not path.is_absolute():
+                # Relative paths are stored in the flows directory of the user
+                path = Path(storage_service.data_dir / "flows" / str(user_id) / fs_path)
+            paths[flow_id] = str(path.absolute())
+        return self.track(paths)
+
+    def track(self, paths: dict[UUID, str]) -> set[UUID]:
+        """Track the files of the given flows and return the flows that are new or moved to another file."""
+        changed = {flow_id for flow_id, path in paths.items() if self._paths.get(flow_id) != path}
+        for flow_id in (self._paths.keys() - paths.keys()) | changed:
+            self._mtimes.pop(flow_id, None)
+        self._paths = paths
+        flows_by_path: dict[str, set[UUID]] = defaultdict(set)
+        for flow_id, path in paths.items():
+            flows_by_path[path].add(flow_id)
+        self._flows_by_path = flows_by_path
+        return changed
+
+    async def check(self, flow_ids: set[UUID]) -> None:
+        """Update the flows among ``flow_ids`` whose file was modified since it was last synchronized."""
+        paths = {flow_id: self._paths[flow_id] for flow_id in flow_ids if flow_id in self._paths}
+        if not paths:
+            return
+        mtimes = await asyncio.to_thread(_stat_mtimes, sorted(set(paths.values())))
+        modified = {
+            flow_id: path
+            for flow_id, path in paths.items()
+            if (mtime := mtimes.get(path)) is not None and mtime > self._mtimes.get(flow_id, 0)
+        }
+        if not modified:
+            return
+        contents = await asyncio.to_thread(_read_flow_files, sorted(set(modified.values())))
+        updates: dict[UUID, dict[str, Any]] = {}
+        for flow_id, path in modified.items():
+            # The file is synchronized again only once it changes again
+            self._mtimes[flow_id] = mtimes[path]
+            content = contents[path]
+            if isinstance(content, Exception):
+                await logger.aerror(f"Error while handling flow file {path}: {content}")
+            elif not isinstance(content, dict):
+                await logger.aerror(f"Flow file {path} does not hold a flow")
+            else:
+                updates[flow_id] = content
+        if updates:
+            await self._apply(updates)
+
+    async def _apply(self, updates: dict[UUID, dict[str, Any]]) -> None:
+        try:
+            async with session_scope() as session:
+                await update_flows_from_files(session, updates)
+        except Exception:  # noqa: BLE001
+            if len(updates) == 1:
+                await logger.aexception(f"Couldn't update flow {next(iter(updates))} in database from its file")
+                return
+            # Write the flows one at a time, so one invalid file does not hold back the others
+            for flow_id, update_data in updates.items():
+                try:
+                    async with session_scope() as session:
+                        await update_flows_from_files(session, {flow_id: update_data})
+                except Exception:  # noqa: BLE001
+                    await logger.aexception(f"Couldn't update flow {flow_id} in database from its file")
+
+    def _watched_directories(self) -> set[str]:
+        directories = {str(Path(path).parent) for path in self._paths.values()}
+        return {directory for directory in directories if Path(directory).is_dir()}
+
+    async def _watch(self, directories: set[str]) -> None:
+        """Synchronize the flows on filesystem notifications until the watched directories change."""
+        # Files changed while no watcher was running are found by checking every flow once
+        await self.check(set(self._paths))
+        try:
+            async for changes in awatch(
+                *directories,
+                debounce=FLOW_FILE_DEBOUNCE_MS,
+                rust_timeout=max(int(self.polling_interval * 1000), 1),
+                yield_on_timeout=True,
+                recursive=False,
+            ):
+                changed_flow_ids = {
+                    flow_id
+                    for _, path in changes
+                    for flow_id in self._flows_by_path.get(str(Path(path).absolute()), ())
+                }
+                new_flow_ids = await self.refresh()
+                await self.check(changed_flow_ids | new_flow_ids)
+                if self._watched_directories() != directories:
+                    return
+        except (OSError, RuntimeError) as exc:
+            # For example when the limit of inotify watches is reached
+            await logger.awarning(f"Cannot watch flow files, polling them instead: {exc}")
+            self.watch = False
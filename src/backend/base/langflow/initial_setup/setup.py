@@ -1,5 +1,6 @@
 import asyncio
 import copy
+import hashlib
 import io
 import json
 import re
@@ -40,6 +41,7 @@ from langflow.initial_setup.constants import (
     STARTER_FOLDER_DESCRIPTION,
     STARTER_FOLDER_NAME,
 )
+from langflow.initial_setup.fs_flow_sync import FlowFileSync
 from langflow.services.auth.utils import create_super_user
 from langflow.services.database.models.flow.model import Flow, FlowCreate
 from langflow.services.database.models.folder.constants import (
@@ -50,6 +52,9 @@ from langflow.services.database.models.folder.constants import (
 from langflow.services.database.models.folder.model import Folder, FolderCreate, FolderRead
 from langflow.services.deps import get_settings_service, get_storage_service, get_variable_service, session_scope
 
+# Bump when the functions updating starter projects change, so the projects are rebuilt on the next startup
+STARTER_PROJECT_FINGERPRINT_VERSION = 1
+
 # In the folder ./starter_projects we have a few JSON files that represent
 # starter projects. We want to load these into the database so that users
 # can use them as a starting point for their own projects.
@@ -676,6 +681,7 @@ def create_new_project(
     project_icon,
     project_icon_bg_color,
     new_folder_id,
+    starter_project_fingerprint=None,
 ) -> None:
     new_project = FlowCreate(
         name=project_name,
@@ -690,6 +696,7 @@ def create_new_project(
         tags=project_tags,
     )
     db_flow = Flow.model_validate(new_project, from_attributes=True)
+    db_flow.starter_project_fingerprint = starter_project_fingerprint
     session.add(db_flow)
 
 
@@ -704,6 +711,21 @@ async def delete_starter_projects(session, folder_id) -> None:
         await session.delete(flow)
 
 
+def get_components_hash(all_types_dict: dict) -> str:
+    """Return a hash of the component templates the starter projects are updated with."""
+    payload = orjson.dumps(all_types_dict, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS, default=str)
+    return hashlib.sha256(payload).hexdigest()
+
+
+def get_starter_project_fingerprint(project: dict, components_hash: str) -> str:
+    """Return the fingerprint of a starter project built with the components hashed in ``components_hash``."""
+    project_hash = hashlib.sha256(
+        orjson.dumps(project, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS, default=str)
+    ).hexdigest()
+    fingerprint = f"{STARTER_PROJECT_FINGERPRINT_VERSION}:{project_hash}:{components_hash}"
+    return hashlib.sha256(fingerprint.encode()).hexdigest()
+
+
 async def folder_exists(session, folder_name):
     stmt = select(Folder).where(Folder.name == folder_name)
     folder = (await session.exec(stmt)).first()
@@ -1075,6 +1097,10 @@ async def find_existing_flow(session, flow_id, flow_endpoint_name):
 async def create_or_update_starter_projects(all_types_dict: dict) -> None:
     """Create or update starter projects.
 
+    When updating, only the projects whose file or component templates changed since the last startup are
+    rebuilt. The fingerprint of every project is stored on its flow, so every instance sharing the database
+    skips the projects another one already rebuilt.
+
     Args:
         all_types_dict (dict): Dictionary containing all component types and their templates
     """
@@ -1090,14 +1116,39 @@ async def create_or_update_starter_projects(all_types_dict: dict) -> None:
 
         if get_settings_service().settings.update_starter_projects:
             await logger.adebug("Updating starter projects")
-            # 1. Delete all existing starter projects
+            # 1. Find the projects whose file or components changed since they were last written to the database
+            components_hash = await asyncio.to_thread(get_components_hash, all_types_dict)
+            existing_flows_by_name: dict[str, list[Flow]] = defaultdict(list)
+            for existing_flow in await get_all_flows_similar_to_project(session, new_folder.id):
+                existing_flows_by_name[existing_flow.name].append(existing_flow)
+            project_names = {project.get("name") for _, project in starter_projects}
+            # Starter projects that no longer exist are removed
+            stale_flow_ids = [
+                flow.id for name, flows in existing_flows_by_name.items() if name not in project_names for flow in flows
+            ]
+            changed_projects = []
+            for project_path, project in starter_projects:
+                project_name = project.get("name")
+                fingerprint = get_starter_project_fingerprint(project, components_hash)
+                existing_project_flows = existing_flows_by_name.get(project_name, [])
+                if (
+                    len(existing_project_flows) == 1
+                    and existing_project_flows[0].starter_project_fingerprint == fingerprint
+                ):
+                    continue
+                stale_flow_ids.extend(flow.id for flow in existing_project_flows)
+                changed_projects.append((project_path, project, fingerprint))
+
+            # 2. Delete the existing versions of the changed projects in one statement
+            if stale_flow_ids:
+                await session.exec(sa.delete(Flow).where(col(Flow.id).in_(stale_flow_ids)))
             successfully_updated_projects = 0
-            await delete_starter_projects(session, new_folder.id)
             # Profile pictures are now served directly from the package installation directory
             # No need to copy them to config_dir
 
-            # 2. Update all starter projects with the latest component versions (this modifies the actual file data)
-            for project_path, project in starter_projects:
+            # 3. Update the changed starter projects with the latest component versions (this modifies the actual
+            # file data). The new flows are inserted together when the session is committed.
+            for project_path, project, fingerprint in changed_projects:
                 (
                     project_name,
                     project_description,
@@ -1113,9 +1164,12 @@ async def create_or_update_starter_projects(all_types_dict: dict) -> None:
                     project_data.copy(), all_types_dict
                 )
                 updated_project_data = update_edges_with_latest_component_versions(updated_project_data)
+                project_fingerprint = fingerprint
                 if updated_project_data != project_data:
                     project_data = updated_project_data
                     await update_project_file(project_path, project, updated_project_data)
+                    # The next startup loads the updated file
+                    project_fingerprint = get_starter_project_fingerprint(project, components_hash)
 
                 try:
                     # Create the updated starter project
@@ -1131,12 +1185,16 @@ async def create_or_update_starter_projects(all_types_dict: dict) -> None:
                         project_gradient=project_gradient,
                         project_tags=project_tags,
                         new_folder_id=new_folder.id,
+                        starter_project_fingerprint=project_fingerprint,
                     )
                 except Exception:  # noqa: BLE001
                     await logger.aexception(f"Error while creating starter project {project_name}")
 
                 successfully_updated_projects += 1
-            await logger.adebug(f"Successfully updated {successfully_updated_projects} starter projects")
+            await logger.adebug(
+                f"Successfully updated {successfully_updated_projects} starter projects, "
+                f"{len(starter_projects) - len(changed_projects)} were unchanged"
+            )
         else:
             # Even if we're not updating starter projects, we still need to create any that don't exist
             await logger.adebug("Creating new starter projects")
@@ -1272,57 +1330,16 @@ async def get_or_create_default_folder(session: AsyncSession, user_id: UUID) ->
 
 
 async def sync_flows_from_fs():
-    flow_mtimes = {}
-    fs_flows_polling_interval = get_settings_service().settings.fs_flows_polling_interval / 1000
-    storage_service = get_storage_service()
+    settings = get_settings_service().settings
+    flow_file_sync = FlowFileSync(settings.fs_flows_polling_interval / 1000, watch=settings.fs_flows_watch)
     try:
-        while True:
-            try:
-                async with session_scope() as session:
-                    stmt = select(Flow).where(col(Flow.fs_path).is_not(None))
-                    flows = (await session.exec(stmt)).all()
-                    for flow in flows:
-                        mtime = flow_mtimes.setdefault(flow.id, 0)
-                        # Resolve path: if relative, construct full path using user's flows directory
-                        fs_path_str = flow.fs_path
-                        if not Path(fs_path_str).is_absolute():
-                            # Relative path - construct full path
-                            path = storage_service.data_dir / "flows" / str(flow.user_id) / fs_path_str
-                        else:
-                            # Absolute path - use as-is
-                            path = anyio.Path(fs_path_str)
-                        try:
-                            if await path.exists():
-                                new_mtime = (await path.stat()).st_mtime
-                                if new_mtime > mtime:
-                                    update_data = orjson.loads(await path.read_text(encoding="utf-8"))
-                                    try:
-                                        for field_name in ("name", "description", "data", "locked"):
-                                            if new_value := update_data.get(field_name):
-                                                setattr(flow, field_name, new_value)
-                                        if folder_id := update_data.get("folder_id"):
-                                            flow.folder_id = UUID(folder_id)
-                                        await session.flush()
-                                        await session.refresh(flow)
-                                    except Exception:  # noqa: BLE001
-                                        await logger.aexception(
-                                            f"Couldn't update flow {flow.id} in database from path {path}"
-                                        )
-                                    flow_mtimes[flow.id] = new_mtime
-                        except Exception:  # noqa: BLE001
-                            await logger.aexception(f"Error while handling flow file {path}")
-            except asyncio.CancelledError:
-                await logger.adebug("Flow sync cancelled")
-                break
-            except (sa.exc.OperationalError, ValueError) as e:
-                if "no active connection" in str(e) or "connection is closed" in str(e):
-                    await logger.adebug("Database connection lost, assuming shutdown")
-                    break  # Exit gracefully, don't error
-                raise  # Re-raise if it's a real connection problem
-            except Exception:  # noqa: BLE001
-                await logger.aexception("Error while syncing flows from database")
-                break
-
-            await asyncio.sleep(fs_flows_polling_interval)
+        await flow_file_sync.run()
     except asyncio.CancelledError:
         await logger.adebug("Flow sync task cancelled")
+    except (sa.exc.OperationalError, ValueError) as e:
+        if "no active connection" in str(e) or "connection is closed" in str(e):
+            await logger.adebug("Database connection lost, assuming shutdown")
+            return  # Exit gracefully, don't error
+        raise  # Re-raise if it's a real connection problem
+    except Exception:  # noqa: BLE001
+        await logger.aexception("Error while syncing flows from database")
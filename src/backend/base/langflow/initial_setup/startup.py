@@ -0,0 +1,156 @@
+"""Concurrent execution of the server startup steps.
+
+The server startup is described as a graph of named steps and the steps each depends on. Every step
+starts as soon as its dependencies have finished, so independent steps, such as loading the component
+types and creating the default superuser, run concurrently. The timing of every step is recorded in a
+startup report, which the health check router exposes, and the whole startup can be profiled with cProfile.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import cProfile
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from lfx.log.logger import logger
+from pydantic import BaseModel, Field
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable, Sequence
+
+
+@dataclass
+class StartupStep:
+    name: str
+    run: Callable[[], Awaitable[Any]]
+    depends_on: tuple[str, ...] = ()
+
+
+class StartupStepReport(BaseModel):
+    name: str
+    depends_on: list[str] = Field(default_factory=list)
+    status: str = "running"
+    """One of 'running', 'ok' or 'failed'."""
+    started_at: float = 0.0
+    """Seconds between the start of the startup and the start of the step."""
+    duration: float | None = None
+    """Seconds the step took, once it has finished."""
+
+
+class StartupReport(BaseModel):
+    status: str = "pending"
+    """One of 'pending', 'running', 'ok' or 'failed'."""
+    total_duration: float | None = None
+    steps: list[StartupStepReport] = Field(default_factory=list)
+    profile_path: str | None = None
+    """File holding the cProfile stats of the startup, if it was profiled."""
+
+
+_startup_report = StartupReport()
+
+
+def get_startup_report() -> StartupReport:
+    """Return the report of the last server startup of this process."""
+    return _startup_report
+
+
+def _order_steps(steps: Sequence[StartupStep]) -> list[StartupStep]:
+    """Return the steps in an order where every step comes after its dependencies."""
+    steps_by_name = {step.name: step for step in steps}
+    if len(steps_by_name) != len(steps):
+        msg = "Startup step names must be unique"
+        raise ValueError(msg)
+    ordered: list[StartupStep] = []
+    # The steps being visited, in the order they depend on each other
+    visiting: list[str] = []
+    visited: set[str] = set()
+
+    def visit(step: StartupStep) -> None:
+        if step.name in visited:
+            return
+        if step.name in visiting:
+            cycle = [*visiting[visiting.index(step.name) :], step.name]
+            msg = f"Startup steps form a dependency cycle: {' -> '.join(cycle)}"
+            raise ValueError(msg)
+        visiting.append(step.name)
+        for dependency in step.depends_on:
+            if dependency not in steps_by_name:
+                msg = f"Startup step {step.name} depends on unknown step {dependency}"
+                raise ValueError(msg)
+            visit(steps_by_name[dependency])
+        visiting.pop()
+        visited.add(step.name)
+        ordered.append(step)
+
+    for step in steps:
+        visit(step)
+    return ordered
+
+
+async def run_startup_steps(steps: Sequence[StartupStep], *, profile_path: str | None = None) -> StartupReport:
+    """Run the startup steps, each as soon as its dependencies have finished.
+
+    If a step fails, the steps still running are cancelled and the exception is raised.
+
+    Args:
+        steps (Sequence[StartupStep]): The steps to run.
+        profile_path (str | None): If set, the startup is profiled with cProfile and the stats written to this file.
+
+    Returns:
+        StartupReport: The report with the timing of every step, also returned by :func:`get_startup_report`.
+    """
+    global _startup_report  # noqa: PLW0603
+    ordered_steps = _order_steps(steps)
+    report = _startup_report = StartupReport(status="running", profile_path=profile_path)
+    loop = asyncio.get_running_loop()
+    start_time = loop.time()
+    tasks: dict[str, asyncio.Task] = {}
+
+    async def run_step(step: StartupStep) -> None:
+        if step.depends_on:
+            # A failed dependency raises here, so the step never starts
+            await asyncio.gather(*(tasks[dependency] for dependency in step.depends_on))
+        step_start_time = loop.time()
+        step_report = StartupStepReport(
+            name=step.name, depends_on=list(step.depends_on), started_at=round(step_start_time - start_time, 4)
+        )
+        report.steps.append(step_report)
+        await logger.adebug(f"Starting startup step {step.name}")
+        try:
+            await step.run()
+        except BaseException:
+            step_report.status = "failed"
+            raise
+        finally:
+            step_report.duration = round(loop.time() - step_start_time, 4)
+        step_report.status = "ok"
+        await logger.adebug(f"Startup step {step.name} finished in {step_report.duration:.2f}s")
+
+    profiler = cProfile.Profile() if profile_path else None
+    if profiler is not None:
+        profiler.enable()
+    try:
+        for step in ordered_steps:
+            tasks[step.name] = asyncio.create_task(run_step(step), name=f"startup-{step.name}")
+        await asyncio.gather(*tasks.values())
+    except BaseException:
+        for task in tasks.values():
+            task.cancel()
+        await asyncio.gather(*tasks.values(), return_exceptions=True)
+        report.status = "failed"
+        raise
+    finally:
+        report.total_duration = round(loop.time() - start_time, 4)
+        if profiler is not None:
+            profiler.disable()
+            try:
+                profiler.dump_stats(profile_path)
+            except OSError as exc:
+                report.profile_path = None
+                await logger.awarning(f"Could not write the startup profile to {profile_path}: {exc}")
+            else:
+                await logger.ainfo(f"Startup profile written to {profile_path}")
+    report.status = "ok"
+    await logger.adebug(f"Total initialization time: {report.total_duration:.2f}s")
+    return report
@@ -36,6 +36,7 @@ from langflow.initial_setup.setup import (
     load_flows_from_directory,
     sync_flows_from_fs,
 )
+from langflow.initial_setup.startup import StartupStep, run_startup_steps
 from langflow.middleware import ContentSizeLimitMiddleware
 from langflow.services.deps import (
     get_queue_service,
@@ -163,122 +164,104 @@ def get_lifespan(*, fix_migration=False, version=None):
         mcp_init_task = None
 
         try:
-            start_time = asyncio.get_event_loop().time()
-
-            await logger.adebug("Initializing services")
-            await initialize_services(fix_migration=fix_migration)
-            await logger.adebug(f"Services initialized in {asyncio.get_event_loop().time() - start_time:.2f}s")
-
-            current_time = asyncio.get_event_loop().time()
-            await logger.adebug("Setting up LLM caching")
-            setup_llm_caching()
-            await logger.adebug(f"LLM caching setup in {asyncio.get_event_loop().time() - current_time:.2f}s")
-
-            current_time = asyncio.get_event_loop().time()
-            await logger.adebug("Copying profile pictures")
-            await copy_profile_pictures()
-            await logger.adebug(f"Profile pictures copied in {asyncio.get_event_loop().time() - current_time:.2f}s")
-
-            if get_settings_service().auth_settings.AUTO_LOGIN:
-                current_time = asyncio.get_event_loop().time()
-                await logger.adebug("Initializing default super user")
-                await initialize_auto_login_default_superuser()
-                await logger.adebug(
-                    f"Default super user initialized in {asyncio.get_event_loop().time() - current_time:.2f}s"
-                )
-
-            await logger.adebug("Initializing super user")
-            await initialize_auto_login_default_superuser()
-            await logger.adebug(f"Super user initialized in {asyncio.get_event_loop().time() - current_time:.2f}s")
-
-            current_time = asyncio.get_event_loop().time()
-            await logger.adebug("Loading bundles")
-            temp_dirs, bundles_components_paths = await load_bundles_with_error_handling()
-            get_settings_service().settings.components_path.extend(bundles_components_paths)
-            await logger.adebug(f"Bundles loaded in {asyncio.get_event_loop().time() - current_time:.2f}s")
-
-            current_time = asyncio.get_event_loop().time()
-            await logger.adebug("Caching types")
-            all_types_dict = await get_and_cache_all_types_dict(get_settings_service(), telemetry_service)
-            await logger.adebug(f"Types cached in {asyncio.get_event_loop().time() - current_time:.2f}s")
-
-            # Use file-based lock to prevent multiple workers from creating duplicate starter projects concurrently.
-            # Note that it's still possible that one worker may complete this task, release the lock,
-            # then another worker pick it up, but the operation is idempotent so worst case it duplicates
-            # the initialization work.
-            current_time = asyncio.get_event_loop().time()
-            await logger.adebug("Creating/updating starter projects")
-
-            lock_file = Path(tempfile.gettempdir()) / "langflow_starter_projects.lock"
-            lock = FileLock(lock_file, timeout=1)
-            try:
-                with lock:
-                    await create_or_update_starter_projects(all_types_dict)
-                    await logger.adebug(
-                        f"Starter projects created/updated in {asyncio.get_event_loop().time() - current_time:.2f}s"
+            all_types_dict: dict = {}
+
+            async def initialize_services_step() -> None:
+                await initialize_services(fix_migration=fix_migration)
+
+            async def setup_llm_caching_step() -> None:
+                setup_llm_caching()
+
+            async def load_bundles_step() -> None:
+                nonlocal temp_dirs
+                temp_dirs, bundles_components_paths = await load_bundles_with_error_handling()
+                get_settings_service().settings.components_path.extend(bundles_components_paths)
+
+            async def cache_types_step() -> None:
+                nonlocal all_types_dict
+                all_types_dict = await get_and_cache_all_types_dict(get_settings_service(), telemetry_service)
+
+            async def create_starter_projects_step() -> None:
+                # Use file-based lock to prevent multiple workers from creating duplicate starter projects
+                # concurrently. Note that it's still possible that one worker may complete this task, release the
+                # lock, then another worker pick it up, but the operation is idempotent so worst case it duplicates
+                # the initialization work.
+                lock_file = Path(tempfile.gettempdir()) / "langflow_starter_projects.lock"
+                lock = FileLock(lock_file, timeout=1)
+                try:
+                    with lock:
+                        await create_or_update_starter_projects(all_types_dict)
+                except TimeoutError:
+                    # Another process has the lock
+                    await logger.adebug("Another worker is creating starter projects, skipping")
+                except Exception as e:  # noqa: BLE001
+                    await logger.awarning(
+                        f"Failed to acquire lock for starter projects: {e}. "
+                        "Starter projects may not be created or updated."
                     )
-            except TimeoutError:
-                # Another process has the lock
-                await logger.adebug("Another worker is creating starter projects, skipping")
-            except Exception as e:  # noqa: BLE001
-                await logger.awarning(
-                    f"Failed to acquire lock for starter projects: {e}. Starter projects may not be created or updated."
-                )
 
-            # Initialize agentic global variables early (before MCP server and flows)
-            if get_settings_service().settings.agentic_experience:
+            async def initialize_agentic_variables_step() -> None:
+                if not get_settings_service().settings.agentic_experience:
+                    return
                 from langflow.api.utils.mcp.agentic_mcp import initialize_agentic_global_variables
 
-                current_time = asyncio.get_event_loop().time()
                 await logger.ainfo("Initializing agentic global variables...")
                 try:
                     async with session_scope() as session:
                         await initialize_agentic_global_variables(session)
-                    await logger.adebug(
-                        f"Agentic global variables initialized in {asyncio.get_event_loop().time() - current_time:.2f}s"
-                    )
                 except Exception as e:  # noqa: BLE001
                     await logger.awarning(f"Failed to initialize agentic global variables: {e}")
 
-            current_time = asyncio.get_event_loop().time()
-            await logger.adebug("Starting telemetry service")
-            telemetry_service.start()
-            await logger.adebug(f"started telemetry service in {asyncio.get_event_loop().time() - current_time:.2f}s")
-
-            current_time = asyncio.get_event_loop().time()
-            await logger.adebug("Starting MCP Composer service")
-            mcp_composer_service = cast("MCPComposerService", get_service(ServiceType.MCP_COMPOSER_SERVICE))
-            await mcp_composer_service.start()
-            await logger.adebug(
-                f"started MCP Composer service in {asyncio.get_event_loop().time() - current_time:.2f}s"
-            )
+            async def start_telemetry_step() -> None:
+                telemetry_service.start()
 
-            # Auto-configure Agentic MCP server if enabled (after variables are initialized)
-            if get_settings_service().settings.agentic_experience:
+            async def start_mcp_composer_step() -> None:
+                mcp_composer_service = cast("MCPComposerService", get_service(ServiceType.MCP_COMPOSER_SERVICE))
+                await mcp_composer_service.start()
+
+            async def configure_agentic_mcp_step() -> None:
+                if not get_settings_service().settings.agentic_experience:
+                    return
                 from langflow.api.utils.mcp.agentic_mcp import auto_configure_agentic_mcp_server
 
-                current_time = asyncio.get_event_loop().time()
                 await logger.ainfo("Configuring Agentic MCP server...")
                 try:
                     async with session_scope() as session:
                         await auto_configure_agentic_mcp_server(session)
-                    await logger.adebug(
-                        f"Agentic MCP server configured in {asyncio.get_event_loop().time() - current_time:.2f}s"
-                    )
                 except Exception as e:  # noqa: BLE001
                     await logger.awarning(f"Failed to configure agentic MCP server: {e}")
 
-            current_time = asyncio.get_event_loop().time()
-            await logger.adebug("Loading flows")
-            await load_flows_from_directory()
-            sync_flows_from_fs_task = asyncio.create_task(sync_flows_from_fs())
-            queue_service = get_queue_service()
-            if not queue_service.is_started():  # Start if not already started
-                queue_service.start()
-            await logger.adebug(f"Flows loaded in {asyncio.get_event_loop().time() - current_time:.2f}s")
-
-            total_time = asyncio.get_event_loop().time() - start_time
-            await logger.adebug(f"Total initialization time: {total_time:.2f}s")
+            async def load_flows_step() -> None:
+                nonlocal sync_flows_from_fs_task
+                await load_flows_from_directory()
+                sync_flows_from_fs_task = asyncio.create_task(sync_flows_from_fs())
+                queue_service = get_queue_service()
+                if not queue_service.is_started():  # Start if not already started
+                    queue_service.start()
+
+            # Every step starts as soon as the steps it depends on have finished. Steps that write to the
+            # database after the superuser is created keep their original order, so they do not contend for it.
+            await run_startup_steps(
+                [
+                    StartupStep("services", initialize_services_step),
+                    StartupStep("llm_caching", setup_llm_caching_step, ("services",)),
+                    StartupStep("profile_pictures", copy_profile_pictures, ("services",)),
+                    StartupStep("superuser", initialize_auto_login_default_superuser, ("services",)),
+                    StartupStep("bundles", load_bundles_step, ("services",)),
+                    StartupStep("types", cache_types_step, ("bundles",)),
+                    StartupStep("starter_projects", create_starter_projects_step, ("types", "superuser")),
+                    StartupStep("agentic_variables", initialize_agentic_variables_step, ("starter_projects",)),
+                    StartupStep("telemetry", start_telemetry_step, ("services",)),
+                    StartupStep("mcp_composer", start_mcp_composer_step, ("services",)),
+                    StartupStep(
+                        "agentic_mcp",
+                        configure_agentic_mcp_step,
+                        ("agentic_variables", "mcp_composer", "starter_projects"),
+                    ),
+                    StartupStep("flows", load_flows_step, ("starter_projects", "agentic_mcp")),
+                ],
+                profile_path=get_settings_service().settings.startup_profile_path,
+            )
 
             async def delayed_init_mcp_servers():
                 await asyncio.sleep(10.0)  # Increased delay to allow starter projects to be created
@@ -1,5 +1,6 @@
 import asyncio
 import json
+from collections import defaultdict
 from collections.abc import Sequence
 from uuid import UUID
 
@@ -156,9 +157,12 @@ async def aupdate_messages(messages: Message | list[Message]) -> list[Message]:
         messages = [messages]
 
     async with session_scope() as session:
+        message_ids = [_as_uuid(message.id) for message in messages]
+        stmt = select(MessageTable).where(col(MessageTable.id).in_(message_ids))
+        stored_messages = {msg.id: msg for msg in await session.exec(stmt)}
         updated_messages: list[MessageTable] = []
-        for message in messages:
-            msg = await session.get(MessageTable, message.id)
+        for message, message_id in zip(messages, message_ids, strict=True):
+            msg = stored_messages.get(message_id)
             if msg:
                 msg = msg.sqlmodel_update(message.model_dump(exclude_unset=True, exclude_none=True))
                 # Convert flow_id to UUID if it's a string preventing error when saving to database
@@ -218,6 +222,10 @@ async def aadd_messagetables(messages: list[MessageTable], session: AsyncSession
         await logger.aexception(e)
         raise
 
+    return _to_message_reads(messages)
+
+
+def _to_message_reads(messages: list[MessageTable]) -> list[MessageRead]:
     new_messages = []
     for msg in messages:
         msg.properties = json.loads(msg.properties) if isinstance(msg.properties, str) else msg.properties  # type: ignore[arg-type]
@@ -228,6 +236,174 @@ async def aadd_messagetables(messages: list[MessageTable], session: AsyncSession
     return [MessageRead.model_validate(message, from_attributes=True) for message in new_messages]
 
 
+def _message_row_values(message: MessageTable) -> dict:
+    values = {column.name: getattr(message, column.name) for column in MessageTable.__table__.columns}
+    # JSON columns must hold the decoded value, not a JSON string or a pydantic model
+    values["properties"] = MessageTable.serialize_properties_or_content_blocks(values["properties"])
+    values["content_blocks"] = MessageTable.serialize_properties_or_content_blocks(values["content_blocks"] or [])
+    values["files"] = values["files"] or []
+    values["category"] = values["category"] or ""
+    return values
+
+
+def _upsert_statement(dialect_name: str, rows: list[dict]):
+    if dialect_name == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert
+    elif dialect_name == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert
+    else:
+        return None
+    stmt = insert(MessageTable.__table__).values(rows)
+    return stmt.on_conflict_do_update(
+        index_elements=["id"],
+        set_={name: stmt.excluded[name] for name in rows[0] if name != "id"},
+    )
+
+
+async def aupsert_messagetables(messages: list[MessageTable], session: AsyncSession) -> list[MessageRead]:
+    """Insert or update many messages with a single statement.
+
+    Rows whose id already exists are overwritten, the others are inserted. On SQLite and PostgreSQL
+    this is one ``INSERT ... ON CONFLICT DO UPDATE``; other databases fall back to ``session.merge``.
+
+    Args:
+        messages: List of MessageTable objects to write
+        session: Database session
+    """
+    if not messages:
+        return []
+    # A single upsert statement cannot touch the same row twice, so the last write of an id wins
+    rows = list({row["id"]: row for row in map(_message_row_values, messages)}.values())
+    stmt = _upsert_statement(session.get_bind().dialect.name, rows)
+    try:
+        if stmt is not None:
+            await session.exec(stmt)
+        else:
+            for message in messages:
+                await session.merge(message)
+        await session.commit()
+    except Exception as e:
+        await logger.aexception(e)
+        raise
+
+    return _to_message_reads([MessageTable.model_validate(row) for row in rows])
+
+
+class MessageWriteBuffer:
+    """Per-session buffer of messages that have not been written to the database yet.
+
+    A streamed message used to be inserted empty before the first token and updated once the
+    stream finished. Buffering it instead lets both writes collapse into the final upsert. The
+    buffer is process-local: readers see a streamed message once its stream ends, which writes
+    it whether it completes, fails or is cancelled, and receive its tokens as events until then.
+    """
+
+    def __init__(self) -> None:
+        self._pending: defaultdict[str, dict[UUID, MessageTable]] = defaultdict(dict)
+
+    def add(self, message: MessageTable) -> None:
+        self._pending[message.session_id][message.id] = message
+
+    def pop(self, message_id: UUID) -> MessageTable | None:
+        """Remove and return a pending message, or None when it is not pending."""
+        for session_id, messages in list(self._pending.items()):
+            if (message := messages.pop(message_id, None)) is not None:
+                if not messages:
+                    del self._pending[session_id]
+                return message
+        return None
+
+    def discard(self, message_id: UUID) -> bool:
+        return self.pop(message_id) is not None
+
+    def pop_session(self, session_id: str | None = None) -> list[MessageTable]:
+        """Remove and return the pending messages of a session, or of every session when not given."""
+        if session_id is None:
+            messages = [message for pending in self._pending.values() for message in pending.values()]
+            self._pending.clear()
+            return messages
+        return list(self._pending.pop(session_id, {}).values())
+
+    def discard_context(self, context_id: str) -> None:
+        """Drop the pending messages of a context."""
+        for session_id, messages in list(self._pending.items()):
+            for message_id, message in list(messages.items()):
+                if message.context_id == context_id:
+                    del messages[message_id]
+            if not messages:
+                del self._pending[session_id]
+
+    def __contains__(self, message_id: UUID) -> bool:
+        return any(message_id in messages for messages in self._pending.values())
+
+    def __len__(self) -> int:
+        return sum(len(messages) for messages in self._pending.values())
+
+
+message_write_buffer = MessageWriteBuffer()
+
+
+async def abuffer_message(message: Message, flow_id: str | UUID | None = None) -> Message:
+    """Hold a message in the write buffer and return it with its final id, without writing it.
+
+    The message is written by the next ``aupsert_messages`` call for its id, or by
+    ``aflush_messages`` once the stream that buffered it ends without completing.
+    """
+    if not message.session_id or not message.sender or not message.sender_name:
+        msg = (
+            f"All of session_id, sender, and sender_name must be provided. Session ID: {message.session_id},"
+            f" Sender: {message.sender}, Sender Name: {message.sender_name}"
+        )
+        raise ValueError(msg)
+    message_table = _message_table_from_message(message, flow_id)
+    message_write_buffer.add(message_table)
+    message_read = _to_message_reads([message_table.model_copy()])[0]
+    return await Message.create(**message_read.model_dump())
+
+
+async def aupsert_messages(messages: Message | list[Message], flow_id: str | UUID | None = None) -> list[Message]:
+    """Write messages in one statement, inserting new ids and overwriting existing ones."""
+    if not isinstance(messages, list):
+        messages = [messages]
+
+    messages_models = [_message_table_from_message(message, flow_id) for message in messages]
+    for message_table in messages_models:
+        message_write_buffer.discard(message_table.id)
+    async with session_scope() as session:
+        stored_messages = await aupsert_messagetables(messages_models, session)
+    return [await Message.create(**message.model_dump()) for message in stored_messages]
+
+
+async def aflush_messages(session_id: str | None = None, message_id: str | UUID | None = None) -> list[Message]:
+    """Write the buffered messages of a session, or of every session, in one statement.
+
+    When ``message_id`` is given, only that message is written, if it is still buffered.
+    """
+    if message_id is not None:
+        message_table = message_write_buffer.pop(_as_uuid(message_id))
+        messages_models = [message_table] if message_table is not None else []
+    else:
+        messages_models = message_write_buffer.pop_session(session_id)
+    if not messages_models:
+        return []
+    async with session_scope() as session:
+        stored_messages = await aupsert_messagetables(messages_models, session)
+    return [await Message.create(**message.model_dump()) for message in stored_messages]
+
+
+def _as_uuid(value: str | UUID) -> UUID:
+    return value if isinstance(value, UUID) else UUID(str(value))
+
+
+def _message_table_from_message(message: Message, flow_id: str | UUID | None = None) -> MessageTable:
+    message_table = MessageTable.from_message(message, flow_id=flow_id)
+    if message_id := getattr(message, "id", None):
+        message_table.id = _as_uuid(message_id)
+    message_table.error = bool(getattr(message, "error", False))
+    message_table.edit = bool(getattr(message, "edit", False))
+    return message_table
+
+
 def delete_messages(session_id: str | None = None, context_id: str | None = None) -> None:
     """DEPRECATED - Delete messages from the monitor service based on the provided session ID.
 
@@ -251,6 +427,11 @@ async def adelete_messages(session_id: str | None = None, context_id: str | None
         if not session_id and not context_id:
             msg = "Either session_id or context_id must be provided to delete messages."
             raise ValueError(msg)
+        # Buffered messages would otherwise be written back after the delete
+        if context_id:
+            message_write_buffer.discard_context(context_id)
+        else:
+            message_write_buffer.pop_session(str(session_id))
 
         # Determine which field to filter by
         filter_column = MessageTable.context_id if context_id else MessageTable.session_id
@@ -270,6 +451,7 @@ async def delete_message(id_: str) -> None:
     Args:
         id_ (str): The ID of the message to delete.
     """
+    message_write_buffer.discard(_as_uuid(id_))
     async with session_scope() as session:
         message = await session.get(MessageTable, id_)
         if message:
@@ -325,6 +507,9 @@ async def astore_message(
             f" Sender: {message.sender}, Sender Name: {message.sender_name}"
         )
         raise ValueError(msg)
+    if hasattr(message, "id") and message.id and _as_uuid(message.id) in message_write_buffer:
+        # The message was buffered while streaming, so this is its first write
+        return await aupsert_messages([message], flow_id=flow_id)
     if hasattr(message, "id") and message.id:
         # if message has an id and exist in the database, update it
         # if not raise an error and add the message to the database
@@ -0,0 +1,130 @@
+"""Cache of prepared graph templates for the run API.
+
+Building a graph from a flow payload flattens groups, builds every vertex and edge, validates the
+edge handles and instantiates the components. For a given flow version and set of tweaks that work
+is always the same, so the run API builds the graph once, keeps it as a template and hands each
+request a cheap ``Graph.clone`` of it.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any
+
+import orjson
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from datetime import datetime
+
+    from lfx.graph.graph.base import Graph
+
+GraphTemplateKey = tuple[str, str, str, str]
+
+DEFAULT_GRAPH_TEMPLATE_CACHE_SIZE = 128
+
+
+def fingerprint_tweaks(tweaks: dict[str, Any] | None, *, stream: bool = False) -> str:
+    """Return a stable hash of the tweaks applied to a flow payload."""
+    payload = {"tweaks": tweaks or {}, "stream": stream}
+    return hashlib.sha256(orjson.dumps(payload, option=orjson.OPT_SORT_KEYS, default=str)).hexdigest()
+
+
+class GraphTemplateCache:
+    """Bounded LRU cache of prepared graph templates.
+
+    Templates are keyed by ``(flow_id, updated_at, user_id, tweak fingerprint)``, so saving a flow
+    naturally stops old templates from being used. ``invalidate`` drops every template of a flow
+    so that they do not linger until they are evicted.
+
+    Attributes:
+        max_size (int): Maximum number of templates to keep. ``0`` disables the cache.
+        hits (int): Number of requests served from a cached template.
+        misses (int): Number of requests that had to build a template.
+    """
+
+    def __init__(self, max_size: int = DEFAULT_GRAPH_TEMPLATE_CACHE_SIZE) -> None:
+        self._templates: OrderedDict[GraphTemplateKey, Graph] = OrderedDict()
+        self._lock = threading.RLock()
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(
+        flow_id: str,
+        updated_at: datetime | str | None,
+        user_id: str | None,
+        tweaks_fingerprint: str,
+    ) -> GraphTemplateKey:
+        updated_at_str = updated_at.isoformat() if hasattr(updated_at, "isoformat") else str(updated_at)
+        return (str(flow_id), updated_at_str, str(user_id), tweaks_fingerprint)
+
+    def get_graph(
+        self,
+        key: GraphTemplateKey,
+        build_template: Callable[[], Graph],
+        *,
+        user_id: str | None = None,
+        context: dict[str, Any] | None = None,
+    ) -> Graph:
+        """Return a fresh graph for ``key``, building and caching the template on a miss."""
+        if not self.max_size:
+            graph = build_template()
+            if context:
+                graph.context = context
+            return graph
+
+        with self._lock:
+            template = self._templates.get(key)
+            if template is not None:
+                self._templates.move_to_end(key)
+                self.hits += 1
+            else:
+                self.misses += 1
+
+        if template is None:
+            template = build_template()
+            with self._lock:
+                self._templates[key] = template
+                self._templates.move_to_end(key)
+                while len(self._templates) > self.max_size:
+                    self._templates.popitem(last=False)
+
+        return template.clone(user_id=user_id, context=context)
+
+    def invalidate(self, flow_id: str) -> int:
+        """Drop every template built for ``flow_id``.
+
+        Returns:
+            int: The number of templates removed.
+        """
+        flow_id = str(flow_id)
+        with self._lock:
+            keys = [key for key in self._templates if key[0] == flow_id]
+            for key in keys:
+                del self._templates[key]
+        return len(keys)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._templates.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {"size": len(self._templates), "max_size": self.max_size, "hits": self.hits, "misses": self.misses}
+
+    def __len__(self) -> int:
+        return len(self._templates)
+
+
+graph_template_cache = GraphTemplateCache()
+
+
+def invalidate_graph_templates(flow_id: str) -> int:
+    """Invalidate the cached graph templates of a flow after it has been saved or deleted."""
+    return graph_template_cache.invalidate(flow_id)
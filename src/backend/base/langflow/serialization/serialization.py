@@ -1,4 +1,4 @@
-from collections.abc import AsyncIterator, Generator, Iterator
+from collections.abc import AsyncIterator, Callable, Generator, Iterator
 from datetime import datetime, timezone
 from decimal import Decimal
 from functools import lru_cache
@@ -117,13 +117,6 @@ def _serialize_list_tuple(obj: list | tuple, max_length: int | None, max_items:
     return [serialize(item, max_length, max_items) for item in obj]
 
 
-def _serialize_primitive(obj: Any, *_) -> Any:
-    """Handle primitive types without conversion."""
-    if obj is None or isinstance(obj, int | float | bool | complex):
-        return obj
-    return UNSERIALIZABLE_SENTINEL
-
-
 def _serialize_instance(obj: Any, *_) -> str:
     """Handle regular class instances by converting to string."""
     return str(obj)
@@ -138,14 +131,39 @@ def _truncate_value(value: Any, max_length: int | None, max_items: int | None) -
     return value
 
 
+def _serialize_column(column: pd.Series, max_length: int | None, max_items: int | None) -> list:
+    """Serialize the values of a DataFrame column, in bulk when its dtype allows it."""
+    # Nullable extension columns (Int64, boolean, string, ...) mark missing values with pd.NA,
+    # which serializes as None like it does in records
+    if getattr(column.dtype, "na_value", None) is pd.NA:
+        column = column.astype(object).where(column.notna(), None)
+    # Numeric and boolean numpy columns convert to native Python values in a single call
+    if isinstance(column.dtype, np.dtype) and column.dtype.kind in "iufcb":
+        return column.tolist()
+    # Columns holding only strings are truncated vectorially
+    if pd.api.types.infer_dtype(column, skipna=False) == "string":
+        if max_length is not None:
+            too_long = column.str.len() > max_length
+            if too_long.any():
+                column = column.where(~too_long, column.str.slice(0, max_length) + "...")
+        return column.tolist()
+    return [serialize(value, max_length, max_items) for value in column.tolist()]
+
+
 def _serialize_dataframe(obj: pd.DataFrame, max_length: int | None, max_items: int | None) -> list[dict]:
-    """Serialize pandas DataFrame to a dictionary format."""
+    """Serialize pandas DataFrame to a list of records.
+
+    Values are serialized one column at a time, so only columns of mixed or object values go
+    through ``serialize`` cell by cell.
+    """
     if max_items is not None and len(obj) > max_items:
         obj = obj.head(max_items)
 
-    data = obj.to_dict(orient="records")
-
-    return serialize(data, max_length, max_items)
+    names = list(obj.columns)
+    if not names:
+        return [{} for _ in range(len(obj))]
+    columns = [_serialize_column(column, max_length, max_items) for _, column in obj.items()]
+    return [dict(zip(names, row, strict=True)) for row in zip(*columns, strict=True)]
 
 
 def _serialize_series(obj: pd.Series, max_length: int | None, max_items: int | None) -> dict:
@@ -155,11 +173,6 @@ def _serialize_series(obj: pd.Series, max_length: int | None, max_items: int | N
     return {index: _truncate_value(value, max_length, max_items) for index, value in obj.items()}
 
 
-def _is_numpy_type(obj: Any) -> bool:
-    """Check if an object is a numpy type by checking its type's module name."""
-    return hasattr(type(obj), "__module__") and type(obj).__module__ == np.__name__
-
-
 def _serialize_numpy_type(obj: Any, max_length: int | None, max_items: int | None) -> Any:
     """Serialize numpy types."""
     try:
@@ -186,46 +199,9 @@ def _serialize_numpy_type(obj: Any, max_length: int | None, max_items: int | Non
     return UNSERIALIZABLE_SENTINEL
 
 
-def _serialize_dispatcher(obj: Any, max_length: int | None, max_items: int | None) -> Any | _UnserializableSentinel:
-    """Dispatch object to appropriate serializer."""
-    # Handle primitive types first
-    if obj is None:
-        return obj
-    primitive = _serialize_primitive(obj, max_length, max_items)
-    if primitive is not UNSERIALIZABLE_SENTINEL:
-        return primitive
-
+def _serialize_class_object(obj: Any, *_) -> Any:
+    """Handle objects whose type is a metaclass, such as classes and enum classes."""
     match obj:
-        case str():
-            return _serialize_str(obj, max_length, max_items)
-        case bytes():
-            return _serialize_bytes(obj, max_length, max_items)
-        case datetime():
-            return _serialize_datetime(obj, max_length, max_items)
-        case Decimal():
-            return _serialize_decimal(obj, max_length, max_items)
-        case UUID():
-            return _serialize_uuid(obj, max_length, max_items)
-        case Document():
-            return _serialize_document(obj, max_length, max_items)
-        case AsyncIterator() | Generator() | Iterator():
-            return _serialize_iterator(obj, max_length, max_items)
-        case BaseModel():
-            return _serialize_pydantic(obj, max_length, max_items)
-        case BaseModelV1():
-            return _serialize_pydantic_v1(obj, max_length, max_items)
-        case dict():
-            return _serialize_dict(obj, max_length, max_items)
-        case pd.DataFrame():
-            return _serialize_dataframe(obj, max_length, max_items)
-        case pd.Series():
-            return _serialize_series(obj, max_length, max_items)
-        case list() | tuple():
-            return _serialize_list_tuple(obj, max_length, max_items)
-        case object() if _is_numpy_type(obj):
-            return _serialize_numpy_type(obj, max_length, max_items)
-        case object() if not isinstance(obj, type):  # Match any instance that's not a class
-            return _serialize_instance(obj, max_length, max_items)
         case object() if hasattr(obj, "_name_"):  # Enum case
             return f"{obj.__class__.__name__}.{obj._name_}"
         case object() if hasattr(obj, "__name__") and hasattr(obj, "__bound__"):  # TypeVar case
@@ -250,6 +226,65 @@ def _serialize_dispatcher(obj: Any, max_length: int | None, max_items: int | Non
             return UNSERIALIZABLE_SENTINEL
 
 
+def _serialize_unchanged(obj: Any, *_) -> Any:
+    """Return primitive values as they are."""
+    return obj
+
+
+# Serializers in order of precedence. The first entry whose types the object's type subclasses is used.
+_SERIALIZERS_BY_BASE_TYPE: tuple[tuple[type | tuple[type, ...], Callable[[Any, int | None, int | None], Any]], ...] = (
+    ((int, float, bool, complex), _serialize_unchanged),
+    (str, _serialize_str),
+    (bytes, _serialize_bytes),
+    (datetime, _serialize_datetime),
+    (Decimal, _serialize_decimal),
+    (UUID, _serialize_uuid),
+    (Document, _serialize_document),
+    ((AsyncIterator, Generator, Iterator), _serialize_iterator),
+    (BaseModel, _serialize_pydantic),
+    (BaseModelV1, _serialize_pydantic_v1),
+    (dict, _serialize_dict),
+    (pd.DataFrame, _serialize_dataframe),
+    (pd.Series, _serialize_series),
+    ((list, tuple), _serialize_list_tuple),
+)
+
+# Serializer resolved for each concrete type seen so far. It is cleared when it grows past
+# _MAX_CACHED_TYPES so that classes created at runtime are not kept alive forever.
+_MAX_CACHED_TYPES = 1024
+_serializers_by_type: dict[type, Callable[[Any, int | None, int | None], Any]] = {}
+
+
+def _resolve_serializer(obj_type: type) -> Callable[[Any, int | None, int | None], Any]:
+    """Find the serializer for instances of a type, walking its bases once."""
+    for base_types, serializer in _SERIALIZERS_BY_BASE_TYPE:
+        if issubclass(obj_type, base_types):
+            return serializer
+    if getattr(obj_type, "__module__", None) == np.__name__:
+        return _serialize_numpy_type
+    if issubclass(obj_type, type):
+        return _serialize_class_object
+    return _serialize_instance
+
+
+def _serialize_dispatcher(obj: Any, max_length: int | None, max_items: int | None) -> Any | _UnserializableSentinel:
+    """Dispatch object to appropriate serializer.
+
+    The serializer for each concrete type is resolved once and cached, so dispatching a value is a
+    single dictionary lookup.
+    """
+    if obj is None:
+        return obj
+    obj_type = type(obj)
+    serializer = _serializers_by_type.get(obj_type)
+    if serializer is None:
+        serializer = _resolve_serializer(obj_type)
+        if len(_serializers_by_type) >= _MAX_CACHED_TYPES:
+            _serializers_by_type.clear()
+        _serializers_by_type[obj_type] = serializer
+    return serializer(obj, max_length, max_items)
+
+
 def serialize(
     obj: Any,
     max_length: int | None = None,
@@ -0,0 +1,20 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from typing_extensions import override
+
+from langflow.services.api_key.service import ApiKeyService
+from langflow.services.factory import ServiceFactory
+
+if TYPE_CHECKING:
+    from lfx.services.settings.service import SettingsService
+
+
+class ApiKeyServiceFactory(ServiceFactory):
+    def __init__(self) -> None:
+        super().__init__(ApiKeyService)
+
+    @override
+    def create(self, settings_service: SettingsService):
+        return ApiKeyService(settings_service)
@@ -0,0 +1,154 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import hashlib
+import time
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Any
+
+from lfx.log.logger import logger
+
+from langflow.services.base import Service
+from langflow.services.database.models.api_key.crud import add_api_key_uses
+from langflow.services.database.utils import run_after_commit
+from langflow.services.deps import session_scope
+
+if TYPE_CHECKING:
+    from uuid import UUID
+
+    from lfx.services.settings.service import SettingsService
+    from sqlmodel.ext.asyncio.session import AsyncSession
+
+
+class ApiKeyService(Service):
+    """Caches validated API keys and aggregates their usage counters.
+
+    A validated key is remembered for ``api_key_cache_ttl`` seconds together with a snapshot of its user, so
+    repeated requests with the same key skip the database lookup. Uses are counted in memory and written in
+    one batched UPDATE every ``api_key_usage_flush_interval`` seconds instead of updating the key's row on
+    every request.
+    """
+
+    name = "api_key_service"
+
+    def __init__(self, settings_service: SettingsService):
+        super().__init__()
+        self.settings_service = settings_service
+        settings = settings_service.settings
+        self.cache_ttl = settings.api_key_cache_ttl
+        self.cache_max_size = settings.api_key_cache_max_size
+        self.flush_interval = settings.api_key_usage_flush_interval
+        # Keyed by the SHA-256 of the API key, so the keys themselves are not kept in memory
+        self._cache: OrderedDict[str, tuple[float, UUID, UUID, dict[str, Any]]] = OrderedDict()
+        self._pending_uses: dict[UUID, tuple[int, datetime]] = {}
+        self._flush_lock = asyncio.Lock()
+        self._flush_event = asyncio.Event()
+        self._worker_task: asyncio.Task | None = None
+        self._stopping = False
+
+    @staticmethod
+    def _hash_key(api_key: str) -> str:
+        return hashlib.sha256(api_key.encode()).hexdigest()
+
+    def get_cached_key(self, api_key: str) -> tuple[UUID, dict[str, Any]] | None:
+        """Return the id of a cached key and the column values of its user, or None if it is not cached."""
+        key_hash = self._hash_key(api_key)
+        entry = self._cache.get(key_hash)
+        if entry is None:
+            return None
+        expires_at, api_key_id, _, user_data = entry
+        if expires_at <= time.monotonic():
+            del self._cache[key_hash]
+            return None
+        self._cache.move_to_end(key_hash)
+        return api_key_id, user_data
+
+    def cache_key(self, api_key: str, api_key_id: UUID, user_id: UUID, user_data: dict[str, Any]) -> None:
+        """Remember a validated key, evicting the least recently used keys beyond ``api_key_cache_max_size``."""
+        if self.cache_ttl <= 0:
+            return
+        key_hash = self._hash_key(api_key)
+        self._cache[key_hash] = (time.monotonic() + self.cache_ttl, api_key_id, user_id, user_data)
+        self._cache.move_to_end(key_hash)
+        while len(self._cache) > self.cache_max_size:
+            self._cache.popitem(last=False)
+
+    def invalidate_key(self, api_key_id: UUID | str, *, session: AsyncSession | None = None) -> None:
+        """Drop a deleted key from the cache.
+
+        When the key is deleted in ``session``, it is dropped again once the session commits, since a
+        request authenticated before the commit can cache the key again.
+        """
+        api_key_id_str = str(api_key_id)
+        for key_hash in [key_hash for key_hash, entry in self._cache.items() if str(entry[1]) == api_key_id_str]:
+            del self._cache[key_hash]
+        if session is not None:
+            run_after_commit(session, lambda: self.invalidate_key(api_key_id))
+
+    def invalidate_user(self, user_id: UUID | str, *, session: AsyncSession | None = None) -> None:
+        """Drop the cached keys of a user that was changed or deleted.
+
+        When the user is changed in ``session``, the keys are dropped again once the session commits.
+        """
+        user_id_str = str(user_id)
+        for key_hash in [key_hash for key_hash, entry in self._cache.items() if str(entry[2]) == user_id_str]:
+            del self._cache[key_hash]
+        if session is not None:
+            run_after_commit(session, lambda: self.invalidate_user(user_id))
+
+    async def record_use(self, api_key_id: UUID) -> None:
+        """Count a use of a key, to be written to the database with the next flush."""
+        uses, _ = self._pending_uses.get(api_key_id, (0, None))
+        self._pending_uses[api_key_id] = (uses + 1, datetime.now(timezone.utc))
+        if self._stopping or self.flush_interval <= 0:
+            await self.flush()
+            return
+        self._ensure_worker()
+
+    async def flush(self) -> None:
+        """Write the counted uses of every key to the database."""
+        async with self._flush_lock:
+            if not self._pending_uses:
+                return
+            pending, self._pending_uses = self._pending_uses, {}
+            try:
+                async with session_scope() as session:
+                    await add_api_key_uses(session, pending)
+            except Exception as exc:  # noqa: BLE001
+                await logger.awarning(f"Error updating the usage of {len(pending)} API keys: {exc!s}")
+
+    def _ensure_worker(self) -> None:
+        loop = asyncio.get_running_loop()
+        if self._worker_task is None or self._worker_task.done() or self._worker_task.get_loop() is not loop:
+            self._flush_event = asyncio.Event()
+            self._worker_task = asyncio.create_task(self._run())
+
+    async def _run(self) -> None:
+        while not self._stopping:
+            with contextlib.suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(self._flush_event.wait(), timeout=self.flush_interval)
+            self._flush_event.clear()
+            await self.flush()
+
+    async def stop(self) -> None:
+        """Stop the worker and write the remaining usage counters."""
+        self._stopping = True
+        try:
+            worker_task, self._worker_task = self._worker_task, None
+            if worker_task is not None and not worker_task.done():
+                if worker_task.get_loop() is asyncio.get_running_loop():
+                    self._flush_event.set()
+                    await worker_task
+                else:
+                    worker_task.cancel()
+            await self.flush()
+        except Exception:  # noqa: BLE001
+            await logger.aexception("Error stopping API key service")
+        finally:
+            self._stopping = False
+            self._cache.clear()
+
+    async def teardown(self) -> None:
+        await self.stop()
@@ -1,4 +1,5 @@
 from langflow.services.cache.service import AsyncInMemoryCache, CacheService, RedisCache, ThreadingInMemoryCache
+from langflow.services.cache.tiered import TieredCache
 
 from . import factory, service
 
@@ -7,6 +8,7 @@ __all__ = [
     "CacheService",
     "RedisCache",
     "ThreadingInMemoryCache",
+    "TieredCache",
     "factory",
     "service",
 ]
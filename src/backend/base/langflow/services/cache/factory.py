@@ -7,6 +7,7 @@ from typing_extensions import override
 
 from langflow.services.cache.disk import AsyncDiskCache
 from langflow.services.cache.service import AsyncInMemoryCache, CacheService, RedisCache, ThreadingInMemoryCache
+from langflow.services.cache.tiered import TieredCache
 from langflow.services.factory import ServiceFactory
 
 if TYPE_CHECKING:
@@ -22,6 +23,18 @@ class CacheServiceFactory(ServiceFactory):
         # Here you would have logic to create and configure a CacheService
         # based on the settings_service
 
+        cache_service = self._create_backend(settings_service)
+        if settings_service.settings.cache_local_tier and isinstance(cache_service, RedisCache | AsyncDiskCache):
+            logger.debug(f"Adding an in-process cache tier in front of {cache_service!r}")
+            return TieredCache(
+                cache_service,
+                max_size=settings_service.settings.cache_local_tier_max_size,
+                expiration_time=settings_service.settings.cache_local_tier_expire,
+            )
+        return cache_service
+
+    @staticmethod
+    def _create_backend(settings_service: SettingsService):
         if settings_service.settings.cache_type == "redis":
             logger.debug("Creating Redis cache")
             return RedisCache(
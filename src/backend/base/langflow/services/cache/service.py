@@ -3,6 +3,7 @@ import pickle
 import threading
 import time
 from collections import OrderedDict
+from collections.abc import AsyncIterator
 from typing import Generic, Union
 
 import dill
@@ -175,10 +176,18 @@ class ThreadingInMemoryCache(CacheService, Generic[LockType]):
         return f"InMemoryCache(max_size={self.max_size}, expiration_time={self.expiration_time})"
 
 
+# Hash field holding the values that are not stored one dictionary key per field
+REDIS_VALUE_FIELD = "__value__"
+# Channel on which TieredCache instances announce the keys they write
+REDIS_INVALIDATION_CHANNEL = "langflow:cache:invalidate"
+
+
 class RedisCache(ExternalAsyncBaseCacheService, Generic[LockType]):
     """A Redis-based cache implementation.
 
-    This cache supports setting an expiration time for cached items.
+    This cache supports setting an expiration time for cached items. Every item is stored as a
+    Redis hash: dictionaries with string keys get one field per key, so ``upsert`` can update them
+    without a read-modify-write round trip, and any other value is stored in a single field.
 
     Attributes:
         expiration_time (int, optional): Time in seconds after which a cached item expires. Default is 1 hour.
@@ -232,44 +241,91 @@ class RedisCache(ExternalAsyncBaseCacheService, Generic[LockType]):
             return False
         return True
 
+    @staticmethod
+    def _is_hash_value(value) -> bool:
+        """Whether the value is stored with one hash field per top-level key."""
+        return (
+            isinstance(value, dict)
+            and bool(value)
+            and all(isinstance(field, str) for field in value)
+            and REDIS_VALUE_FIELD not in value
+        )
+
+    def _dump_fields(self, value) -> dict[str, bytes]:
+        try:
+            if self._is_hash_value(value):
+                return {field: dill.dumps(field_value, recurse=True) for field, field_value in value.items()}
+            return {REDIS_VALUE_FIELD: dill.dumps(value, recurse=True)}
+        except pickle.PicklingError as exc:
+            msg = "RedisCache only accepts values that can be pickled. "
+            raise TypeError(msg) from exc
+
     @override
     async def get(self, key, lock=None):
+        from redis.exceptions import ResponseError
+
         if key is None:
             return CACHE_MISS
-        value = await self._client.get(str(key))
-        return dill.loads(value) if value else CACHE_MISS
+        try:
+            fields = await self._client.hgetall(str(key))
+        except ResponseError:
+            # Values written before the hash layout are stored as plain strings
+            value = await self._client.get(str(key))
+            return dill.loads(value) if value else CACHE_MISS
+        if not fields:
+            return CACHE_MISS
+        if (value := fields.get(REDIS_VALUE_FIELD.encode())) is not None:
+            return dill.loads(value)
+        return {field.decode(): dill.loads(field_value) for field, field_value in fields.items()}
 
     @override
     async def set(self, key, value, lock=None) -> None:
-        try:
-            if pickled := dill.dumps(value, recurse=True):
-                result = await self._client.setex(str(key), self.expiration_time, pickled)
-                if not result:
-                    msg = "RedisCache could not set the value."
-                    raise ValueError(msg)
-        except pickle.PicklingError as exc:
-            msg = "RedisCache only accepts values that can be pickled. "
-            raise TypeError(msg) from exc
+        fields = self._dump_fields(value)
+        async with self._client.pipeline(transaction=True) as pipe:
+            pipe.delete(str(key))
+            pipe.hset(str(key), mapping=fields)
+            pipe.expire(str(key), self.expiration_time)
+            result = await pipe.execute()
+        if not result[-1]:
+            msg = "RedisCache could not set the value."
+            raise ValueError(msg)
 
     @override
     async def upsert(self, key, value, lock=None) -> None:
         """Inserts or updates a value in the cache.
 
-        If the existing value and the new value are both dictionaries, they are merged.
+        If the new value is a dictionary, its keys are written to the hash fields of the existing
+        value in a single transaction, without reading the existing value back.
 
         Args:
             key: The key of the item.
             value: The value to insert or update.
             lock: A lock to use for the operation.
         """
+        from redis.exceptions import ResponseError
+
         if key is None:
             return
-        existing_value = await self.get(key)
-        if existing_value is not None and isinstance(existing_value, dict) and isinstance(value, dict):
-            existing_value.update(value)
-            value = existing_value
+        if isinstance(value, dict) and not value:
+            # Merging no fields keeps the existing value, only its expiration is refreshed
+            if not await self._client.expire(str(key), self.expiration_time):
+                await self.set(key, value)
+            return
+        if not self._is_hash_value(value):
+            await self.set(key, value)
+            return
 
-        await self.set(key, value)
+        fields = self._dump_fields(value)
+        try:
+            async with self._client.pipeline(transaction=True) as pipe:
+                # A value that is not a dictionary is replaced by the new fields
+                pipe.hdel(str(key), REDIS_VALUE_FIELD)
+                pipe.hset(str(key), mapping=fields)
+                pipe.expire(str(key), self.expiration_time)
+                await pipe.execute()
+        except ResponseError:
+            # The key holds a value written before the hash layout
+            await self.set(key, value)
 
     @override
     async def delete(self, key, lock=None) -> None:
@@ -286,6 +342,19 @@ class RedisCache(ExternalAsyncBaseCacheService, Generic[LockType]):
             return False
         return bool(await self._client.exists(str(key)))
 
+    async def publish_invalidation(self, message: str) -> None:
+        """Publish a message on the channel used to invalidate the local tiers of other workers."""
+        await self._client.publish(REDIS_INVALIDATION_CHANNEL, message)
+
+    async def listen_for_invalidations(self) -> AsyncIterator[str]:
+        """Yield the messages published with ``publish_invalidation``."""
+        async with self._client.pubsub(ignore_subscribe_messages=True) as pubsub:
+            await pubsub.subscribe(REDIS_INVALIDATION_CHANNEL)
+            async for message in pubsub.listen():
+                if message.get("type") == "message":
+                    data = message["data"]
+                    yield data.decode() if isinstance(data, bytes) else str(data)
+
     def __repr__(self) -> str:
         """Return a string representation of the RedisCache instance."""
         return f"RedisCache(expiration_time={self.expiration_time})"
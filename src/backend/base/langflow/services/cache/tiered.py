@@ -0,0 +1,153 @@
+import asyncio
+import contextlib
+import time
+import uuid
+from collections import OrderedDict
+from typing import Generic
+
+from lfx.log.logger import logger
+from lfx.services.cache.utils import CACHE_MISS
+
+from langflow.services.cache.base import AsyncBaseCacheService, AsyncLockType
+from langflow.services.cache.service import RedisCache
+
+# Message published to invalidate every key of the local tiers
+INVALIDATE_ALL = "*"
+
+
+class TieredCache(AsyncBaseCacheService, Generic[AsyncLockType]):
+    """An in-process LRU cache in front of a shared cache backend.
+
+    Hot items are served from a bounded local tier without going to the backend. Misses fall
+    through to the backend and are kept locally. Every write goes to the backend first and then
+    updates the local tier. Like ``AsyncInMemoryCache``, the local tier keeps the values
+    themselves, so hits cost no deserialization; values read from it are shared with the writer
+    and the other readers and must not be mutated.
+
+    When the backend is a ``RedisCache``, writes publish the key on a Redis channel and every
+    worker drops its local copy when it receives it, so the local tiers stay coherent. Local
+    items also expire after ``expiration_time`` seconds, which bounds how long a worker can
+    serve a stale item from a backend without pub/sub.
+
+    Attributes:
+        backend (AsyncBaseCacheService): The shared cache backend.
+        max_size (int): Maximum number of items kept in the local tier.
+        expiration_time (float): Time in seconds after which a local item is read from the backend again.
+    """
+
+    def __init__(self, backend: AsyncBaseCacheService, max_size: int = 1024, expiration_time: float = 30) -> None:
+        self.backend = backend
+        self.max_size = max_size
+        self.expiration_time = expiration_time
+        self.lock = asyncio.Lock()
+        self._local: OrderedDict = OrderedDict()
+        self._instance_id = uuid.uuid4().hex
+        self._listener_task: asyncio.Task | None = None
+
+    async def get(self, key, lock: asyncio.Lock | None = None):
+        self._ensure_listener()
+        local_key = str(key)
+        item = self._local.get(local_key)
+        if item is not None:
+            if time.monotonic() - item["time"] < self.expiration_time:
+                self._local.move_to_end(local_key)
+                return item["value"]
+            self._local.pop(local_key, None)
+
+        value = await self.backend.get(key, lock=lock)
+        if value is not CACHE_MISS:
+            self._set_local(key, value)
+        return value
+
+    async def set(self, key, value, lock: asyncio.Lock | None = None) -> None:
+        self._ensure_listener()
+        await self.backend.set(key, value, lock=lock)
+        self._set_local(key, value)
+        await self._publish_invalidation(key)
+
+    async def upsert(self, key, value, lock: asyncio.Lock | None = None) -> None:
+        self._ensure_listener()
+        await self.backend.upsert(key, value, lock=lock)
+        item = self._local.get(str(key))
+        existing_value = item["value"] if item is not None else None
+        if isinstance(existing_value, dict) and isinstance(value, dict):
+            self._set_local(key, {**existing_value, **value})
+        else:
+            # The merged value is only known to the backend
+            self._local.pop(str(key), None)
+        await self._publish_invalidation(key)
+
+    async def delete(self, key, lock: asyncio.Lock | None = None) -> None:
+        self._ensure_listener()
+        await self.backend.delete(key, lock=lock)
+        self._local.pop(str(key), None)
+        await self._publish_invalidation(key)
+
+    async def clear(self, lock: asyncio.Lock | None = None) -> None:
+        self._ensure_listener()
+        await self.backend.clear(lock=lock)
+        self._local.clear()
+        await self._publish_invalidation(INVALIDATE_ALL)
+
+    async def contains(self, key) -> bool:
+        item = self._local.get(str(key))
+        if item is not None and time.monotonic() - item["time"] < self.expiration_time:
+            return True
+        return await self.backend.contains(key)
+
+    def invalidate_local(self, key) -> None:
+        """Drop a key, or every key for ``INVALIDATE_ALL``, from the local tier only.
+
+        Local items are stored under ``str(key)``, which is also the form invalidation messages
+        carry, so keys of any type are dropped on every worker.
+        """
+        if key == INVALIDATE_ALL:
+            self._local.clear()
+        else:
+            self._local.pop(str(key), None)
+
+    def _set_local(self, key, value) -> None:
+        local_key = str(key)
+        self._local[local_key] = {"value": value, "time": time.monotonic()}
+        self._local.move_to_end(local_key)
+        while len(self._local) > self.max_size:
+            self._local.popitem(last=False)
+
+    def _ensure_listener(self) -> None:
+        if not isinstance(self.backend, RedisCache):
+            return
+        if self._listener_task is None or self._listener_task.done():
+            self._listener_task = asyncio.create_task(self._listen_for_invalidations())
+
+    async def _publish_invalidation(self, key) -> None:
+        if isinstance(self.backend, RedisCache):
+            await self.backend.publish_invalidation(f"{self._instance_id}:{key}")
+
+    async def _listen_for_invalidations(self) -> None:
+        try:
+            async for message in self.backend.listen_for_invalidations():
+                instance_id, _, key = message.partition(":")
+                if instance_id != self._instance_id:
+                    self.invalidate_local(key)
+        except asyncio.CancelledError:
+            raise
+        except Exception:  # noqa: BLE001
+            # Without invalidations the local tier could serve stale items until they expire
+            await logger.aexception("Cache invalidation listener stopped, clearing the local cache tier")
+            self._local.clear()
+
+    async def teardown(self) -> None:
+        if self._listener_task is not None:
+            self._listener_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._listener_task
+            self._listener_task = None
+        self._local.clear()
+        await self.backend.teardown()
+
+    def __repr__(self) -> str:
+        """Return a string representation of the TieredCache instance."""
+        return (
+            f"TieredCache(backend={self.backend!r}, max_size={self.max_size}, "
+            f"expiration_time={self.expiration_time})"
+        )
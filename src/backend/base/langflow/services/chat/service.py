@@ -1,12 +1,21 @@
 import asyncio
-from collections import defaultdict
+from collections import OrderedDict, defaultdict
 from threading import RLock
 from typing import Any
 
+from lfx.graph import Graph
+from lfx.log.logger import logger
+from lfx.services.cache.utils import CACHE_MISS
+
 from langflow.services.base import Service
-from langflow.services.cache.base import AsyncBaseCacheService, CacheService
+from langflow.services.cache.base import AsyncBaseCacheService, CacheService, ExternalAsyncBaseCacheService
+from langflow.services.cache.disk import AsyncDiskCache
+from langflow.services.cache.tiered import TieredCache
 from langflow.services.deps import get_cache_service
 
+# Number of unbuilt graphs kept to rebuild cached graphs from their run-state snapshot
+MAX_GRAPH_TEMPLATES = 32
+
 
 class ChatService(Service):
     """Service class for managing chat-related operations."""
@@ -17,6 +26,14 @@ class ChatService(Service):
         self.async_cache_locks: dict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
         self._sync_cache_locks: dict[str, RLock] = defaultdict(RLock)
         self.cache_service: CacheService | AsyncBaseCacheService = get_cache_service()
+        # Caches that serialize their values store a compact run-state snapshot of graphs
+        # instead of pickling the whole graph with its vertices and components
+        self.stores_graph_snapshots = isinstance(
+            self.cache_service, ExternalAsyncBaseCacheService | AsyncDiskCache | TieredCache
+        )
+        self._graph_templates: OrderedDict[str, Graph] = OrderedDict()
+        # Payloads of the graphs cached by this process, as snapshots only hold their fingerprint
+        self._graph_payloads: OrderedDict[str, dict[str, Any]] = OrderedDict()
 
     async def set_cache(self, key: str, data: Any, lock: asyncio.Lock | None = None) -> bool:
         """Set the cache for a client.
@@ -33,6 +50,12 @@ class ChatService(Service):
             "result": data,
             "type": type(data),
         }
+        if self.stores_graph_snapshots:
+            is_snapshot = isinstance(data, Graph) and bool(data.raw_graph_data.get("nodes"))
+            if is_snapshot:
+                result_dict["result"] = data.get_run_state()
+                self._remember_graph_payload(key, data)
+            result_dict["run_state"] = is_snapshot
         if isinstance(self.cache_service, AsyncBaseCacheService):
             await self.cache_service.upsert(str(key), result_dict, lock=lock or self.async_cache_locks[key])
             return await self.cache_service.contains(key)
@@ -52,8 +75,58 @@ class ChatService(Service):
             Any: The cached data.
         """
         if isinstance(self.cache_service, AsyncBaseCacheService):
-            return await self.cache_service.get(key, lock=lock or self.async_cache_locks[key])
-        return await asyncio.to_thread(self.cache_service.get, key, lock=lock or self._sync_cache_locks[key])
+            value = await self.cache_service.get(key, lock=lock or self.async_cache_locks[key])
+        else:
+            value = await asyncio.to_thread(self.cache_service.get, key, lock=lock or self._sync_cache_locks[key])
+        if isinstance(value, dict) and value.get("run_state"):
+            graph = self._graph_from_run_state(key, value["result"])
+            if graph is None:
+                return CACHE_MISS
+            return {"result": graph, "type": value["type"]}
+        return value
+
+    def _remember_graph_payload(self, key: str, graph: Graph) -> None:
+        """Keep the payload of a cached graph to rebuild it from its run-state snapshot."""
+        self._graph_payloads[key] = {
+            "fingerprint": graph.payload_fingerprint,
+            "graph_data": graph.raw_graph_data,
+            "flow_id": graph.flow_id,
+            "flow_name": graph.flow_name,
+            "user_id": graph.user_id,
+        }
+        self._graph_payloads.move_to_end(key)
+        while len(self._graph_payloads) > MAX_GRAPH_TEMPLATES:
+            self._graph_payloads.popitem(last=False)
+
+    def _graph_from_run_state(self, key: str, run_state: dict[str, Any]) -> Graph | None:
+        """Rebuild a cached graph from its run-state snapshot.
+
+        Snapshots only hold the fingerprint of the payload, so the graph is rebuilt from the
+        payload this process cached it with. The unbuilt graph created from that payload is kept
+        as a template, so later reads of the same flow only clone it. Snapshots of payloads this
+        process does not know are treated as a cache miss.
+        """
+        fingerprint = run_state.get("graph_fingerprint")
+        template = self._graph_templates.get(key)
+        try:
+            if template is None or template.payload_fingerprint != fingerprint:
+                payload = self._graph_payloads.get(key)
+                if payload is None or payload["fingerprint"] != fingerprint:
+                    return None
+                template = Graph.from_payload(
+                    payload["graph_data"],
+                    flow_id=payload["flow_id"],
+                    flow_name=payload["flow_name"],
+                    user_id=payload["user_id"],
+                )
+                self._graph_templates[key] = template
+            self._graph_templates.move_to_end(key)
+            while len(self._graph_templates) > MAX_GRAPH_TEMPLATES:
+                self._graph_templates.popitem(last=False)
+            return Graph.from_run_state(run_state, template=template)
+        except Exception:  # noqa: BLE001
+            logger.exception(f"Error rebuilding cached graph {key} from its run state")
+            return None
 
     async def clear_cache(self, key: str, lock: asyncio.Lock | None = None) -> None:
         """Clear the cache for a client.
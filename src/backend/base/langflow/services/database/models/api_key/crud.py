@@ -1,16 +1,18 @@
+import copy
 import datetime
 import os
 import secrets
 from typing import TYPE_CHECKING
 from uuid import UUID
 
-from sqlalchemy.orm import selectinload
+from sqlalchemy import bindparam, update
+from sqlalchemy.orm import make_transient_to_detached, selectinload
 from sqlmodel import select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from langflow.services.database.models.api_key.model import ApiKey, ApiKeyCreate, ApiKeyRead, UnmaskedApiKeyRead
 from langflow.services.database.models.user.model import User
-from langflow.services.deps import get_settings_service
+from langflow.services.deps import get_api_key_service, get_settings_service
 
 if TYPE_CHECKING:
     from sqlmodel.sql.expression import SelectOfScalar
@@ -47,6 +49,29 @@ async def delete_api_key(session: AsyncSession, api_key_id: UUID) -> None:
         msg = "API Key not found"
         raise ValueError(msg)
     await session.delete(api_key)
+    get_api_key_service().invalidate_key(api_key_id, session=session)
+
+
+async def add_api_key_uses(session: AsyncSession, uses: dict[UUID, tuple[int, datetime.datetime]]) -> None:
+    """Add counted uses to the usage counters of several API keys in one batched UPDATE.
+
+    Args:
+        session (AsyncSession): The database session for executing queries.
+        uses (dict[UUID, tuple[int, datetime.datetime]]): The number of uses and the last use time by API key id.
+    """
+    if not uses:
+        return
+    table = ApiKey.__table__
+    stmt = (
+        update(table)
+        .where(table.c.id == bindparam("b_id"))
+        .values(total_uses=table.c.total_uses + bindparam("b_uses"), last_used_at=bindparam("b_last_used_at"))
+    )
+    params = [
+        {"b_id": api_key_id, "b_uses": count, "b_last_used_at": last_used_at}
+        for api_key_id, (count, last_used_at) in uses.items()
+    ]
+    await session.exec(stmt, params=params)
 
 
 async def check_key(session: AsyncSession, api_key: str) -> User | None:
@@ -69,17 +94,31 @@ async def check_key(session: AsyncSession, api_key: str) -> User | None:
 
 
 async def _check_key_from_db(session: AsyncSession, api_key: str, settings_service) -> User | None:
-    """Validate API key against the database."""
-    query: SelectOfScalar = select(ApiKey).options(selectinload(ApiKey.user)).where(ApiKey.api_key == api_key)
-    api_key_object: ApiKey | None = (await session.exec(query)).first()
-    if api_key_object is not None:
-        if settings_service.settings.disable_track_apikey_usage is not True:
-            api_key_object.total_uses += 1
-            api_key_object.last_used_at = datetime.datetime.now(datetime.timezone.utc)
-            session.add(api_key_object)
-            await session.flush()
-        return api_key_object.user
-    return None
+    """Validate API key against the database.
+
+    Validated keys are cached by the API key service for a short time, and their uses are counted in memory
+    and written to the database in batches.
+    """
+    api_key_service = get_api_key_service()
+    track_usage = settings_service.settings.disable_track_apikey_usage is not True
+    if api_key and (cached := api_key_service.get_cached_key(api_key)) is not None:
+        api_key_id, user_data = cached
+        # Copy the snapshot so that changes to mutable columns such as optins do not leak into the cache
+        user = User(**copy.deepcopy(user_data))
+        make_transient_to_detached(user)
+        # Attach the snapshot to the session without loading the user again
+        user = await session.merge(user, load=False)
+    else:
+        query: SelectOfScalar = select(ApiKey).options(selectinload(ApiKey.user)).where(ApiKey.api_key == api_key)
+        api_key_object: ApiKey | None = (await session.exec(query)).first()
+        if api_key_object is None:
+            return None
+        api_key_id, user = api_key_object.id, api_key_object.user
+        user_data = {column.key: getattr(user, column.key) for column in User.__table__.columns}
+        api_key_service.cache_key(api_key, api_key_id, user.id, user_data)
+    if track_usage:
+        await api_key_service.record_use(api_key_id)
+    return user
 
 
 async def _check_key_from_env(session: AsyncSession, api_key: str, settings_service) -> User | None:
@@ -193,6 +193,8 @@ class Flow(FlowBase, table=True):  # type: ignore[call-arg]
     locked: bool | None = Field(default=False, nullable=True)
     folder_id: UUID | None = Field(default=None, foreign_key="folder.id", nullable=True, index=True)
     fs_path: str | None = Field(default=None, nullable=True)
+    # Fingerprint of the project file and component templates a starter project was built from
+    starter_project_fingerprint: str | None = Field(default=None, nullable=True)
     folder: Optional["Folder"] = Relationship(back_populates="flows")
 
     def to_data(self):
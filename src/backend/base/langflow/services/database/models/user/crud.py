@@ -9,6 +9,7 @@ from sqlmodel import select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from langflow.services.database.models.user.model import User, UserUpdate
+from langflow.services.deps import get_api_key_service
 
 
 async def get_user_by_username(db: AsyncSession, username: str) -> User | None:
@@ -49,6 +50,8 @@ async def update_user(user_db: User | None, user: UserUpdate, db: AsyncSession)
     except IntegrityError as e:
         raise HTTPException(status_code=400, detail=str(e)) from e
 
+    # Cached API keys carry a snapshot of their user
+    get_api_key_service().invalidate_user(user_db.id, session=db)
     return user_db
 
 
@@ -130,6 +130,77 @@ async def log_vertex_build(
     return table
 
 
+async def bulk_log_vertex_builds(db: AsyncSession, vertex_builds: list[VertexBuildBase]) -> list[VertexBuildTable]:
+    """Insert several vertex builds in a single transaction.
+
+    Unlike :func:`log_vertex_build`, this does not enforce the build history limits. It is used by the
+    write-behind vertex build logger, which prunes old builds periodically with :func:`prune_vertex_builds`.
+
+    Args:
+        db (AsyncSession): The database session for executing queries.
+        vertex_builds (list[VertexBuildBase]): The vertex builds to insert.
+
+    Returns:
+        list[VertexBuildTable]: The newly created vertex build records.
+    """
+    tables = [VertexBuildTable(**vertex_build.model_dump()) for vertex_build in vertex_builds]
+    if not tables:
+        return tables
+
+    try:
+        db.add_all(tables)
+        await db.commit()
+    except Exception:
+        await db.rollback()
+        raise
+
+    return tables
+
+
+async def prune_vertex_builds(
+    db: AsyncSession,
+    *,
+    max_builds_to_keep: int | None = None,
+    max_builds_per_vertex: int | None = None,
+) -> None:
+    """Enforce the build history limits for every vertex at once.
+
+    This removes, in one transaction, the builds exceeding the per-vertex limit for every vertex
+    and then the oldest builds exceeding the global limit.
+
+    Args:
+        db (AsyncSession): The database session for executing queries.
+        max_builds_to_keep (int | None, optional): Maximum number of builds to keep globally.
+            If None, uses system settings.
+        max_builds_per_vertex (int | None, optional): Maximum number of builds to keep per vertex.
+            If None, uses system settings.
+    """
+    settings = get_settings_service().settings
+    max_global = max_builds_to_keep or settings.max_vertex_builds_to_keep
+    max_per_vertex = max_builds_per_vertex or settings.max_vertex_builds_per_vertex
+    newest_first = (col(VertexBuildTable.timestamp).desc(), col(VertexBuildTable.build_id).desc())
+
+    try:
+        # 1) Delete older builds of every vertex, keeping the newest max_per_vertex of each
+        ranked = select(
+            VertexBuildTable.build_id,
+            func.row_number()
+            .over(partition_by=(VertexBuildTable.flow_id, VertexBuildTable.id), order_by=newest_first)
+            .label("position"),
+        ).subquery()
+        stale_vertex_builds = select(ranked.c.build_id).where(ranked.c.position > max_per_vertex)
+        await db.exec(delete(VertexBuildTable).where(col(VertexBuildTable.build_id).in_(stale_vertex_builds)))
+
+        # 2) Delete older builds globally, keeping the newest max_global
+        stale_builds = select(VertexBuildTable.build_id).order_by(*newest_first).offset(max_global)
+        await db.exec(delete(VertexBuildTable).where(col(VertexBuildTable.build_id).in_(stale_builds)))
+
+        await db.commit()
+    except Exception:
+        await db.rollback()
+        raise
+
+
 async def delete_vertex_builds_by_flow_id(db: AsyncSession, flow_id: UUID) -> None:
     """Delete all vertex builds associated with a specific flow ID.
 
@@ -6,13 +6,29 @@ from typing import TYPE_CHECKING
 
 from alembic.util.exc import CommandError
 from lfx.log.logger import logger
+from sqlalchemy import event
 from sqlmodel import text
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from sqlmodel import Session
+
     from langflow.services.database.service import DatabaseService
 
 
+def run_after_commit(session: AsyncSession | Session, callback: Callable[[], None]) -> None:
+    """Run ``callback`` once the session has committed.
+
+    A cache entry dropped before the commit can be filled again with the old row by a concurrent
+    reader, so caches of changed rows are invalidated again with this once the change is visible.
+    The callback runs inside SQLAlchemy's ``after_commit`` event and must not use the session.
+    """
+    sync_session = session.sync_session if isinstance(session, AsyncSession) else session
+    event.listen(sync_session, "after_commit", lambda _session: callback(), once=True)
+
+
 async def initialize_database(*, fix_migration: bool = False) -> None:
     await logger.adebug("Initializing database")
     from langflow.services.deps import get_db_service
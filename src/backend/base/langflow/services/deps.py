@@ -10,6 +10,7 @@ if TYPE_CHECKING:
 
     from sqlmodel.ext.asyncio.session import AsyncSession
 
+    from langflow.services.api_key.service import ApiKeyService
     from langflow.services.cache.service import AsyncBaseCacheService, CacheService
     from langflow.services.chat.service import ChatService
     from langflow.services.database.service import DatabaseService
@@ -19,6 +20,7 @@ if TYPE_CHECKING:
     from langflow.services.task.service import TaskService
     from langflow.services.tracing.service import TracingService
     from langflow.services.variable.service import VariableService
+    from langflow.services.vertex_build_logger.service import VertexBuildLoggerService
 
 # These imports MUST be outside TYPE_CHECKING because FastAPI uses eval_str=True
 # to evaluate type annotations, and these types are used as return types for
@@ -244,3 +246,17 @@ def get_queue_service() -> JobQueueService:
     from langflow.services.job_queue.factory import JobQueueServiceFactory
 
     return get_service(ServiceType.JOB_QUEUE_SERVICE, JobQueueServiceFactory())
+
+
+def get_vertex_build_logger_service() -> VertexBuildLoggerService:
+    """Retrieves the VertexBuildLoggerService instance from the service manager."""
+    from langflow.services.vertex_build_logger.factory import VertexBuildLoggerServiceFactory
+
+    return get_service(ServiceType.VERTEX_BUILD_LOGGER_SERVICE, VertexBuildLoggerServiceFactory())
+
+
+def get_api_key_service() -> ApiKeyService:
+    """Retrieves the ApiKeyService instance from the service manager."""
+    from langflow.services.api_key.factory import ApiKeyServiceFactory
+
+    return get_service(ServiceType.API_KEY_SERVICE, ApiKeyServiceFactory())
@@ -20,3 +20,5 @@ class ServiceType(str, Enum):
     TELEMETRY_SERVICE = "telemetry_service"
     JOB_QUEUE_SERVICE = "job_queue_service"
     MCP_COMPOSER_SERVICE = "mcp_composer_service"
+    VERTEX_BUILD_LOGGER_SERVICE = "vertex_build_logger_service"
+    API_KEY_SERVICE = "api_key_service"
@@ -3,6 +3,7 @@ from __future__ import annotations
 import asyncio
 import os
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import asynccontextmanager
 from contextvars import ContextVar
 from typing import TYPE_CHECKING, Any
@@ -71,6 +72,7 @@ class TraceContext:
         project_name: str | None,
         user_id: str | None,
         session_id: str | None,
+        max_queue_size: int = 0,
     ):
         self.run_id: UUID | None = run_id
         self.run_name: str | None = run_name
@@ -81,7 +83,9 @@ class TraceContext:
         self.all_inputs: dict[str, dict] = defaultdict(dict)
         self.all_outputs: dict[str, dict] = defaultdict(dict)
 
+        # Only the start of component spans is bounded by max_queue_size, so a queued start always gets its end
         self.traces_queue: asyncio.Queue = asyncio.Queue()
+        self.max_queue_size = max_queue_size
         self.running = False
         self.worker_task: asyncio.Task | None = None
 
@@ -105,6 +109,8 @@ class ComponentTraceContext:
         self.outputs: dict[str, dict] = defaultdict(dict)
         self.outputs_metadata: dict[str, dict] = defaultdict(dict)
         self.logs: dict[str, list[Log | dict[Any, Any]]] = defaultdict(list)
+        # Set when the start of this trace was dropped, so its end is dropped as well
+        self.dropped = False
 
 
 class TracingService(Service):
@@ -125,17 +131,79 @@ class TracingService(Service):
 
     def __init__(self, settings_service: SettingsService):
         self.settings_service = settings_service
-        self.deactivated = self.settings_service.settings.deactivate_tracing
+        settings = self.settings_service.settings
+        self.deactivated = settings.deactivate_tracing
+        self.queue_size = settings.tracing_queue_size
+        self.export_batch_size = settings.tracing_export_batch_size
+        self.export_workers = settings.tracing_export_workers
+        self._executor: ThreadPoolExecutor | None = None
+        # Counters of tracer callbacks, two per component span
+        self.callbacks_queued = 0
+        self.callbacks_dropped = 0
+        self.callbacks_exported = 0
+        self.callbacks_failed = 0
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Threads that run tracer callbacks, which do network I/O and serialization off the event loop."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.export_workers, thread_name_prefix="langflow-trace-export"
+            )
+        return self._executor
 
-    async def _trace_worker(self, trace_context: TraceContext) -> None:
-        while trace_context.running or not trace_context.traces_queue.empty():
-            trace_func, args = await trace_context.traces_queue.get()
+    def export_stats(self) -> dict[str, int]:
+        """Return the number of tracer callbacks queued, dropped, exported and failed since startup."""
+        return {
+            "queued": self.callbacks_queued,
+            "dropped": self.callbacks_dropped,
+            "exported": self.callbacks_exported,
+            "failed": self.callbacks_failed,
+        }
+
+    @staticmethod
+    def _export_batch(batch: list[tuple[Any, tuple]]) -> int:
+        """Run a batch of tracer callbacks in an export thread and return how many failed."""
+        failed = 0
+        for trace_func, args in batch:
             try:
                 trace_func(*args)
             except Exception:  # noqa: BLE001
-                await logger.aexception("Error processing trace_func")
+                logger.exception("Error processing trace_func")
+                failed += 1
+        return failed
+
+    async def _trace_worker(self, trace_context: TraceContext) -> None:
+        queue = trace_context.traces_queue
+        loop = asyncio.get_running_loop()
+        while trace_context.running or not queue.empty():
+            batch = [await queue.get()]
+            while len(batch) < self.export_batch_size and not queue.empty():
+                batch.append(queue.get_nowait())
+            try:
+                # The batch is awaited before the next one is taken, so the callbacks of a run keep their order
+                failed = await loop.run_in_executor(self._get_executor(), self._export_batch, batch)
+                self.callbacks_exported += len(batch) - failed
+                self.callbacks_failed += failed
+            except Exception:  # noqa: BLE001
+                await logger.aexception("Error exporting traces")
+                self.callbacks_failed += len(batch)
             finally:
-                trace_context.traces_queue.task_done()
+                for _ in batch:
+                    queue.task_done()
+
+    def _enqueue(self, trace_context: TraceContext, trace_func, args: tuple, *, droppable: bool = True) -> bool:
+        """Queue a tracer callback without waiting.
+
+        A droppable callback is dropped when the run's queue is full. Callbacks that end a span whose
+        start was queued are never droppable, otherwise the tracers would keep the span open.
+        """
+        queue = trace_context.traces_queue
+        if droppable and trace_context.max_queue_size and queue.qsize() >= trace_context.max_queue_size:
+            self.callbacks_dropped += 1
+            return False
+        queue.put_nowait((trace_func, args))
+        self.callbacks_queued += 1
+        return True
 
     async def _start(self, trace_context: TraceContext) -> None:
         if trace_context.running or self.deactivated:
@@ -238,7 +306,9 @@ class TracingService(Service):
             return
         try:
             project_name = project_name or os.getenv("LANGCHAIN_PROJECT", "Langflow")
-            trace_context = TraceContext(run_id, run_name, project_name, user_id, session_id)
+            trace_context = TraceContext(
+                run_id, run_name, project_name, user_id, session_id, max_queue_size=self.queue_size
+            )
             trace_context_var.set(trace_context)
             await self._start(trace_context)
             self._initialize_langsmith_tracer(trace_context)
@@ -253,9 +323,8 @@ class TracingService(Service):
     async def _stop(self, trace_context: TraceContext) -> None:
         try:
             trace_context.running = False
-            # check the qeue is empty
-            if not trace_context.traces_queue.empty():
-                await trace_context.traces_queue.join()
+            # Wait for the queued callbacks, including a batch that is still being exported
+            await trace_context.traces_queue.join()
             if trace_context.worker_task:
                 trace_context.worker_task.cancel()
                 trace_context.worker_task = None
@@ -289,7 +358,12 @@ class TracingService(Service):
         if trace_context is None:
             return
         await self._stop(trace_context)
-        self._end_all_tracers(trace_context, outputs, error)
+        try:
+            await asyncio.get_running_loop().run_in_executor(
+                self._get_executor(), self._end_all_tracers, trace_context, outputs, error
+            )
+        except Exception:  # noqa: BLE001
+            await logger.aexception("Error ending all traces")
 
     @staticmethod
     def _cleanup_inputs(inputs: dict[str, Any]):
@@ -383,18 +457,27 @@ class TracingService(Service):
             yield self
             return
         trace_context.all_inputs[trace_name] |= inputs or {}
-        await trace_context.traces_queue.put((self._start_component_traces, (component_trace_context, trace_context)))
+        # Spans are dropped rather than waited for when the exporters fall behind
+        component_trace_context.dropped = not self._enqueue(
+            trace_context, self._start_component_traces, (component_trace_context, trace_context)
+        )
+        error: Exception | None = None
         try:
             yield self
         except Exception as e:
-            await trace_context.traces_queue.put(
-                (self._end_component_traces, (component_trace_context, trace_context, e))
-            )
+            error = e
             raise
-        else:
-            await trace_context.traces_queue.put(
-                (self._end_component_traces, (component_trace_context, trace_context, None))
-            )
+        finally:
+            if component_trace_context.dropped:
+                # The end of a dropped span is dropped with it
+                self.callbacks_dropped += 1
+            else:
+                self._enqueue(
+                    trace_context,
+                    self._end_component_traces,
+                    (component_trace_context, trace_context, error),
+                    droppable=False,
+                )
 
     @property
     def project_name(self):
@@ -463,3 +546,8 @@ class TracingService(Service):
             if langchain_callback:
                 callbacks.append(langchain_callback)
         return callbacks
+
+    async def teardown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
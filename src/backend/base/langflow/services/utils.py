@@ -12,6 +12,7 @@ from sqlmodel import col, select
 from langflow.services.auth.utils import create_super_user, verify_password
 from langflow.services.cache.base import ExternalAsyncBaseCacheService
 from langflow.services.cache.factory import CacheServiceFactory
+from langflow.services.cache.tiered import TieredCache
 from langflow.services.database.models.transactions.model import TransactionTable
 from langflow.services.database.models.vertex_builds.model import VertexBuildTable
 from langflow.services.database.utils import initialize_database
@@ -135,6 +136,11 @@ async def teardown_services() -> None:
     from lfx.services.manager import get_service_manager
 
     service_manager = get_service_manager()
+    # Write the buffered vertex builds and API key uses while the database service is still available.
+    if (vertex_build_logger := service_manager.services.get(ServiceType.VERTEX_BUILD_LOGGER_SERVICE)) is not None:
+        await vertex_build_logger.teardown()
+    if (api_key_service := service_manager.services.get(ServiceType.API_KEY_SERVICE)) is not None:
+        await api_key_service.teardown()
     await service_manager.teardown()
 
 
@@ -226,6 +232,7 @@ def register_all_service_factories() -> None:
     from lfx.services.mcp_composer import factory as mcp_composer_factory
     from lfx.services.settings import factory as settings_factory
 
+    from langflow.services.api_key import factory as api_key_factory
     from langflow.services.auth import factory as auth_factory
     from langflow.services.cache import factory as cache_factory
     from langflow.services.chat import factory as chat_factory
@@ -240,6 +247,7 @@ def register_all_service_factories() -> None:
     from langflow.services.telemetry import factory as telemetry_factory
     from langflow.services.tracing import factory as tracing_factory
     from langflow.services.variable import factory as variable_factory
+    from langflow.services.vertex_build_logger import factory as vertex_build_logger_factory
 
     # Register all factories
     service_manager.register_factory(settings_factory.SettingsServiceFactory())
@@ -258,6 +266,8 @@ def register_all_service_factories() -> None:
     service_manager.register_factory(shared_component_cache_factory.SharedComponentCacheServiceFactory())
     service_manager.register_factory(auth_factory.AuthServiceFactory())
     service_manager.register_factory(mcp_composer_factory.MCPComposerServiceFactory())
+    service_manager.register_factory(vertex_build_logger_factory.VertexBuildLoggerServiceFactory())
+    service_manager.register_factory(api_key_factory.ApiKeyServiceFactory())
     service_manager.set_factory_registered()
 
 
@@ -268,6 +278,8 @@ async def initialize_services(*, fix_migration: bool = False) -> None:
 
     cache_service = get_service(ServiceType.CACHE_SERVICE, default=CacheServiceFactory())
     # Test external cache connection
+    if isinstance(cache_service, TieredCache):
+        cache_service = cache_service.backend
     if isinstance(cache_service, ExternalAsyncBaseCacheService) and not (await cache_service.is_connected()):
         msg = "Cache service failed to connect to external database"
         raise ConnectionError(msg)
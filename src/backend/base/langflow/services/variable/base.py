@@ -1,4 +1,5 @@
 import abc
+from collections.abc import Iterable
 from uuid import UUID
 
 from sqlmodel.ext.asyncio.session import AsyncSession
@@ -35,6 +36,19 @@ class VariableService(Service):
             The value of the variable.
         """
 
+    async def prefetch_variables(  # noqa: B027
+        self, user_id: UUID | str, names: Iterable[str], session: AsyncSession
+    ) -> None:
+        """Load several variables at once so that the next get_variable calls for them are served from memory.
+
+        Services without a value cache do nothing.
+
+        Args:
+            user_id: The user ID.
+            names: The names of the variables.
+            session: The database session.
+        """
+
     @abc.abstractmethod
     async def list_variables(self, user_id: UUID | str, session: AsyncSession) -> list[str | None]:
         """List all variables.
@@ -1,20 +1,22 @@
 from __future__ import annotations
 
 import os
+import time
 from datetime import datetime, timezone
 from typing import TYPE_CHECKING
 
 from lfx.log.logger import logger
-from sqlmodel import select
+from sqlmodel import col, select
 
 from langflow.services.auth import utils as auth_utils
 from langflow.services.base import Service
 from langflow.services.database.models.variable.model import Variable, VariableCreate, VariableRead, VariableUpdate
+from langflow.services.database.utils import run_after_commit
 from langflow.services.variable.base import VariableService
 from langflow.services.variable.constants import CREDENTIAL_TYPE, GENERIC_TYPE
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
+    from collections.abc import Iterable, Sequence
     from uuid import UUID
 
     from lfx.services.settings.service import SettingsService
@@ -24,6 +26,48 @@ if TYPE_CHECKING:
 class DatabaseVariableService(VariableService, Service):
     def __init__(self, settings_service: SettingsService):
         self.settings_service = settings_service
+        # Decrypted values by user and variable name, as (expiry time, variable type, value)
+        self._value_cache: dict[str, dict[str, tuple[float, str | None, str]]] = {}
+
+    def _get_cached_value(self, user_id: UUID | str, name: str) -> tuple[str | None, str] | None:
+        entry = self._value_cache.get(str(user_id), {}).get(name)
+        if entry is None or entry[0] <= time.monotonic():
+            return None
+        return entry[1], entry[2]
+
+    def _cache_value(self, user_id: UUID | str, name: str, variable_type: str | None, value: str) -> None:
+        ttl = self.settings_service.settings.variable_cache_ttl
+        if ttl <= 0:
+            return
+        now = time.monotonic()
+        user_cache = self._value_cache.setdefault(str(user_id), {})
+        for expired in [key for key, (expires_at, _, _) in user_cache.items() if expires_at <= now]:
+            del user_cache[expired]
+        user_cache[name] = (now + ttl, variable_type, value)
+
+    def invalidate_cached_values(
+        self, user_id: UUID | str, name: str | None = None, *, session: AsyncSession | None = None
+    ) -> None:
+        """Drop the cached values of one variable, or of all variables of the user if no name is given.
+
+        When the variables are changed in ``session``, the values are dropped again once the session
+        commits, since a concurrent read before the commit can cache the old value again.
+        """
+        if name is None:
+            self._value_cache.pop(str(user_id), None)
+        else:
+            self._value_cache.get(str(user_id), {}).pop(name, None)
+        if session is not None:
+            run_after_commit(session, lambda: self.invalidate_cached_values(user_id, name))
+
+    @staticmethod
+    def _check_field_allowed(name: str, variable_type: str | None, field: str) -> None:
+        if variable_type == CREDENTIAL_TYPE and field == "session_id":
+            msg = (
+                f"variable {name} of type 'Credential' cannot be used in a Session ID field "
+                "because its purpose is to prevent the exposure of values."
+            )
+            raise TypeError(msg)
 
     async def initialize_user_variables(self, user_id: UUID | str, session: AsyncSession) -> None:
         if not self.settings_service.settings.store_environment_variables:
@@ -165,19 +209,36 @@ class DatabaseVariableService(VariableService, Service):
         field: str,
         session: AsyncSession,
     ) -> str:
+        cached = self._get_cached_value(user_id, name)
+        if cached is not None:
+            variable_type, value = cached
+            self._check_field_allowed(name, variable_type, field)
+            return value
+
         # we get the credential from the database
-        # credential = session.query(Variable).filter(Variable.user_id == user_id, Variable.name == name).first()
         variable = await self.get_variable_object(user_id, name, session)
-
-        if variable.type == CREDENTIAL_TYPE and field == "session_id":
-            msg = (
-                f"variable {name} of type 'Credential' cannot be used in a Session ID field "
-                "because its purpose is to prevent the exposure of values."
-            )
-            raise TypeError(msg)
+        self._check_field_allowed(name, variable.type, field)
 
         # we decrypt the value
-        return auth_utils.decrypt_api_key(variable.value, settings_service=self.settings_service)
+        value = auth_utils.decrypt_api_key(variable.value, settings_service=self.settings_service)
+        self._cache_value(user_id, name, variable.type, value)
+        return value
+
+    async def prefetch_variables(self, user_id: UUID | str, names: Iterable[str], session: AsyncSession) -> None:
+        missing = [name for name in set(names) if self._get_cached_value(user_id, name) is None]
+        if not missing or self.settings_service.settings.variable_cache_ttl <= 0:
+            return
+        stmt = select(Variable).where(Variable.user_id == user_id, col(Variable.name).in_(missing))
+        for variable in (await session.exec(stmt)).all():
+            if not variable.value:
+                continue
+            try:
+                value = auth_utils.decrypt_api_key(variable.value, settings_service=self.settings_service)
+            except Exception:  # noqa: BLE001
+                # get_variable reports the error if a component actually uses the variable
+                await logger.adebug(f"Could not prefetch variable {variable.name}", exc_info=True)
+                continue
+            self._cache_value(user_id, variable.name, variable.type, value)
 
     async def get_all(self, user_id: UUID | str, session: AsyncSession) -> list[VariableRead]:
         stmt = select(Variable).where(Variable.user_id == user_id)
@@ -238,6 +299,7 @@ class DatabaseVariableService(VariableService, Service):
         session.add(variable)
         await session.flush()
         await session.refresh(variable)
+        self.invalidate_cached_values(user_id, name, session=session)
         return variable
 
     async def update_variable_fields(
@@ -269,6 +331,8 @@ class DatabaseVariableService(VariableService, Service):
         session.add(db_variable)
         await session.flush()
         await session.refresh(db_variable)
+        # The update may rename the variable, so every cached value of the user is dropped
+        self.invalidate_cached_values(user_id, session=session)
         return db_variable
 
     async def delete_variable(
@@ -283,6 +347,7 @@ class DatabaseVariableService(VariableService, Service):
             msg = f"{name} variable not found."
             raise ValueError(msg)
         await session.delete(variable)
+        self.invalidate_cached_values(user_id, name, session=session)
 
     async def delete_variable_by_id(self, user_id: UUID | str, variable_id: UUID, session: AsyncSession) -> None:
         stmt = select(Variable).where(Variable.user_id == user_id, Variable.id == variable_id)
@@ -291,6 +356,7 @@ class DatabaseVariableService(VariableService, Service):
             msg = f"{variable_id} variable not found."
             raise ValueError(msg)
         await session.delete(variable)
+        self.invalidate_cached_values(user_id, variable.name, session=session)
 
     async def create_variable(
         self,
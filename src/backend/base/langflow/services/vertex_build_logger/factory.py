@@ -0,0 +1,20 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from typing_extensions import override
+
+from langflow.services.factory import ServiceFactory
+from langflow.services.vertex_build_logger.service import VertexBuildLoggerService
+
+if TYPE_CHECKING:
+    from lfx.services.settings.service import SettingsService
+
+
+class VertexBuildLoggerServiceFactory(ServiceFactory):
+    def __init__(self) -> None:
+        super().__init__(VertexBuildLoggerService)
+
+    @override
+    def create(self, settings_service: SettingsService):
+        return VertexBuildLoggerService(settings_service)
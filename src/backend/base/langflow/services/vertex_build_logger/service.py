@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+from typing import TYPE_CHECKING
+
+from lfx.log.logger import logger
+
+from langflow.services.base import Service
+from langflow.services.database.models.vertex_builds.crud import bulk_log_vertex_builds, prune_vertex_builds
+from langflow.services.deps import session_scope
+
+if TYPE_CHECKING:
+    from uuid import UUID
+
+    from lfx.services.settings.service import SettingsService
+
+    from langflow.services.database.models.vertex_builds.model import VertexBuildBase
+
+
+class VertexBuildLoggerService(Service):
+    """Write-behind logger for vertex builds.
+
+    Builds are buffered in memory and written to the database in bulk, either when
+    ``vertex_build_flush_interval`` elapses or when ``vertex_build_batch_size`` builds are waiting.
+    The build history limits are enforced by a periodic prune job instead of on every insert.
+    """
+
+    name = "vertex_build_logger_service"
+
+    def __init__(self, settings_service: SettingsService):
+        super().__init__()
+        self.settings_service = settings_service
+        settings = settings_service.settings
+        self.flush_interval = settings.vertex_build_flush_interval
+        self.batch_size = settings.vertex_build_batch_size
+        self.prune_interval = settings.vertex_build_prune_interval
+        self._buffer: list[VertexBuildBase] = []
+        self._flush_lock = asyncio.Lock()
+        self._flush_event = asyncio.Event()
+        self._worker_task: asyncio.Task | None = None
+        self._needs_prune = False
+        self._stopping = False
+
+    async def log_vertex_build(self, vertex_build: VertexBuildBase) -> None:
+        """Buffer a vertex build to be written with the next flush."""
+        self._buffer.append(vertex_build)
+        if self._stopping:
+            await self.flush()
+            return
+        self._ensure_worker()
+        if self.flush_interval <= 0:
+            await self.flush()
+        elif len(self._buffer) >= self.batch_size:
+            self._flush_event.set()
+
+    async def flush(self) -> None:
+        """Write every buffered vertex build to the database."""
+        async with self._flush_lock:
+            if not self._buffer:
+                return
+            batch, self._buffer = self._buffer, []
+            try:
+                async with session_scope() as session:
+                    await bulk_log_vertex_builds(session, batch)
+                self._needs_prune = True
+            except Exception as exc:  # noqa: BLE001
+                await logger.awarning(f"Error logging {len(batch)} vertex builds: {exc!s}")
+
+    async def prune(self) -> None:
+        """Remove the builds exceeding the build history limits."""
+        self._needs_prune = False
+        try:
+            async with session_scope() as session:
+                await prune_vertex_builds(session)
+        except Exception as exc:  # noqa: BLE001
+            await logger.awarning(f"Error pruning vertex builds: {exc!s}")
+
+    def discard(self, flow_id: UUID | str) -> None:
+        """Drop the buffered builds of a flow whose builds are being deleted."""
+        flow_id_str = str(flow_id)
+        self._buffer = [vertex_build for vertex_build in self._buffer if str(vertex_build.flow_id) != flow_id_str]
+
+    def _ensure_worker(self) -> None:
+        loop = asyncio.get_running_loop()
+        if self._worker_task is None or self._worker_task.done() or self._worker_task.get_loop() is not loop:
+            self._flush_event = asyncio.Event()
+            self._worker_task = asyncio.create_task(self._run())
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        last_prune = loop.time()
+        while not self._stopping:
+            with contextlib.suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(self._flush_event.wait(), timeout=self.flush_interval or self.prune_interval)
+            self._flush_event.clear()
+            await self.flush()
+            if self._needs_prune and loop.time() - last_prune >= self.prune_interval:
+                await self.prune()
+                last_prune = loop.time()
+
+    async def stop(self) -> None:
+        """Stop the worker, writing the remaining builds and pruning the history."""
+        self._stopping = True
+        try:
+            worker_task, self._worker_task = self._worker_task, None
+            if worker_task is not None and not worker_task.done():
+                if worker_task.get_loop() is asyncio.get_running_loop():
+                    self._flush_event.set()
+                    await worker_task
+                else:
+                    worker_task.cancel()
+            await self.flush()
+            if self._needs_prune:
+                await self.prune()
+        except Exception:  # noqa: BLE001
+            await logger.aexception("Error stopping vertex build logger service")
+        finally:
+            self._stopping = False
+
+    async def teardown(self) -> None:
+        await self.stop()
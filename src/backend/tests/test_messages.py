@@ -1,3 +1,4 @@
+import asyncio
 from datetime import datetime, timezone
 from uuid import UUID, uuid4
 
@@ -5,14 +6,21 @@ import pytest
 from langflow.memory import (
     aadd_messages,
     aadd_messagetables,
+    abuffer_message,
     add_messages,
     adelete_messages,
+    aflush_messages,
     aget_messages,
     astore_message,
     aupdate_messages,
+    aupsert_messages,
+    delete_message,
     delete_messages,
     get_messages,
+    message_write_buffer,
 )
+from langflow.custom.custom_component.component import Component
+from langflow.events.event_manager import EventManager
 from langflow.schema.content_block import ContentBlock
 from langflow.schema.content_types import TextContent, ToolContent
 from langflow.schema.message import Message
@@ -364,6 +372,110 @@ async def test_aupdate_message_with_nested_properties(created_message):
     assert updated[0].properties.targets == []
 
 
+@pytest.mark.usefixtures("client")
+async def test_aupsert_messages_inserts_and_updates(created_message):
+    created_message.text = "Upserted existing message"
+    new_message = Message(text="Upserted new message", sender="User", sender_name="User", session_id="session_id")
+
+    upserted = await aupsert_messages([created_message, new_message])
+
+    assert [message.text for message in upserted] == ["Upserted existing message", "Upserted new message"]
+    assert upserted[0].id == created_message.id
+    stored_messages = await aget_messages(session_id="session_id", order="ASC")
+    assert sorted(message.text for message in stored_messages) == ["Upserted existing message", "Upserted new message"]
+
+
+@pytest.mark.usefixtures("client")
+async def test_buffered_message_is_written_once_complete():
+    session_id = "buffered_session_id"
+    message = Message(text=iter(["stream"]), sender="AI", sender_name="AI", session_id=session_id)
+
+    buffered = await abuffer_message(message)
+
+    assert buffered.id is not None
+    assert UUID(str(buffered.id)) in message_write_buffer
+    buffered.text = "Streamed message"
+    buffered.properties.state = "complete"
+    written = await aupsert_messages(buffered)
+
+    assert UUID(str(buffered.id)) not in message_write_buffer
+    assert written[0].id == buffered.id
+    stored_messages = await aget_messages(session_id=session_id)
+    assert [message.text for message in stored_messages] == ["Streamed message"]
+    assert stored_messages[0].properties.state == "complete"
+
+
+@pytest.mark.usefixtures("client")
+async def test_buffered_message_is_not_written_by_reads_and_dropped_on_delete():
+    session_id = "buffered_read_session_id"
+    message = Message(text=iter(["stream"]), sender="AI", sender_name="AI", session_id=session_id)
+    buffered = await abuffer_message(message)
+
+    assert await aget_messages(session_id=session_id) == []
+    assert UUID(str(buffered.id)) in message_write_buffer
+
+    await aflush_messages(message_id=buffered.id)
+    stored_messages = await aget_messages(session_id=session_id)
+    assert [str(message.id) for message in stored_messages] == [str(buffered.id)]
+    assert UUID(str(buffered.id)) not in message_write_buffer
+
+    discarded = await abuffer_message(
+        Message(text=iter(["stream"]), sender="AI", sender_name="AI", session_id=session_id)
+    )
+    await delete_message(discarded.id)
+    assert UUID(str(discarded.id)) not in message_write_buffer
+    assert await aflush_messages(message_id=discarded.id) == []
+
+
+@pytest.mark.usefixtures("client")
+async def test_cancelled_stream_writes_its_buffered_message():
+    session_id = "cancelled_stream_session_id"
+    streaming = asyncio.Event()
+
+    class Chunk:
+        content = "partial"
+
+    async def tokens():
+        yield Chunk()
+        streaming.set()
+        await asyncio.Event().wait()
+
+    component = Component()
+    component.set_event_manager(EventManager(asyncio.Queue()))
+    task = asyncio.create_task(
+        component.send_message(Message(text=tokens(), sender="AI", sender_name="AI", session_id=session_id))
+    )
+    await streaming.wait()
+    message_id = component._stored_message_id
+    assert UUID(str(message_id)) in message_write_buffer
+
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    assert UUID(str(message_id)) not in message_write_buffer
+    stored_messages = await aget_messages(session_id=session_id)
+    assert [str(message.id) for message in stored_messages] == [str(message_id)]
+
+
+@pytest.mark.usefixtures("client")
+async def test_buffered_messages_of_a_deleted_context_are_not_written():
+    session_id = "buffered_context_session_id"
+    kept = await abuffer_message(
+        Message(text=iter(["stream"]), sender="AI", sender_name="AI", session_id=session_id, context_id="kept")
+    )
+    deleted = await abuffer_message(
+        Message(text=iter(["stream"]), sender="AI", sender_name="AI", session_id=session_id, context_id="deleted")
+    )
+
+    await adelete_messages(context_id="deleted")
+
+    assert UUID(str(deleted.id)) not in message_write_buffer
+    await aflush_messages(session_id)
+    stored_messages = await aget_messages(session_id=session_id)
+    assert [str(message.id) for message in stored_messages] == [str(kept.id)]
+
+
 # =============================================================================
 # Tests for MessageBase.from_message file path handling
 # =============================================================================
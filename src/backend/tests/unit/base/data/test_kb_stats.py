@@ -0,0 +1,76 @@
+import json
+from unittest.mock import patch
+
+from langflow.api.v1.knowledge_bases import get_kb_metadata
+from lfx.base.knowledge_bases.kb_stats import (
+    KB_STATS_FILENAME,
+    count_text,
+    read_kb_stats,
+    rebuild_kb_stats,
+    update_kb_stats,
+)
+
+
+class TestKBStats:
+    """Test suite for the persisted knowledge base stats manifest."""
+
+    def test_count_text(self):
+        assert count_text(["the cat sat", "", None, "on  the mat"]) == (6, 22)
+
+    def test_update_requires_existing_manifest_unless_created(self, tmp_path):
+        assert update_kb_stats(tmp_path, chunks=2, words=5, characters=20) is None
+        assert not (tmp_path / KB_STATS_FILENAME).exists()
+
+        update_kb_stats(tmp_path, chunks=2, words=5, characters=20, embedding_model="model", create=True)
+        stats = update_kb_stats(tmp_path, chunks=1, words=3, characters=10)
+
+        assert stats is not None
+        assert (stats["chunks"], stats["words"], stats["characters"]) == (3, 8, 30)
+        assert read_kb_stats(tmp_path)["embedding_model"] == "model"
+
+    def test_read_ignores_other_versions(self, tmp_path):
+        (tmp_path / KB_STATS_FILENAME).write_text(json.dumps({"version": 0, "chunks": 3}))
+        assert read_kb_stats(tmp_path) is None
+
+        (tmp_path / KB_STATS_FILENAME).write_text("not json")
+        assert read_kb_stats(tmp_path) is None
+
+    def test_rebuild_keeps_embedding_info(self, tmp_path):
+        update_kb_stats(tmp_path, chunks=1, words=1, characters=1, embedding_provider="OpenAI", create=True)
+
+        with patch(
+            "lfx.base.knowledge_bases.kb_stats.compute_kb_stats",
+            return_value={"chunks": 4, "words": 12, "characters": 60},
+        ):
+            stats = rebuild_kb_stats(tmp_path)
+
+        assert stats["chunks"] == 4
+        assert stats["embedding_provider"] == "OpenAI"
+        assert rebuild_kb_stats(tmp_path / "missing") is None
+
+    def test_get_kb_metadata_reads_manifest(self, tmp_path):
+        update_kb_stats(
+            tmp_path,
+            chunks=4,
+            words=12,
+            characters=60,
+            embedding_provider="HuggingFace",
+            embedding_model="sentence-transformers/all-MiniLM-L6-v2",
+            create=True,
+        )
+
+        with patch("langflow.api.v1.knowledge_bases.rebuild_kb_stats") as mock_rebuild:
+            metadata = get_kb_metadata(tmp_path)
+
+        mock_rebuild.assert_not_called()
+        assert metadata["chunks"] == 4
+        assert metadata["words"] == 12
+        assert metadata["avg_chunk_size"] == 15.0
+        assert metadata["embedding_model"] == "sentence-transformers/all-MiniLM-L6-v2"
+
+    def test_get_kb_metadata_rebuilds_legacy_manifest(self, tmp_path):
+        with patch("langflow.api.v1.knowledge_bases.rebuild_kb_stats") as mock_rebuild:
+            metadata = get_kb_metadata(tmp_path)
+
+        mock_rebuild.assert_called_once_with(tmp_path)
+        assert metadata["chunks"] == 0
@@ -1,6 +1,6 @@
 import tempfile
 from pathlib import Path
-from unittest.mock import Mock, patch
+from unittest.mock import ANY, Mock, patch
 
 import pytest
 from lfx.components.files_and_knowledge.directory import DirectoryComponent
@@ -83,6 +83,8 @@ class TestDirectoryComponent(ComponentTestBaseWithoutClient):
             mock_retrieve_file_paths.return_value,
             max_concurrency=max_concurrency,
             silent_errors=silent_errors,
+            cache=ANY,
+            use_processes=False,
         )
 
     def test_directory_without_mocks(self):
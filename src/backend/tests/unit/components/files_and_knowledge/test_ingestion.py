@@ -263,6 +263,47 @@ class TestKnowledgeIngestionComponent(ComponentTestBaseWithClient):
         # Should only return one object (second row) since first is duplicate
         assert len(data_objects) == 1
 
+    async def test_create_vector_store_ingests_in_batches(self, component_class, default_kwargs):
+        """Test that rows are deduplicated and added one batch at a time."""
+        default_kwargs["chunk_size"] = 2
+        default_kwargs["input_df"] = DataFrame(
+            {
+                "text": ["Sample text 1", "Sample text 2", "Sample text 1", "Sample text 3", "Sample text 4"],
+                "title": ["Title 1", "Title 2", "Title 1", "Title 3", "Title 4"],
+                "category": ["cat1", "cat2", "cat1", "cat3", "cat4"],
+            }
+        )
+        component = component_class(**default_kwargs)
+        stored_hash = component._row_to_data_object(
+            {"text": "Sample text 4", "category": "cat4"}, ["text"], ["category"], ["category"]
+        ).data["_id"]
+
+        with (
+            patch("langflow.components.knowledge_bases.ingestion.Chroma") as mock_chroma,
+            patch.object(component, "_build_embeddings"),
+        ):
+            mock_chroma_instance = MagicMock()
+            mock_chroma_instance.get.side_effect = lambda where, **_: {
+                "metadatas": [{"_id": h} for h in where["_id"]["$in"] if h == stored_hash]
+            }
+            mock_chroma.return_value = mock_chroma_instance
+
+            added = await component._create_vector_store(
+                default_kwargs["input_df"],
+                default_kwargs["column_config"],
+                embedding_model="sentence-transformers/all-MiniLM-L6-v2",
+                api_key=None,
+            )
+
+        # Batches of two rows: the third row repeats the first and the fifth is already stored
+        assert added == 3
+        batches = [call.args[0] for call in mock_chroma_instance.add_documents.call_args_list]
+        assert [[doc.page_content for doc in batch] for batch in batches] == [
+            ["Sample text 1", "Sample text 2"],
+            ["Sample text 3"],
+        ]
+        assert all("where" in call.kwargs for call in mock_chroma_instance.get.call_args_list)
+
     def test_is_valid_collection_name(self, component_class, default_kwargs):
         """Test collection name validation."""
         component = component_class(**default_kwargs)
@@ -361,6 +361,47 @@ class TestKnowledgeRetrievalComponent(ComponentTestBaseWithClient):
             mock_get_metadata.assert_called_once()
             mock_build_embeddings.assert_called_once()
 
+    def test_open_knowledge_base_reuses_cached_handle(self, component_class, default_kwargs, active_user):
+        """Test that the vector store and embedder are built once until the knowledge base is invalidated."""
+        from lfx.base.knowledge_bases.kb_handles import invalidate_kb_handles
+
+        component = component_class(**default_kwargs)
+        kb_path = Path(default_kwargs["kb_root_path"]) / active_user.username / default_kwargs["knowledge_base"]
+
+        with (
+            patch.object(component, "_build_embeddings") as mock_build_embeddings,
+            patch("langflow.components.knowledge_bases.retrieval.Chroma") as mock_chroma,
+        ):
+            first = component._open_knowledge_base(kb_path)
+            second = component._open_knowledge_base(kb_path)
+            assert first is second
+            assert mock_build_embeddings.call_count == 1
+            assert mock_chroma.call_count == 1
+
+            assert invalidate_kb_handles(kb_path) == 1
+            third = component._open_knowledge_base(kb_path)
+
+        assert third is not first
+        assert mock_build_embeddings.call_count == 2
+        invalidate_kb_handles(kb_path)
+
+    def test_get_result_embeddings_looks_up_ids_once(self, component_class, default_kwargs):
+        """Test that the embeddings of all results are fetched with one primary key lookup."""
+        from langchain_core.documents import Document
+
+        component = component_class(**default_kwargs)
+        results = [
+            (Document(id="doc-1", page_content="first", metadata={"_id": "hash-1"}), 0.1),
+            (Document(id="doc-2", page_content="second", metadata={"_id": "hash-2"}), 0.2),
+        ]
+        chroma = MagicMock()
+        chroma._collection.get.return_value = {"ids": ["doc-2", "doc-1"], "embeddings": [[2.0], [1.0]]}
+
+        id_to_embedding = component._get_result_embeddings(chroma, results)
+
+        chroma._collection.get.assert_called_once_with(ids=["doc-1", "doc-2"], include=["embeddings"])
+        assert id_to_embedding == {"hash-1": [1.0], "hash-2": [2.0]}
+
     def test_include_embeddings_parameter(self, component_class, default_kwargs):
         """Test that include_embeddings parameter is properly set."""
         # Test with embeddings enabled
@@ -0,0 +1,102 @@
+import os
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import orjson
+import pytest
+from langflow.initial_setup.fs_flow_sync import FlowFileSync, update_flows_from_files
+
+
+@pytest.fixture
+def flow_files(tmp_path):
+    files = {}
+    for i in range(3):
+        path = tmp_path / f"flow_{i}.json"
+        path.write_bytes(orjson.dumps({"name": f"flow {i}"}))
+        files[uuid4()] = path
+    return files
+
+
+@pytest.fixture
+def apply_updates():
+    with (
+        patch("langflow.initial_setup.fs_flow_sync.session_scope"),
+        patch("langflow.initial_setup.fs_flow_sync.update_flows_from_files", new_callable=AsyncMock) as update_flows,
+    ):
+        yield update_flows
+
+
+async def test_check_updates_modified_flows_in_one_batch(flow_files, apply_updates):
+    flow_file_sync = FlowFileSync(polling_interval=0.1, watch=False)
+    new_flow_ids = flow_file_sync.track({flow_id: str(path) for flow_id, path in flow_files.items()})
+    assert new_flow_ids == set(flow_files)
+
+    await flow_file_sync.check(new_flow_ids)
+
+    apply_updates.assert_awaited_once()
+    _, updates = apply_updates.await_args.args
+    assert updates == {flow_id: {"name": path.stem.replace("_", " ")} for flow_id, path in flow_files.items()}
+
+    # Unchanged files are not read or written again
+    await flow_file_sync.check(set(flow_files))
+    apply_updates.assert_awaited_once()
+
+    changed_flow_id, changed_path = next(iter(flow_files.items()))
+    changed_path.write_bytes(orjson.dumps({"name": "renamed"}))
+    mtime = changed_path.stat().st_mtime + 10
+    os.utime(changed_path, (mtime, mtime))
+    await flow_file_sync.check(set(flow_files))
+
+    assert apply_updates.await_count == 2
+    assert apply_updates.await_args.args[1] == {changed_flow_id: {"name": "renamed"}}
+
+
+async def test_check_skips_unreadable_and_missing_files(flow_files, apply_updates, tmp_path):
+    flow_file_sync = FlowFileSync(polling_interval=0.1, watch=False)
+    broken_flow_id, broken_path = next(iter(flow_files.items()))
+    broken_path.write_text("{not json", encoding="utf-8")
+    missing_flow_id = uuid4()
+    paths = {flow_id: str(path) for flow_id, path in flow_files.items()}
+    paths[missing_flow_id] = str(tmp_path / "missing.json")
+    flow_file_sync.track(paths)
+
+    await flow_file_sync.check(set(paths))
+
+    _, updates = apply_updates.await_args.args
+    assert set(updates) == set(flow_files) - {broken_flow_id}
+
+
+async def test_moved_flow_is_synchronized_again(flow_files, apply_updates, tmp_path):
+    flow_file_sync = FlowFileSync(polling_interval=0.1, watch=False)
+    flow_id, path = next(iter(flow_files.items()))
+    flow_file_sync.track({flow_id: str(path)})
+    await flow_file_sync.check({flow_id})
+
+    moved_path = tmp_path / "moved.json"
+    moved_path.write_bytes(path.read_bytes())
+    os.utime(moved_path, (path.stat().st_atime, path.stat().st_mtime))
+
+    assert flow_file_sync.track({flow_id: str(moved_path)}) == {flow_id}
+    await flow_file_sync.check({flow_id})
+    assert apply_updates.await_count == 2
+
+
+async def test_update_flows_from_files_writes_synced_fields():
+    flow = MagicMock()
+    flow.id = uuid4()
+    folder_id = uuid4()
+    session = AsyncMock()
+    result = MagicMock()
+    result.all.return_value = [flow]
+    session.exec.return_value = result
+
+    await update_flows_from_files(
+        session, {flow.id: {"name": "new name", "description": "", "locked": True, "folder_id": str(folder_id)}}
+    )
+
+    assert flow.name == "new name"
+    assert flow.locked is True
+    assert flow.folder_id == folder_id
+    # Empty values do not overwrite the flow
+    assert flow.description != ""
+    session.flush.assert_awaited_once()
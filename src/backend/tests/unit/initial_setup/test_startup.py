@@ -0,0 +1,106 @@
+import asyncio
+import pstats
+
+import pytest
+from httpx import AsyncClient
+from langflow.initial_setup.startup import StartupStep, get_startup_report, run_startup_steps
+
+
+def _recording_step(name: str, events: list[str], delay: float = 0.0):
+    async def run() -> None:
+        events.append(f"{name}:start")
+        await asyncio.sleep(delay)
+        events.append(f"{name}:end")
+
+    return run
+
+
+async def test_independent_steps_run_concurrently():
+    events: list[str] = []
+    steps = [
+        StartupStep("services", _recording_step("services", events)),
+        StartupStep("types", _recording_step("types", events, 0.1), ("services",)),
+        StartupStep("superuser", _recording_step("superuser", events, 0.1), ("services",)),
+        StartupStep("starter_projects", _recording_step("starter_projects", events), ("types", "superuser")),
+    ]
+
+    report = await run_startup_steps(steps)
+
+    assert events[:2] == ["services:start", "services:end"]
+    # Both independent steps start before either one finishes
+    assert set(events[2:4]) == {"types:start", "superuser:start"}
+    assert events[-2:] == ["starter_projects:start", "starter_projects:end"]
+    assert report.status == "ok"
+    assert get_startup_report() is report
+    steps_by_name = {step.name: step for step in report.steps}
+    assert set(steps_by_name) == {"services", "types", "superuser", "starter_projects"}
+    assert all(step.status == "ok" and step.duration is not None for step in report.steps)
+    assert steps_by_name["starter_projects"].depends_on == ["types", "superuser"]
+    # Run one after the other, the two 100ms steps would take at least 200ms
+    assert report.total_duration < 0.2
+
+
+async def test_failed_step_cancels_dependents_and_raises():
+    events: list[str] = []
+
+    async def fail() -> None:
+        msg = "cannot connect to the database"
+        raise RuntimeError(msg)
+
+    steps = [
+        StartupStep("services", fail),
+        StartupStep("types", _recording_step("types", events), ("services",)),
+        StartupStep("telemetry", _recording_step("telemetry", events, 10)),
+    ]
+
+    with pytest.raises(RuntimeError, match="cannot connect"):
+        await run_startup_steps(steps)
+
+    report = get_startup_report()
+    assert report.status == "failed"
+    assert "types:start" not in events
+    assert "telemetry:end" not in events
+    assert {step.name: step.status for step in report.steps}["services"] == "failed"
+
+
+@pytest.mark.parametrize(
+    ("steps", "message"),
+    [
+        ([StartupStep("a", _recording_step("a", []), ("b",))], "unknown step b"),
+        (
+            [StartupStep("a", _recording_step("a", []), ("b",)), StartupStep("b", _recording_step("b", []), ("a",))],
+            "dependency cycle: a -> b -> a",
+        ),
+        ([StartupStep("a", _recording_step("a", []), ("a",))], "dependency cycle: a -> a"),
+        ([StartupStep("a", _recording_step("a", [])), StartupStep("a", _recording_step("a", []))], "unique"),
+    ],
+)
+async def test_invalid_step_graphs_are_rejected(steps, message):
+    with pytest.raises(ValueError, match=message):
+        await run_startup_steps(steps)
+
+
+async def test_startup_profile_is_written(tmp_path):
+    profile_path = tmp_path / "startup.prof"
+
+    report = await run_startup_steps(
+        [StartupStep("services", _recording_step("services", []))], profile_path=str(profile_path)
+    )
+
+    assert report.profile_path == str(profile_path)
+    assert pstats.Stats(str(profile_path)).total_calls > 0
+
+
+async def test_startup_report_endpoint(client: AsyncClient):
+    response = await client.get("health_check/startup")
+
+    assert response.status_code == 200
+    result = response.json()
+    assert result["status"] == "ok"
+    step_names = {step["name"] for step in result["steps"]}
+    assert {"services", "types", "starter_projects", "flows"} <= step_names
+    # Steps writing to the database once the superuser exists run one after the other
+    depends_on = {step["name"]: step["depends_on"] for step in result["steps"]}
+    assert depends_on["agentic_variables"] == ["starter_projects"]
+    assert "agentic_variables" in depends_on["agentic_mcp"]
+    assert "agentic_mcp" in depends_on["flows"]
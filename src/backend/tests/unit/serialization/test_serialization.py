@@ -1,9 +1,11 @@
 import math
 from datetime import datetime, timezone
 from typing import Any
+from unittest.mock import patch
 
 import numpy as np
 import pandas as pd
+import pytest
 from hypothesis import given, settings
 from hypothesis import strategies as st
 from langchain_core.documents import Document
@@ -327,6 +329,78 @@ class TestSerializationHypothesis:
         assert len(result) == MAX_ITEMS_LENGTH
         assert all("A" in row for row in result)
 
+    def test_pandas_column_wise_serialization(self) -> None:
+        """Test that column-wise DataFrame serialization matches serializing each record."""
+        test_df = pd.DataFrame(
+            {
+                "int": np.arange(4, dtype=np.int64),
+                "bool": [True, False, True, False],
+                "float": [1.5, math.nan, 2.5, 3.5],
+                "text": ["short", "x" * 20, "", "y" * 10],
+                "mixed": [1, "two", None, {"nested": "z" * 20}],
+                "nullable": pd.array([1, None, 3, 4], dtype="Int64"),
+                "when": pd.to_datetime(["2024-01-01", "2024-01-02", "2024-01-03", "2024-01-04"]),
+            }
+        )
+        result = serialize(test_df, max_length=10, max_items=3)
+        expected = serialize(test_df.head(3).to_dict(orient="records"), max_length=10, max_items=3)
+
+        assert [list(row) for row in result] == [list(test_df.columns)] * 3
+        assert result[0]["int"] == 0
+        assert isinstance(result[0]["int"], int)
+        assert result[1]["bool"] is False
+        assert math.isnan(result[1]["float"])
+        assert result[1]["text"] == "x" * 10 + "..."
+        assert len(result) == 3
+        assert result[0]["mixed"] == 1
+        assert result[1]["mixed"] == "two"
+        assert result[2]["mixed"] is None
+        assert result[1]["nullable"] is None
+        assert result[1]["nullable"] == expected[1]["nullable"]
+        assert [row["when"] for row in result] == [row["when"] for row in expected]
+        assert [row["text"] for row in result] == [row["text"] for row in expected]
+
+    def test_pandas_serialization_without_columns(self) -> None:
+        """Test that a DataFrame without columns serializes to empty records."""
+        assert serialize(pd.DataFrame(index=range(3))) == [{}, {}, {}]
+
+    @pytest.mark.benchmark
+    def test_pandas_serialization_large_frame(self) -> None:
+        """Test that a 100k-row frame of numpy and string columns is serialized without per-cell calls."""
+        from langflow.serialization import serialization as serialization_module
+
+        num_rows = 100_000
+        test_df = pd.DataFrame(
+            {
+                "id": np.arange(num_rows),
+                "score": np.random.default_rng(0).random(num_rows),
+                "flag": np.arange(num_rows) % 2 == 0,
+                "text": [f"row {i} " * (i % 5) for i in range(num_rows)],
+            }
+        )
+
+        with patch.object(serialization_module, "serialize", wraps=serialize) as serialize_cell:
+            result = serialize(test_df, max_length=16, max_items=None)
+
+        serialize_cell.assert_not_called()
+        assert result == serialize(test_df.to_dict(orient="records"), max_length=16, max_items=None)
+
+    def test_pandas_nullable_columns_serialize_missing_values_as_none(self) -> None:
+        """Test that pd.NA in nullable extension columns serializes as None, like it does in records."""
+        test_df = pd.DataFrame(
+            {
+                "int": pd.array([1, None], dtype="Int64"),
+                "float": pd.array([1.5, None], dtype="Float64"),
+                "bool": pd.array([True, None], dtype="boolean"),
+                "text": pd.array(["a", None], dtype="string"),
+            }
+        )
+
+        result = serialize(test_df)
+
+        assert result == [{"int": 1, "float": 1.5, "bool": True, "text": "a"}, dict.fromkeys(test_df.columns)]
+        assert result == serialize(test_df.to_dict(orient="records"))
+
     def test_series_serialization(self) -> None:
         """Test serialization of pandas Series."""
         # Test Series
@@ -344,3 +418,70 @@ class TestSerializationHypothesis:
         assert isinstance(result, dict)
         assert len(result) == MAX_ITEMS_LENGTH
         assert all(isinstance(v, int) for v in result.values())
+
+
+class TestSerializerDispatch:
+    """Tests for the per-type serializer cache."""
+
+    def test_serializer_resolved_once_per_type(self) -> None:
+        from langflow.serialization import serialization
+
+        class Payload(dict):
+            pass
+
+        assert serialize(Payload(value="x" * 10), max_length=5) == {"value": "xxxxx..."}
+        assert serialization._serializers_by_type[Payload] is serialization._serialize_dict
+        assert serialize(Payload(value=1)) == {"value": 1}
+
+    def test_subclasses_keep_match_precedence(self) -> None:
+        from enum import Enum, IntEnum
+
+        class Level(IntEnum):
+            LOW = 1
+
+        class Color(str, Enum):
+            RED = "red"
+
+        assert serialize(Level.LOW) is Level.LOW
+        assert serialize(True) is True
+        assert serialize(Color.RED) == "red"
+
+    def test_serializer_cache_is_bounded(self) -> None:
+        from langflow.serialization import serialization
+
+        for i in range(serialization._MAX_CACHED_TYPES + 10):
+            serialize(type(f"Dynamic{i}", (), {})())
+
+        assert len(serialization._serializers_by_type) <= serialization._MAX_CACHED_TYPES
+
+
+def _nested_payloads() -> dict[str, Any]:
+    from lfx.schema.data import Data
+    from lfx.schema.message import Message
+
+    record = {"id": 1, "score": 0.5, "tags": ["a", "b", "c"], "meta": {"source": "test", "page": 3}}
+    data = Data(data={"text": "lorem ipsum " * 20, "records": [dict(record, id=i) for i in range(20)]})
+    message = Message(text="lorem ipsum " * 20, sender="Machine", sender_name="AI", session_id="session")
+    return {
+        "dict": {"outputs": [dict(record, id=i) for i in range(50)], "logs": {"message": "done"}},
+        "data": data,
+        "message": message,
+        "nested": {"results": {"data": [data] * 5, "message": message}, "artifacts": [record] * 10},
+    }
+
+
+@pytest.mark.parametrize("payload_name", ["dict", "data", "message", "nested"])
+def test_serialize_nested_payload_reuses_resolved_serializers(payload_name: str) -> None:
+    """Serializing nested Message, Data and dict payloads like vertex results again resolves no serializer."""
+    from langflow.serialization import serialization as serialization_module
+
+    payload = _nested_payloads()[payload_name]
+    expected = serialize(payload, max_length=MAX_TEXT_LENGTH, max_items=MAX_ITEMS_LENGTH)
+
+    with patch.object(
+        serialization_module, "_resolve_serializer", wraps=serialization_module._resolve_serializer
+    ) as resolve_serializer:
+        result = serialize(payload, max_length=MAX_TEXT_LENGTH, max_items=MAX_ITEMS_LENGTH)
+
+    assert result == expected
+    resolve_serializer.assert_not_called()
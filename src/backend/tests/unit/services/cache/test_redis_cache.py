@@ -0,0 +1,86 @@
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import dill
+import pytest
+from langflow.services.cache.service import RedisCache
+from lfx.services.cache.utils import CACHE_MISS
+
+fakeredis = pytest.importorskip("fakeredis")
+
+
+@pytest.fixture
+def redis_cache():
+    cache = RedisCache(expiration_time=60)
+    cache._client = fakeredis.aioredis.FakeRedis()
+    return cache
+
+
+async def test_set_and_get_round_trip(redis_cache):
+    await redis_cache.set("dict", {"result": [1, 2], "type": list})
+    await redis_cache.set("value", "plain")
+
+    assert await redis_cache.get("dict") == {"result": [1, 2], "type": list}
+    assert await redis_cache.get("value") == "plain"
+    assert await redis_cache.get("missing") is CACHE_MISS
+    assert await redis_cache._client.ttl("dict") > 0
+
+
+async def test_dicts_are_stored_one_field_per_key(redis_cache):
+    await redis_cache.set("key", {"result": "a", "type": str})
+
+    assert set(await redis_cache._client.hkeys("key")) == {b"result", b"type"}
+
+
+async def test_upsert_merges_fields_without_reading(redis_cache):
+    await redis_cache.set("key", {"result": "old", "type": str})
+
+    with (
+        patch.object(redis_cache._client, "get", AsyncMock(side_effect=AssertionError)),
+        patch.object(redis_cache._client, "hgetall", AsyncMock(side_effect=AssertionError)),
+    ):
+        await redis_cache.upsert("key", {"result": "new", "extra": 1})
+
+    assert await redis_cache.get("key") == {"result": "new", "type": str, "extra": 1}
+    assert await redis_cache._client.ttl("key") > 0
+
+
+async def test_upsert_replaces_values_that_are_not_dicts(redis_cache):
+    await redis_cache.set("key", "plain")
+    await redis_cache.upsert("key", {"result": "new"})
+    assert await redis_cache.get("key") == {"result": "new"}
+
+    await redis_cache.upsert("key", "plain again")
+    assert await redis_cache.get("key") == "plain again"
+
+
+async def test_concurrent_upserts_do_not_lose_fields(redis_cache):
+    await asyncio.gather(*(redis_cache.upsert("key", {f"field_{i}": i}) for i in range(20)))
+
+    assert await redis_cache.get("key") == {f"field_{i}": i for i in range(20)}
+
+
+async def test_values_written_before_the_hash_layout(redis_cache):
+    await redis_cache._client.setex("legacy", 60, dill.dumps({"result": "old"}))
+
+    assert await redis_cache.get("legacy") == {"result": "old"}
+
+    await redis_cache.upsert("legacy", {"result": "new"})
+    assert await redis_cache.get("legacy") == {"result": "new"}
+
+
+async def test_delete_and_contains(redis_cache):
+    await redis_cache.set("key", {"result": "a"})
+    assert await redis_cache.contains("key")
+
+    await redis_cache.delete("key")
+    assert not await redis_cache.contains("key")
+
+
+async def test_upsert_with_an_empty_dict_keeps_the_existing_value(redis_cache):
+    await redis_cache.set("key", {"result": "a", "type": str})
+    await redis_cache.upsert("key", {})
+    assert await redis_cache.get("key") == {"result": "a", "type": str}
+
+    await redis_cache.upsert("missing", {})
+    assert await redis_cache.get("missing") == {}
@@ -0,0 +1,121 @@
+import asyncio
+import uuid
+from unittest.mock import patch
+
+import pytest
+from langflow.services.cache.service import AsyncInMemoryCache, RedisCache
+from langflow.services.cache.tiered import TieredCache
+from lfx.services.cache.utils import CACHE_MISS
+
+
+@pytest.fixture
+def backend():
+    return AsyncInMemoryCache()
+
+
+async def test_hot_items_are_served_locally(backend):
+    cache = TieredCache(backend)
+    await cache.set("key", {"result": "value"})
+
+    with patch.object(backend, "get", side_effect=AssertionError("backend should not be read")):
+        assert await cache.get("key") == {"result": "value"}
+
+
+async def test_misses_fall_through_to_the_backend(backend):
+    cache = TieredCache(backend)
+    await backend.set("key", "value")
+
+    assert await cache.get("key") == "value"
+    assert await cache.get("missing") is CACHE_MISS
+    # The backend value is now kept locally
+    await backend.delete("key")
+    assert await cache.get("key") == "value"
+
+
+async def test_local_tier_is_bounded(backend):
+    cache = TieredCache(backend, max_size=2)
+    for key in ("a", "b", "c"):
+        await cache.set(key, key)
+
+    assert list(cache._local) == ["b", "c"]
+    assert await cache.get("a") == "a"
+
+
+async def test_local_items_expire(backend):
+    cache = TieredCache(backend, expiration_time=0.01)
+    await cache.set("key", "old")
+    await backend.set("key", "new")
+    await asyncio.sleep(0.02)
+
+    assert await cache.get("key") == "new"
+
+
+async def test_upsert_merges_local_dicts(backend):
+    cache = TieredCache(backend)
+    await cache.set("key", {"result": "old", "type": str})
+    await cache.upsert("key", {"result": "new"})
+
+    with patch.object(backend, "get", side_effect=AssertionError("backend should not be read")):
+        assert await cache.get("key") == {"result": "new", "type": str}
+    assert await backend.get("key") == {"result": "new", "type": str}
+
+
+async def test_hot_items_are_not_deserialized(backend):
+    cache = TieredCache(backend)
+    value = {"results": {"text": "a"}}
+    await cache.set("key", value)
+
+    assert await cache.get("key") is value
+
+
+async def test_local_items_are_keyed_by_their_string_form(backend):
+    key = uuid.uuid4()
+    cache = TieredCache(backend)
+    await cache.set(key, "value")
+
+    assert list(cache._local) == [str(key)]
+    assert await cache.contains(key)
+    # Invalidation messages carry the key as a string
+    cache.invalidate_local(str(key))
+    assert str(key) not in cache._local
+
+
+async def test_delete_and_clear(backend):
+    cache = TieredCache(backend)
+    await cache.set("a", 1)
+    await cache.set("b", 2)
+
+    await cache.delete("a")
+    assert await cache.get("a") is CACHE_MISS
+
+    await cache.clear()
+    assert await cache.get("b") is CACHE_MISS
+    assert not await cache.contains("b")
+
+
+async def test_redis_workers_invalidate_each_other():
+    fakeredis = pytest.importorskip("fakeredis")
+    server = fakeredis.FakeServer()
+
+    def make_worker():
+        backend = RedisCache(expiration_time=60)
+        backend._client = fakeredis.aioredis.FakeRedis(server=server)
+        return TieredCache(backend)
+
+    first, second = make_worker(), make_worker()
+    try:
+        await first.set("key", {"result": "old"})
+        assert await second.get("key") == {"result": "old"}
+        # Let the second worker subscribe to the invalidation channel
+        await asyncio.sleep(0.1)
+
+        await first.set("key", {"result": "new"})
+        for _ in range(50):
+            if "key" not in second._local:
+                break
+            await asyncio.sleep(0.01)
+
+        assert await second.get("key") == {"result": "new"}
+    finally:
+        await first.teardown()
+        await second.teardown()
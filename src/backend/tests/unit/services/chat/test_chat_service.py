@@ -0,0 +1,94 @@
+import json
+from unittest.mock import patch
+
+import pytest
+from langflow.services.cache.disk import AsyncDiskCache
+from langflow.services.cache.service import AsyncInMemoryCache
+from langflow.services.cache.tiered import TieredCache
+from langflow.services.chat.service import ChatService
+from lfx.graph import Graph
+from lfx.services.cache.utils import CacheMiss
+
+
+def make_chat_service(cache_service) -> ChatService:
+    with patch("langflow.services.chat.service.get_cache_service", return_value=cache_service):
+        return ChatService()
+
+
+@pytest.mark.asyncio
+async def test_serializing_cache_stores_graph_run_state(tmp_path, json_memory_chatbot_no_llm):
+    chat_service = make_chat_service(AsyncDiskCache(tmp_path))
+    graph = Graph.from_payload(json.loads(json_memory_chatbot_no_llm), flow_id="flow", user_id="user")
+    graph.prepare()
+    graph.set_run_id("run")
+    graph.vertices[0].built = True
+    graph.vertices[0].results = {"message": "hello"}
+
+    await chat_service.set_cache("flow", graph)
+
+    stored = await chat_service.cache_service.get("flow")
+    assert stored["run_state"] is True
+    assert isinstance(stored["result"], dict)
+    assert "graph_data" not in stored["result"]
+
+    cached = await chat_service.get_cache("flow")
+    restored = cached["result"]
+    assert isinstance(restored, Graph)
+    assert restored is not graph
+    assert restored.run_id == "run"
+    assert restored.get_vertex(graph.vertices[0].id).results == {"message": "hello"}
+
+    # The template built on the first read is reused for the next ones
+    template = chat_service._graph_templates["flow"]
+    await chat_service.get_cache("flow")
+    assert chat_service._graph_templates["flow"] is template
+
+
+@pytest.mark.asyncio
+async def test_serializing_cache_treats_unreadable_run_state_as_miss(tmp_path, json_memory_chatbot_no_llm):
+    chat_service = make_chat_service(AsyncDiskCache(tmp_path))
+    graph = Graph.from_payload(json.loads(json_memory_chatbot_no_llm), flow_id="flow")
+    await chat_service.set_cache("flow", graph)
+
+    stored = await chat_service.cache_service.get("flow")
+    stored["result"]["version"] = -1
+    await chat_service.cache_service.set("flow", stored)
+
+    assert isinstance(await chat_service.get_cache("flow"), CacheMiss)
+
+
+@pytest.mark.asyncio
+async def test_serializing_cache_treats_run_state_of_unknown_payload_as_miss(tmp_path, json_memory_chatbot_no_llm):
+    cache_service = AsyncDiskCache(tmp_path)
+    graph = Graph.from_payload(json.loads(json_memory_chatbot_no_llm), flow_id="flow")
+    await make_chat_service(cache_service).set_cache("flow", graph)
+
+    # Another process sharing the cache does not have the payload the snapshot was taken from
+    assert isinstance(await make_chat_service(cache_service).get_cache("flow"), CacheMiss)
+
+
+@pytest.mark.asyncio
+async def test_graphs_restored_from_tiered_cache_do_not_share_state(json_memory_chatbot_no_llm):
+    chat_service = make_chat_service(TieredCache(AsyncInMemoryCache()))
+    graph = Graph.from_payload(json.loads(json_memory_chatbot_no_llm), flow_id="flow")
+    graph.prepare()
+    vertex_id = graph.vertices[0].id
+    graph.vertices[0].built = True
+    graph.vertices[0].results = {"message": "hello"}
+    await chat_service.set_cache("flow", graph)
+
+    first = (await chat_service.get_cache("flow"))["result"]
+    first.get_vertex(vertex_id).results["message"] = "changed"
+
+    second = (await chat_service.get_cache("flow"))["result"]
+    assert second.get_vertex(vertex_id).results == {"message": "hello"}
+
+
+@pytest.mark.asyncio
+async def test_in_memory_cache_keeps_graph_instance(json_memory_chatbot_no_llm):
+    chat_service = make_chat_service(AsyncInMemoryCache())
+    graph = Graph.from_payload(json.loads(json_memory_chatbot_no_llm), flow_id="flow")
+
+    await chat_service.set_cache("flow", graph)
+
+    assert (await chat_service.get_cache("flow"))["result"] is graph
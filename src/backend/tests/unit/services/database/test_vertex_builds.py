@@ -1,10 +1,18 @@
+import asyncio
+from contextlib import asynccontextmanager
 from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
 from unittest.mock import patch
 from uuid import uuid4
 
 import pytest
-from langflow.services.database.models.vertex_builds.crud import log_vertex_build
+from langflow.services.database.models.vertex_builds.crud import (
+    bulk_log_vertex_builds,
+    log_vertex_build,
+    prune_vertex_builds,
+)
 from langflow.services.database.models.vertex_builds.model import VertexBuildBase, VertexBuildTable
+from langflow.services.vertex_build_logger.service import VertexBuildLoggerService
 from lfx.services.settings.base import Settings
 from sqlalchemy import delete, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -314,3 +322,70 @@ async def test_concurrent_log_vertex_build(vertex_build_data, mock_settings):
         async with AsyncSession(engine) as session:
             count = await session.scalar(select(func.count()).select_from(VertexBuildTable))
             assert count <= mock_settings.max_vertex_builds_to_keep
+
+
+@pytest.mark.asyncio
+async def test_prune_vertex_builds_enforces_limits(async_session: AsyncSession, timestamp_generator):
+    """Test that bulk inserted builds are trimmed to the per-vertex and global limits."""
+    flow_id = uuid4()
+    vertex_ids = [str(uuid4()) for _ in range(3)]
+    builds = [
+        VertexBuildBase(id=vertex_id, flow_id=flow_id, timestamp=timestamp_generator(i * 10 + j), valid=True)
+        for i, vertex_id in enumerate(vertex_ids)
+        for j in range(4)
+    ]
+
+    await bulk_log_vertex_builds(async_session, builds)
+    assert await async_session.scalar(select(func.count()).select_from(VertexBuildTable)) == len(builds)
+
+    await prune_vertex_builds(async_session, max_builds_to_keep=5, max_builds_per_vertex=2)
+
+    remaining = (await async_session.execute(select(VertexBuildTable.id, VertexBuildTable.timestamp))).all()
+    assert len(remaining) == 5
+    assert [sum(1 for row in remaining if row.id == vertex_id) for vertex_id in vertex_ids] == [1, 2, 2]
+    # Only the oldest of the builds kept per vertex is dropped by the global limit
+    assert min(row.timestamp for row in remaining).replace(tzinfo=timezone.utc) == timestamp_generator(3)
+
+
+@pytest.mark.asyncio
+async def test_vertex_build_logger_service_buffers_and_flushes(async_session: AsyncSession, mock_settings):
+    """Test that the write-behind logger writes builds in batches and prunes on stop."""
+
+    @asynccontextmanager
+    async def fake_session_scope():
+        yield async_session
+
+    settings = mock_settings.model_copy(
+        update={"vertex_build_flush_interval": 60, "vertex_build_batch_size": 4, "vertex_build_prune_interval": 60}
+    )
+    service = VertexBuildLoggerService(SimpleNamespace(settings=settings))
+    flow_id = uuid4()
+    vertex_id = str(uuid4())
+
+    async def count_builds():
+        return await async_session.scalar(select(func.count()).select_from(VertexBuildTable))
+
+    with (
+        patch("langflow.services.vertex_build_logger.service.session_scope", fake_session_scope),
+        patch("langflow.services.database.models.vertex_builds.crud.get_settings_service") as mock_settings_service,
+    ):
+        mock_settings_service.return_value.settings = settings
+
+        for _ in range(3):
+            await service.log_vertex_build(VertexBuildBase(id=vertex_id, flow_id=flow_id, valid=True))
+        assert await count_builds() == 0
+
+        other_flow_id = uuid4()
+        await service.log_vertex_build(VertexBuildBase(id=vertex_id, flow_id=other_flow_id, valid=True))
+        service.discard(other_flow_id)
+        await service.log_vertex_build(VertexBuildBase(id=vertex_id, flow_id=flow_id, valid=True))
+        # Reaching the batch size wakes the worker up
+        for _ in range(10):
+            await asyncio.sleep(0.05)
+            if await count_builds():
+                break
+        assert await count_builds() == 4
+
+        await service.stop()
+
+    assert await count_builds() == settings.max_vertex_builds_per_vertex
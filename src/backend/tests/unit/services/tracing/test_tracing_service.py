@@ -440,13 +440,80 @@ async def test_trace_worker_with_exception(tracing_service):
         # Wait for async queue processing
         await asyncio.sleep(0.1)
 
-        # Verify exception was logged
-        mock_logger.aexception.assert_called_with("Error processing trace_func")
+        # Verify exception was logged by the export thread
+        mock_logger.exception.assert_called_with("Error processing trace_func")
+        assert tracing_service.export_stats()["failed"] == 1
 
         # Cleanup
         await tracing_service.end_tracers({})
 
 
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("mock_tracers")
+async def test_trace_callbacks_run_off_the_event_loop(tracing_service, mock_component):
+    """Tracer callbacks run in export threads, not on the event loop thread."""
+    import threading
+
+    await tracing_service.start_tracers(uuid.uuid4(), "test_run", "test_user", "test_session", "test_project")
+    trace_context = trace_context_var.get()
+    callback_threads = []
+    trace_context.tracers["langsmith"].add_trace = lambda *_args: callback_threads.append(threading.current_thread())
+
+    async with tracing_service.trace_component(mock_component, "test_component_trace", {}):
+        pass
+    await tracing_service.end_tracers({})
+
+    assert callback_threads
+    assert threading.current_thread() not in callback_threads
+    assert tracing_service.export_stats()["exported"] == 2
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("mock_tracers")
+async def test_trace_component_drops_spans_when_queue_is_full(mock_settings_service, mock_component):
+    """Spans are dropped, start and end together, once a run's export queue is full."""
+    mock_settings_service.settings.tracing_queue_size = 1
+    tracing_service = TracingService(mock_settings_service)
+    await tracing_service.start_tracers(uuid.uuid4(), "test_run", "test_user", "test_session", "test_project")
+    trace_context = trace_context_var.get()
+    # Keep the worker from draining the queue
+    trace_context.worker_task.cancel()
+    trace_context.traces_queue.put_nowait((lambda: None, ()))
+
+    async with tracing_service.trace_component(mock_component, "test_component_trace", {}):
+        assert component_context_var.get().dropped
+
+    # Both callbacks of the span are dropped
+    assert tracing_service.export_stats()["dropped"] == 2
+    assert trace_context.traces_queue.qsize() == 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("mock_tracers")
+async def test_trace_component_never_drops_the_end_of_a_queued_span(mock_settings_service, mock_component):
+    """The end of a span is queued even when the queue filled up after its start was queued."""
+    mock_settings_service.settings.tracing_queue_size = 1
+    tracing_service = TracingService(mock_settings_service)
+    await tracing_service.start_tracers(uuid.uuid4(), "test_run", "test_user", "test_session", "test_project")
+    trace_context = trace_context_var.get()
+    trace_context.worker_task.cancel()
+
+    with pytest.raises(ValueError, match="component failed"):
+        async with tracing_service.trace_component(mock_component, "test_component_trace", {}):
+            assert not component_context_var.get().dropped
+            assert trace_context.traces_queue.qsize() == 1
+            msg = "component failed"
+            raise ValueError(msg)
+
+    queued = [trace_context.traces_queue.get_nowait() for _ in range(trace_context.traces_queue.qsize())]
+    assert [trace_func for trace_func, _ in queued] == [
+        tracing_service._start_component_traces,
+        tracing_service._end_component_traces,
+    ]
+    assert isinstance(queued[1][1][2], ValueError)
+    assert tracing_service.export_stats() == {"queued": 2, "dropped": 0, "exported": 0, "failed": 0}
+
+
 @pytest.mark.asyncio
 @pytest.mark.usefixtures("mock_tracers")
 async def test_concurrent_tracing(tracing_service, mock_component):
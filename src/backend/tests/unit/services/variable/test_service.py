@@ -240,3 +240,85 @@ async def test_create_variable(service, session: AsyncSession):
     assert result.type == CREDENTIAL_TYPE
     assert isinstance(result.created_at, datetime)
     assert result.updated_at is None  # Should be None on creation
+
+
+async def test_get_variable__served_from_cache_until_updated(service, session: AsyncSession):
+    user_id = uuid4()
+    name = "name"
+    field = ""
+    await service.create_variable(user_id, name, "value", session=session)
+    assert await service.get_variable(user_id, name, field, session=session) == "value"
+
+    with patch.object(service, "get_variable_object") as get_variable_object:
+        assert await service.get_variable(user_id, name, field, session=session) == "value"
+    get_variable_object.assert_not_called()
+
+    await service.update_variable(user_id, name, "new_value", session=session)
+    assert await service.get_variable(user_id, name, field, session=session) == "new_value"
+
+
+async def test_get_variable__cached_credential_rejected_for_session_id(service, session: AsyncSession):
+    user_id = uuid4()
+    name = "name"
+    await service.create_variable(user_id, name, "value", type_=CREDENTIAL_TYPE, session=session)
+    await service.get_variable(user_id, name, "", session=session)
+
+    with pytest.raises(TypeError, match="purpose is to prevent the exposure of value"):
+        await service.get_variable(user_id, name, "session_id", session=session)
+
+
+async def test_prefetch_variables(service, session: AsyncSession):
+    user_id = uuid4()
+    for i in range(3):
+        await service.create_variable(user_id, f"name{i}", f"value{i}", session=session)
+
+    await service.prefetch_variables(user_id, ["name0", "name1", "name2", "missing"], session=session)
+
+    with patch.object(service, "get_variable_object") as get_variable_object:
+        values = [await service.get_variable(user_id, f"name{i}", "", session=session) for i in range(3)]
+    assert values == ["value0", "value1", "value2"]
+    get_variable_object.assert_not_called()
+    with pytest.raises(ValueError, match="missing variable not found."):
+        await service.get_variable(user_id, "missing", "", session=session)
+
+
+async def test_prefetch_variables__disabled_cache(service, session: AsyncSession):
+    user_id = uuid4()
+    await service.create_variable(user_id, "name", "value", session=session)
+    service.settings_service.settings.variable_cache_ttl = 0
+    try:
+        await service.prefetch_variables(user_id, ["name"], session=session)
+        await service.get_variable(user_id, "name", "", session=session)
+        assert service._get_cached_value(user_id, "name") is None
+    finally:
+        service.settings_service.settings.variable_cache_ttl = 30.0
+
+
+async def test_update_variable_fields__invalidates_cache(service, session: AsyncSession):
+    user_id = uuid4()
+    saved = await service.create_variable(user_id, "name", "value", session=session)
+    await service.get_variable(user_id, "name", "", session=session)
+
+    await service.update_variable_fields(
+        user_id=user_id,
+        variable_id=saved.id,
+        variable=VariableUpdate(id=saved.id, name="name", value="new_value"),
+        session=session,
+    )
+
+    assert await service.get_variable(user_id, "name", "", session=session) == "new_value"
+
+
+async def test_update_variable__invalidates_cache_again_after_commit(service, session: AsyncSession):
+    user_id = uuid4()
+    await service.create_variable(user_id, "name", "value", session=session)
+    await session.commit()
+
+    await service.update_variable(user_id, "name", "new_value", session=session)
+    # A concurrent read of the committed row before the update commits caches the old value again
+    service._cache_value(user_id, "name", None, "value")
+
+    await session.commit()
+
+    assert service._get_cached_value(user_id, "name") is None
+    assert await service.get_variable(user_id, "name", "", session=session) == "new_value"
@@ -5,16 +5,21 @@ This module tests the check_key function behavior when:
 - API_KEY_SOURCE='env': Validates against LANGFLOW_API_KEY environment variable
 """
 
+from datetime import datetime, timezone
 from unittest.mock import AsyncMock, MagicMock, patch
 from uuid import uuid4
 
 import pytest
+from langflow.services.api_key.service import ApiKeyService
 from langflow.services.database.models.api_key.crud import (
     _check_key_from_db,
     _check_key_from_env,
+    add_api_key_uses,
     check_key,
+    delete_api_key,
 )
 from langflow.services.database.models.user.model import User
+from sqlmodel import Session, create_engine
 
 
 @pytest.fixture
@@ -50,6 +55,19 @@ def mock_inactive_user():
     return user
 
 
+@pytest.fixture(autouse=True)
+def api_key_service():
+    """Give every test an empty API key cache whose usage counters are never written to a database."""
+    settings_service = MagicMock()
+    settings_service.settings.api_key_cache_ttl = 10.0
+    settings_service.settings.api_key_cache_max_size = 100
+    settings_service.settings.api_key_usage_flush_interval = 60.0
+    service = ApiKeyService(settings_service)
+    service.record_use = AsyncMock()
+    with patch("langflow.services.database.models.api_key.crud.get_api_key_service", return_value=service):
+        yield service
+
+
 @pytest.fixture
 def mock_session():
     """Create a mock async database session."""
@@ -210,7 +228,6 @@ class TestCheckKeyFromDb:
         result = await _check_key_from_db(mock_session, "sk-valid-key", mock_settings_service_db)
 
         assert result == mock_user
-        assert mock_api_key.total_uses == 1
 
     @pytest.mark.asyncio
     async def test_invalid_key_returns_none(self, mock_session, mock_settings_service_db):
@@ -224,8 +241,8 @@ class TestCheckKeyFromDb:
         assert result is None
 
     @pytest.mark.asyncio
-    async def test_usage_tracking_increments(self, mock_session, mock_user, mock_settings_service_db):
-        """API key usage should be tracked when not disabled."""
+    async def test_usage_tracking_increments(self, mock_session, mock_user, mock_settings_service_db, api_key_service):
+        """API key usage should be counted by the API key service instead of written on every request."""
         mock_api_key = MagicMock()
         mock_api_key.user = mock_user
         mock_api_key.total_uses = 5
@@ -236,12 +253,13 @@ class TestCheckKeyFromDb:
 
         await _check_key_from_db(mock_session, "sk-valid-key", mock_settings_service_db)
 
-        assert mock_api_key.total_uses == 6
-        mock_session.add.assert_called_once_with(mock_api_key)
-        mock_session.flush.assert_called_once()
+        assert mock_api_key.total_uses == 5
+        api_key_service.record_use.assert_awaited_once_with(mock_api_key.id)
+        mock_session.add.assert_not_called()
+        mock_session.flush.assert_not_called()
 
     @pytest.mark.asyncio
-    async def test_usage_tracking_disabled(self, mock_session, mock_user, mock_settings_service_db):
+    async def test_usage_tracking_disabled(self, mock_session, mock_user, mock_settings_service_db, api_key_service):
         """API key usage should not be tracked when disabled."""
         mock_settings_service_db.settings.disable_track_apikey_usage = True
 
@@ -257,6 +275,7 @@ class TestCheckKeyFromDb:
 
         assert mock_api_key.total_uses == 5  # Not incremented
         mock_session.add.assert_not_called()
+        api_key_service.record_use.assert_not_awaited()
 
     @pytest.mark.asyncio
     async def test_empty_key_returns_none(self, mock_session, mock_settings_service_db):
@@ -430,6 +449,151 @@ class TestCheckKeyFromEnv:
             assert result == mock_superuser
 
 
+# ============================================================================
+# API key cache and usage counter tests
+# ============================================================================
+
+
+def _db_user() -> User:
+    return User(id=uuid4(), username="cached", password="hashed", is_active=True, optins={"github_starred": False})
+
+
+def _api_key_result(user: User) -> MagicMock:
+    api_key = MagicMock()
+    api_key.id = uuid4()
+    api_key.user = user
+    result = MagicMock()
+    result.first.return_value = api_key
+    return result
+
+
+class TestApiKeyCache:
+    """Tests for the cache of validated API keys."""
+
+    @pytest.mark.asyncio
+    async def test_cached_key_skips_the_database(self, mock_session, mock_settings_service_db, api_key_service):
+        """A key validated once should be served from the cache and attached to the session without a query."""
+        user = _db_user()
+        mock_session.exec.return_value = _api_key_result(user)
+        mock_session.merge.side_effect = lambda instance, **_: instance
+
+        first = await _check_key_from_db(mock_session, "sk-cached-key", mock_settings_service_db)
+        second = await _check_key_from_db(mock_session, "sk-cached-key", mock_settings_service_db)
+
+        assert first is user
+        assert mock_session.exec.await_count == 1
+        mock_session.merge.assert_awaited_once()
+        assert mock_session.merge.await_args.kwargs == {"load": False}
+        assert second is not user
+        assert (second.id, second.username, second.is_active) == (user.id, user.username, user.is_active)
+        second.optins["github_starred"] = True
+        assert user.optins["github_starred"] is False
+        assert api_key_service.record_use.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_deleted_key_is_evicted(self, mock_session, mock_settings_service_db, api_key_service):
+        """Deleting a key should remove it from the cache."""
+        mock_session.exec.return_value = _api_key_result(_db_user())
+        api_key_id = mock_session.exec.return_value.first.return_value.id
+        await _check_key_from_db(mock_session, "sk-deleted-key", mock_settings_service_db)
+        assert api_key_service.get_cached_key("sk-deleted-key") is not None
+
+        mock_session.get.return_value = MagicMock()
+        with patch("langflow.services.api_key.service.run_after_commit") as run_after_commit:
+            await delete_api_key(mock_session, api_key_id)
+
+        assert api_key_service.get_cached_key("sk-deleted-key") is None
+        # A request authenticated before the delete is committed caches the key again
+        await _check_key_from_db(mock_session, "sk-deleted-key", mock_settings_service_db)
+        assert api_key_service.get_cached_key("sk-deleted-key") is not None
+        session, after_commit = run_after_commit.call_args.args
+        assert session is mock_session
+        after_commit()
+        assert api_key_service.get_cached_key("sk-deleted-key") is None
+
+    def test_keys_are_invalidated_again_after_commit(self, api_key_service):
+        """Keys cached again while a change is not committed should be dropped once it is."""
+        user_id = uuid4()
+        engine = create_engine("sqlite://")
+        with Session(engine) as session:
+            api_key_service.invalidate_user(user_id, session=session)
+            api_key_service.cache_key("sk-stale", uuid4(), user_id, {"id": user_id})
+            assert api_key_service.get_cached_key("sk-stale") is not None
+
+            session.commit()
+
+        assert api_key_service.get_cached_key("sk-stale") is None
+
+    @pytest.mark.asyncio
+    async def test_cache_disabled_queries_every_time(self, mock_session, mock_settings_service_db, api_key_service):
+        """With a TTL of 0 every request should look the key up in the database."""
+        api_key_service.cache_ttl = 0
+        mock_session.exec.return_value = _api_key_result(_db_user())
+
+        await _check_key_from_db(mock_session, "sk-uncached-key", mock_settings_service_db)
+        await _check_key_from_db(mock_session, "sk-uncached-key", mock_settings_service_db)
+
+        assert mock_session.exec.await_count == 2
+        mock_session.merge.assert_not_awaited()
+
+    def test_cache_is_bounded_and_invalidated_by_user(self, api_key_service):
+        """The cache should evict the least recently used keys and drop the keys of a changed user."""
+        api_key_service.cache_max_size = 2
+        user_id = uuid4()
+        api_key_service.cache_key("sk-a", uuid4(), user_id, {"id": user_id})
+        api_key_service.cache_key("sk-b", uuid4(), uuid4(), {})
+        assert api_key_service.get_cached_key("sk-a") is not None
+        api_key_service.cache_key("sk-c", uuid4(), uuid4(), {})
+
+        assert api_key_service.get_cached_key("sk-b") is None
+        assert api_key_service.get_cached_key("sk-c") is not None
+        api_key_service.invalidate_user(user_id)
+        assert api_key_service.get_cached_key("sk-a") is None
+
+
+class TestApiKeyUsage:
+    """Tests for the aggregation of API key usage counters."""
+
+    @pytest.mark.asyncio
+    async def test_uses_are_written_in_one_batch(self):
+        """Uses should be counted in memory and written together when the service stops."""
+        settings_service = MagicMock()
+        settings_service.settings.api_key_cache_ttl = 10.0
+        settings_service.settings.api_key_cache_max_size = 100
+        settings_service.settings.api_key_usage_flush_interval = 60.0
+        service = ApiKeyService(settings_service)
+        first, second = uuid4(), uuid4()
+
+        with (
+            patch("langflow.services.api_key.service.session_scope"),
+            patch("langflow.services.api_key.service.add_api_key_uses", new_callable=AsyncMock) as add_uses,
+        ):
+            for api_key_id in (first, first, second):
+                await service.record_use(api_key_id)
+            add_uses.assert_not_awaited()
+            await service.stop()
+
+        add_uses.assert_awaited_once()
+        _, uses = add_uses.await_args.args
+        assert {api_key_id: count for api_key_id, (count, _) in uses.items()} == {first: 2, second: 1}
+
+    @pytest.mark.asyncio
+    async def test_add_api_key_uses_runs_one_update(self, mock_session):
+        """The counters of several keys should be incremented by a single executemany UPDATE."""
+        first, second = uuid4(), uuid4()
+        now = datetime.now(timezone.utc)
+
+        await add_api_key_uses(mock_session, {first: (2, now), second: (1, now)})
+
+        mock_session.exec.assert_awaited_once()
+        statement = mock_session.exec.await_args.args[0]
+        assert "apikey.total_uses + :b_uses" in str(statement)
+        assert mock_session.exec.await_args.kwargs["params"] == [
+            {"b_id": first, "b_uses": 2, "b_last_used_at": now},
+            {"b_id": second, "b_uses": 1, "b_last_used_at": now},
+        ]
+
+
 # ============================================================================
 # Edge cases and error handling
 # ============================================================================
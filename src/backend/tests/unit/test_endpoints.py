@@ -1,12 +1,15 @@
 import asyncio
 import json
+from pathlib import Path
 from uuid import UUID, uuid4
 
 import orjson
 import pytest
 from fastapi import status
 from httpx import AsyncClient
+from langflow.initial_setup.fs_flow_sync import FlowFileSync
 from langflow.services.database.models.flow.model import FlowCreate
+from langflow.services.deps import get_storage_service
 from lfx.custom.directory_reader.directory_reader import DirectoryReader
 from lfx.services.settings.base import BASE_COMPONENTS_PATH
 
@@ -550,6 +553,36 @@ async def test_successful_run_with_input_type_any(client, simple_api_test, creat
     )
 
 
+async def test_run_serves_flow_edited_through_its_file(client, simple_api_test, created_api_key, logged_in_headers):
+    headers = {"x-api-key": created_api_key.api_key}
+    flow_id = simple_api_test["id"]
+    fs_path = f"{uuid4()}.json"
+    response = await client.patch(f"api/v1/flows/{flow_id}", json={"fs_path": fs_path}, headers=logged_in_headers)
+    assert response.status_code == status.HTTP_200_OK, response.text
+
+    async def run_text_input() -> str:
+        payload = {"input_type": "text", "output_type": "debug"}
+        response = await client.post(f"/api/v1/run/{flow_id}", headers=headers, json=payload)
+        assert response.status_code == status.HTTP_200_OK, response.text
+        outputs = response.json()["outputs"][0]["outputs"]
+        text_input_output = next(output for output in outputs if "TextInput" in output["component_id"])
+        return text_input_output["results"]["text"]["text"]
+
+    assert await run_text_input() == "AI"
+
+    flow_path = Path(get_storage_service().data_dir) / "flows" / simple_api_test["user_id"] / fs_path
+    flow_file = orjson.loads(flow_path.read_bytes())
+    for node in flow_file["data"]["nodes"]:
+        if node["data"]["type"] == "TextInput":
+            node["data"]["node"]["template"]["input_value"]["value"] = "edited in the file"
+    flow_path.write_bytes(orjson.dumps(flow_file))
+    flow_file_sync = FlowFileSync(polling_interval=0.1, watch=False)
+    await flow_file_sync.refresh()
+    await flow_file_sync.check({UUID(flow_id)})
+
+    assert await run_text_input() == "edited in the file"
+
+
 async def test_invalid_flow_id(client, created_api_key):
     headers = {"x-api-key": created_api_key.api_key}
     flow_id = "invalid-flow-id"
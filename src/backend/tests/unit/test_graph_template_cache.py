@@ -0,0 +1,84 @@
+from datetime import datetime, timezone
+
+from langflow.processing.graph_cache import GraphTemplateCache, fingerprint_tweaks
+
+
+class FakeGraph:
+    def __init__(self, name: str):
+        self.name = name
+        self.clones: list[dict] = []
+
+    def clone(self, *, user_id=None, context=None):
+        self.clones.append({"user_id": user_id, "context": context})
+        return FakeGraph(f"{self.name}-clone")
+
+
+def test_fingerprint_tweaks_is_order_independent():
+    first = fingerprint_tweaks({"a": {"x": 1}, "b": {"y": 2}})
+    second = fingerprint_tweaks({"b": {"y": 2}, "a": {"x": 1}})
+
+    assert first == second
+    assert first != fingerprint_tweaks({"a": {"x": 1}, "b": {"y": 2}}, stream=True)
+
+
+def test_template_is_built_once_and_cloned_per_request():
+    cache = GraphTemplateCache()
+    template = FakeGraph("template")
+    builds = []
+
+    def build():
+        builds.append(1)
+        return template
+
+    key = cache.make_key("flow", datetime(2025, 1, 1, tzinfo=timezone.utc), "user", fingerprint_tweaks({}))
+    first = cache.get_graph(key, build, user_id="user", context={"a": 1})
+    second = cache.get_graph(key, build, user_id="user")
+
+    assert len(builds) == 1
+    assert first is not template
+    assert second is not template
+    assert template.clones == [{"user_id": "user", "context": {"a": 1}}, {"user_id": "user", "context": None}]
+    assert cache.stats() == {"size": 1, "max_size": cache.max_size, "hits": 1, "misses": 1}
+
+
+def test_updated_at_changes_key():
+    cache = GraphTemplateCache()
+    before = cache.make_key("flow", datetime(2025, 1, 1, tzinfo=timezone.utc), "user", "tweaks")
+    after = cache.make_key("flow", datetime(2025, 1, 2, tzinfo=timezone.utc), "user", "tweaks")
+
+    assert before != after
+
+
+def test_invalidate_drops_all_templates_of_flow():
+    cache = GraphTemplateCache()
+    cache.get_graph(cache.make_key("flow", None, "user", "a"), lambda: FakeGraph("a"))
+    cache.get_graph(cache.make_key("flow", None, "user", "b"), lambda: FakeGraph("b"))
+    cache.get_graph(cache.make_key("other", None, "user", "a"), lambda: FakeGraph("c"))
+
+    assert cache.invalidate("flow") == 2
+    assert len(cache) == 1
+
+
+def test_cache_evicts_least_recently_used():
+    cache = GraphTemplateCache(max_size=1)
+    cache.get_graph(cache.make_key("flow", None, "user", "a"), lambda: FakeGraph("a"))
+    cache.get_graph(cache.make_key("other", None, "user", "a"), lambda: FakeGraph("b"))
+
+    assert len(cache) == 1
+    assert cache.invalidate("flow") == 0
+
+
+def test_disabled_cache_builds_every_time():
+    cache = GraphTemplateCache(max_size=0)
+    builds = []
+
+    def build():
+        builds.append(1)
+        return FakeGraph("template")
+
+    key = cache.make_key("flow", None, "user", "a")
+    cache.get_graph(key, build)
+    cache.get_graph(key, build)
+
+    assert len(builds) == 2
+    assert len(cache) == 0
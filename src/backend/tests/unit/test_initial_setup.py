@@ -14,6 +14,7 @@ from httpx import AsyncClient
 from langflow.initial_setup.constants import STARTER_FOLDER_NAME
 from langflow.initial_setup.setup import (
     copy_profile_pictures,
+    create_or_update_starter_projects,
     detect_github_url,
     get_project_data,
     load_bundles_from_urls,
@@ -80,6 +81,43 @@ async def test_create_or_update_starter_projects():
         assert num_db_projects == num_projects
 
 
+async def _starter_flows() -> dict[str, tuple[uuid.UUID, str | None]]:
+    async with session_scope() as session:
+        stmt = select(Folder).options(selectinload(Folder.flows)).where(Folder.name == STARTER_FOLDER_NAME)
+        folder = (await session.exec(stmt)).first()
+        return {flow.name: (flow.id, flow.starter_project_fingerprint) for flow in folder.flows}
+
+
+@pytest.mark.usefixtures("client")
+async def test_create_or_update_starter_projects_skips_unchanged_projects():
+    all_types = await get_and_cache_all_types_dict(get_settings_service())
+    await create_or_update_starter_projects(all_types)
+    flows = await _starter_flows()
+    assert all(fingerprint for _, fingerprint in flows.values())
+
+    # Pretend one project changed since it was written to the database
+    changed_name = sorted(flows)[0]
+    async with session_scope() as session:
+        changed_flow = await session.get(Flow, flows[changed_name][0])
+        changed_flow.starter_project_fingerprint = "outdated"
+        session.add(changed_flow)
+    with patch(
+        "langflow.initial_setup.setup.update_projects_components_with_latest_component_versions",
+        wraps=update_projects_components_with_latest_component_versions,
+    ) as update_components:
+        await create_or_update_starter_projects(all_types)
+
+    assert update_components.call_count == 1
+    new_flows = await _starter_flows()
+    assert set(new_flows) == set(flows)
+    assert new_flows[changed_name][0] != flows[changed_name][0]
+    # The rebuilt project gets its fingerprint back and the other projects are left untouched
+    assert new_flows[changed_name][1] == flows[changed_name][1]
+    assert {name: flow for name, flow in new_flows.items() if name != changed_name} == {
+        name: flow for name, flow in flows.items() if name != changed_name
+    }
+
+
 # Some starter projects require integration
 # async def test_starter_projects_can_run_successfully(client):
 #     with session_scope() as session:
@@ -281,7 +319,12 @@ def set_fs_flows_polling_interval():
     os.unsetenv("LANGFLOW_FS_FLOWS_POLLING_INTERVAL")
 
 
-@pytest.mark.usefixtures("set_fs_flows_polling_interval")
+@pytest.fixture(params=[True, False], ids=["watch", "poll"])
+def set_fs_flows_watch(request, monkeypatch):
+    monkeypatch.setenv("LANGFLOW_FS_FLOWS_WATCH", str(request.param).lower())
+
+
+@pytest.mark.usefixtures("set_fs_flows_polling_interval", "set_fs_flows_watch")
 async def test_sync_flows_from_fs(client: AsyncClient, logged_in_headers):
     # Use a relative path which will be placed in the user's flows directory
     # The path validation requires paths to be within the user's flows directory for security
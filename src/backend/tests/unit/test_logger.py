@@ -4,7 +4,7 @@ This test suite covers all aspects of the logger module including:
 - configure() function with all parameters and edge cases
 - InterceptHandler class functionality
 - setup_uvicorn_logger() and setup_gunicorn_logger() functions
-- Log processor functions (add_serialized, buffer_writer, etc.)
+- Log processor functions (buffer_writer, remove_exception_in_production, etc.)
 - Edge cases and error conditions
 - The specific CRITICAL + 1 bug that was fixed
 """
@@ -25,7 +25,6 @@ from lfx.log.logger import (
     VALID_LOG_LEVELS,
     InterceptHandler,
     SizedLogBuffer,
-    add_serialized,
     buffer_writer,
     configure,
     log_buffer,
@@ -473,32 +472,6 @@ class TestSetupFunctions:
 class TestLogProcessors:
     """Test suite for log processor functions."""
 
-    def test_add_serialized_with_buffer_disabled(self):
-        """Test add_serialized() when log buffer is disabled."""
-        event_dict = {"timestamp": 1625097600.123, "event": "Test message", "module": "test_module"}
-
-        with patch.object(log_buffer, "enabled", return_value=False):
-            result = add_serialized(None, "info", event_dict)
-
-        # Should return event_dict unchanged when buffer is disabled
-        assert result == event_dict
-        assert "serialized" not in result
-
-    def test_add_serialized_with_buffer_enabled(self):
-        """Test add_serialized() when log buffer is enabled."""
-        event_dict = {"timestamp": 1625097600.123, "event": "Test message", "module": "test_module"}
-
-        with patch.object(log_buffer, "enabled", return_value=True):
-            result = add_serialized(None, "info", event_dict)
-
-        # Should add serialized field when buffer is enabled
-        assert "serialized" in result
-        serialized_data = json.loads(result["serialized"])
-        assert serialized_data["timestamp"] == 1625097600.123
-        assert serialized_data["message"] == "Test message"
-        assert serialized_data["level"] == "INFO"
-        assert serialized_data["module"] == "test_module"
-
     def test_remove_exception_in_production(self):
         """Test remove_exception_in_production() removes exception info in prod."""
         event_dict = {"event": "Test message", "exception": "Some exception", "exc_info": "Some exc info"}
@@ -537,39 +510,26 @@ class TestLogProcessors:
 
         with (
             patch.object(log_buffer, "enabled", return_value=False),
-            patch.object(log_buffer, "write") as mock_write,
+            patch.object(log_buffer, "append") as mock_append,
         ):
             result = buffer_writer(None, "info", event_dict)
 
         # Should not write to buffer when disabled
-        mock_write.assert_not_called()
+        mock_append.assert_not_called()
         assert result == event_dict
 
     def test_buffer_writer_with_buffer_enabled(self):
-        """Test buffer_writer() when log buffer is enabled."""
-        import orjson
-
-        # Simulate what add_serialized does - creates a serialized field
-        subset = {
-            "timestamp": 1625097600.123,
-            "message": "Test message",
-            "level": "INFO",
-            "module": "test_module",
-        }
-        event_dict = {"event": "Test message", "serialized": orjson.dumps(subset)}
+        """Test buffer_writer() takes the entry straight from the event dict."""
+        event_dict = {"event": "Test message", "timestamp": "2021-07-01T12:00:00.123Z"}
 
         with (
             patch.object(log_buffer, "enabled", return_value=True),
-            patch.object(log_buffer, "write") as mock_write,
+            patch.object(log_buffer, "append") as mock_append,
         ):
             result = buffer_writer(None, "info", event_dict)
 
         # Should write to buffer when enabled
-        mock_write.assert_called_once()
-        call_args = mock_write.call_args[0]
-        written_data = json.loads(call_args[0])
-        assert written_data["message"] == "Test message"
-        assert written_data["level"] == "INFO"
+        mock_append.assert_called_once_with(1625140800123, "Test message")
         assert result == event_dict
 
 
@@ -961,339 +921,94 @@ def test_max_size(sized_log_buffer):
     assert sized_log_buffer.max_size() == 100
 
 
-class TestBufferWriterBytesSerializationFix:
-    """Test suite for the buffer_writer bytes serialization bug fix.
-
-    These tests validate the fix for the bug where buffer_writer would fail
-    when trying to serialize event_dict containing bytes (from orjson.dumps).
-    The fix uses the pre-serialized 'serialized' field directly instead of
-    re-serializing the entire event_dict.
-    """
-
-    def test_buffer_writer_with_bytes_in_serialized_field(self):
-        """Test buffer_writer handles bytes in 'serialized' field correctly.
+class TestBufferWriterFromEventDict:
+    """Test suite for buffer_writer writing entries without serializing the event dict."""
 
-        This is the main bug fix test: when add_serialized adds a 'serialized'
-        field with bytes (from orjson.dumps), buffer_writer should use that
-        directly instead of trying to serialize the whole event_dict.
-        """
-        import orjson
-
-        # Simulate what add_serialized does - adds bytes to event_dict
-        serialized_data = {"timestamp": "2025-11-21T12:00:00Z", "message": "Test message", "level": "INFO"}
+    def test_buffer_writer_ignores_bytes_fields(self):
+        """Bytes and other non-JSON fields in the event dict do not affect the buffered entry."""
         event_dict = {
-            "timestamp": "2025-11-21T12:00:00Z",
+            "timestamp": 1625097600.123,
             "event": "Test message with bytes",
-            "level": "info",
-            "module": "test_module",
-            "serialized": orjson.dumps(serialized_data),  # This is bytes!
+            "another_bytes": b"some bytes",
+            "bytearray_field": bytearray(b"bytearray data"),
         }
 
         with (
             patch.object(log_buffer, "enabled", return_value=True),
-            patch.object(log_buffer, "write") as mock_write,
+            patch.object(log_buffer, "append") as mock_append,
         ):
-            # This should NOT raise TypeError: Object of type bytes is not JSON serializable
             result = buffer_writer(None, "info", event_dict)
 
-        # Verify buffer_writer was called
-        mock_write.assert_called_once()
-
-        # Verify the written data is the decoded serialized field
-        call_args = mock_write.call_args[0]
-        written_json = call_args[0]
-
-        # Should be able to parse it without error
-        parsed_data = json.loads(written_json)
-
-        # Should have the data from the serialized field
-        assert parsed_data["timestamp"] == "2025-11-21T12:00:00Z"
-        assert parsed_data["message"] == "Test message"
-        assert parsed_data["level"] == "INFO"
-
-        # Original event_dict should be returned unchanged
+        mock_append.assert_called_once_with(1625097600123, "Test message with bytes")
         assert result == event_dict
-        assert "serialized" in result  # Original still has it
 
-    def test_buffer_writer_without_serialized_field(self):
-        """Test buffer_writer does nothing when no 'serialized' field exists."""
-        event_dict = {
-            "timestamp": "2025-11-21T12:00:00Z",
-            "event": "Normal message",
-            "level": "info",
-        }
+    def test_buffer_writer_without_timestamp_uses_current_time(self):
+        """Entries without a timestamp are stamped with the current time."""
+        event_dict = {"event": {"not": "a string"}}
 
         with (
             patch.object(log_buffer, "enabled", return_value=True),
-            patch.object(log_buffer, "write") as mock_write,
+            patch.object(log_buffer, "append") as mock_append,
         ):
-            result = buffer_writer(None, "info", event_dict)
+            buffer_writer(None, "info", event_dict)
 
-        # Should NOT write to buffer when serialized field is missing
-        mock_write.assert_not_called()
-        assert result == event_dict
+        epoch, message = mock_append.call_args[0]
+        assert epoch > 0
+        assert message == "{'not': 'a string'}"
 
-    def test_buffer_writer_uses_serialized_field_only(self):
-        """Test buffer_writer uses only the serialized field, ignoring others."""
-        import orjson
 
-        # The serialized field is what gets written to the buffer
-        serialized_data = {"key": "value", "message": "Test"}
-        event_dict = {
-            "event": "Test",
-            "serialized": orjson.dumps(serialized_data),
-            "another_bytes": b"some bytes",  # Another bytes field (ignored)
-            "bytearray_field": bytearray(b"bytearray data"),  # bytearray (ignored)
-            "normal_field": "normal string",  # normal field (ignored)
-        }
-
-        with (
-            patch.object(log_buffer, "enabled", return_value=True),
-            patch.object(log_buffer, "write") as mock_write,
-        ):
-            # Should not crash and should only use the serialized field
-            result = buffer_writer(None, "info", event_dict)
-            mock_write.assert_called_once()
-
-            # Verify result is returned unchanged
-            assert result == event_dict
-
-            # Verify only the serialized field contents were written
-            call_args = mock_write.call_args[0]
-            written_json = call_args[0]
-            parsed_data = json.loads(written_json)
-
-            # Should only contain what was in serialized field
-            assert parsed_data == serialized_data
-            assert "key" in parsed_data
-            assert "message" in parsed_data
-            # Other fields from event_dict should NOT be in buffer
-            assert "another_bytes" not in parsed_data
-            assert "bytearray_field" not in parsed_data
-            assert "normal_field" not in parsed_data
-
-    def test_buffer_writer_ignores_non_serialized_fields(self):
-        """Test buffer_writer only writes serialized field, ignores others."""
-        import orjson
-
-        serialized_data = {"message": "Test message", "level": "INFO"}
-        event_dict = {
-            "event": "Test with memoryview",
-            "memoryview_field": memoryview(b"memoryview data"),
-            "normal_field": "normal string",
-            "serialized": orjson.dumps(serialized_data),
-        }
-
-        with (
-            patch.object(log_buffer, "enabled", return_value=True),
-            patch.object(log_buffer, "write") as mock_write,
-        ):
-            result = buffer_writer(None, "info", event_dict)
-            mock_write.assert_called_once()
-
-            # Verify result unchanged
-            assert result == event_dict
-
-            # Verify only serialized data was written
-            call_args = mock_write.call_args[0]
-            written_json = call_args[0]
-            parsed_data = json.loads(written_json)
-
-            # Should only have data from serialized field
-            assert parsed_data == serialized_data
-            assert "event" not in parsed_data
-            assert "normal_field" not in parsed_data
-            assert "memoryview_field" not in parsed_data
+class TestSizedLogBufferRing:
+    """Test suite for the ring storage of SizedLogBuffer."""
 
-    def test_add_serialized_and_buffer_writer_integration(self):
-        """Integration test: add_serialized followed by buffer_writer.
-
-        This simulates the real processor chain where add_serialized adds
-        bytes and buffer_writer uses it directly.
-        """
-        event_dict = {
-            "timestamp": 1625097600.123,
-            "event": "Integration test message",
-            "module": "test_module",
-        }
-
-        with patch.object(log_buffer, "enabled", return_value=True):
-            # Step 1: add_serialized adds the bytes field
-            after_add = add_serialized(None, "debug", event_dict)
-
-            # Verify serialized field was added and is bytes
-            assert "serialized" in after_add
-            assert isinstance(after_add["serialized"], bytes)
-
-            # Step 2: buffer_writer should use the serialized field directly
-            with patch.object(log_buffer, "write") as mock_write:
-                result = buffer_writer(None, "debug", after_add)
-
-            # Should have called write
-            mock_write.assert_called_once()
-            # Verify result is returned
-            assert result == after_add
-
-            # Should have written the decoded serialized field
-            call_args = mock_write.call_args[0]
-            written_json = call_args[0]
-            parsed_data = json.loads(written_json)
-
-            # Should contain the subset created by add_serialized
-            assert parsed_data["timestamp"] == 1625097600.123
-            assert parsed_data["message"] == "Integration test message"
-            assert parsed_data["level"] == "DEBUG"
-            assert parsed_data["module"] == "test_module"
-
-    def test_buffer_writer_preserves_original_event_dict(self):
-        """Test that buffer_writer doesn't modify the original event_dict."""
-        import orjson
-
-        event_dict = {
-            "event": "Test",
-            "serialized": orjson.dumps({"data": "test"}),
-            "other_field": "value",
-        }
-
-        # Make a copy to compare later
-        original_keys = set(event_dict.keys())
-
-        with (
-            patch.object(log_buffer, "enabled", return_value=True),
-            patch.object(log_buffer, "write"),
-        ):
-            result = buffer_writer(None, "info", event_dict)
-
-        # Original event_dict should be unchanged
-        assert set(result.keys()) == original_keys
-        assert "serialized" in result
-        assert result is event_dict  # Should return the same object
-
-    def test_buffer_writer_with_empty_event_dict(self):
-        """Test buffer_writer handles empty event_dict gracefully."""
-        event_dict = {}
-
-        with (
-            patch.object(log_buffer, "enabled", return_value=True),
-            patch.object(log_buffer, "write") as mock_write,
-        ):
-            result = buffer_writer(None, "info", event_dict)
-
-        # Should NOT write when serialized field is missing
-        mock_write.assert_not_called()
-        assert result == {}
-
-    def test_buffer_writer_error_before_fix(self):
-        """Document the error that occurred before the fix.
+    def test_timestamps_never_decrease(self):
+        buffer = SizedLogBuffer()
+        buffer.max = 5
+        buffer.append(2000, "second")
+        buffer.append(1000, "clock went back")
 
-        This test demonstrates what would happen with the old implementation
-        that tried to serialize bytes directly.
-        """
-        import orjson
+        assert [epoch for epoch, _ in buffer.buffer] == [2000, 2000]
 
-        event_dict = {
-            "event": "Test",
-            "serialized": orjson.dumps({"data": "test"}),
-        }
+    def test_get_since_skips_overwritten_entries(self):
+        buffer = SizedLogBuffer()
+        buffer.max = 2
+        start = buffer.next_sequence
+        for i in range(3):
+            buffer.append(1000 + i, f"Log {i}")
 
-        # Simulate old buggy behavior (direct json.dumps on event_dict with bytes)
-        with pytest.raises(TypeError, match="not JSON serializable"):
-            json.dumps(event_dict)  # This is what the old code did
-
-        # The fix (removing serialized field) should work
-        filtered_dict = {k: v for k, v in event_dict.items() if k != "serialized"}
-        serialized = json.dumps(filtered_dict)  # This should work
-        assert json.loads(serialized) == {"event": "Test"}
-
-    def test_buffer_writer_with_complex_nested_data(self):
-        """Test buffer_writer with complex nested data structures in serialized field."""
-        import orjson
-
-        # The complex nested data should be IN the serialized field
-        serialized_data = {
-            "timestamp": "2025-11-21T12:00:00Z",
-            "message": "Complex nested message",
-            "metadata": {
-                "user": "test_user",
-                "nested": {"deeply": {"nested": "value"}},
-                "list": [1, 2, 3],
-            },
-        }
+        entries, next_sequence = buffer.get_since(start)
 
-        event_dict = {
-            "timestamp": "2025-11-21T12:00:00Z",
-            "event": "Complex nested message",
-            "serialized": orjson.dumps(serialized_data),
-        }
+        assert entries == [(1001, "Log 1"), (1002, "Log 2")]
+        assert buffer.get_since(next_sequence) == ([], next_sequence)
 
-        with (
-            patch.object(log_buffer, "enabled", return_value=True),
-            patch.object(log_buffer, "write") as mock_write,
-        ):
-            result = buffer_writer(None, "info", event_dict)
+    def test_resize_keeps_latest_entries(self):
+        buffer = SizedLogBuffer()
+        buffer.max = 3
+        for i in range(3):
+            buffer.append(1000 + i, f"Log {i}")
 
-        mock_write.assert_called_once()
-        # Verify result is returned
-        assert result == event_dict
+        buffer.max = 2
+        buffer.append(1003, "Log 3")
 
-        call_args = mock_write.call_args[0]
-        written_json = call_args[0]
+        assert buffer.buffer == [(1002, "Log 2"), (1003, "Log 3")]
+        assert buffer.get_before_timestamp(1003, lines=5) == {1002: "Log 2"}
 
-        # Should successfully write the complex nested structure from serialized field
-        parsed_data = json.loads(written_json)
-        assert parsed_data["metadata"]["nested"]["deeply"]["nested"] == "value"
-        assert parsed_data["metadata"]["list"] == [1, 2, 3]
-        assert parsed_data == serialized_data
+    def test_oldest_entry_of_full_ring_is_read_under_the_lock(self):
+        buffer = SizedLogBuffer()
+        buffer.max = 3
+        buffer.append(1000, "Log 0")
+        buffer.append(1001, "Log 1")
+        reads = []
 
-    def test_full_logging_pipeline_with_retrieval_enabled(self):
-        """End-to-end test of the full logging pipeline with log retrieval enabled.
+        def reader(slots, first, end):
+            reads.append(buffer.get_write_lock().locked())
+            return buffer._entries(slots, first, end), first
 
-        This simulates the complete flow: configure -> add_serialized -> buffer_writer
-        """
-        # Save original buffer state
-        original_max = log_buffer.max
+        assert buffer._read(reader) == [(1000, "Log 0"), (1001, "Log 1")]
+        assert reads == [False]
 
-        try:
-            # Enable log retrieval
-            log_buffer.max = 10
-
-            # Configure logger with DEBUG level
-            configure(log_level="DEBUG", cache=False)
-
-            # Create an event that will go through the processor chain
-            event_dict = {
-                "timestamp": "2025-11-21T12:00:00Z",
-                "event": "End-to-end test message",
-                "level": "debug",
-                "module": "test",
-            }
-
-            # Run through add_serialized processor
-            event_after_serialized = add_serialized(None, "debug", event_dict.copy())
-
-            # Verify bytes were added
-            assert "serialized" in event_after_serialized
-            assert isinstance(event_after_serialized["serialized"], bytes)
-
-            # Run through buffer_writer processor - should not crash
-            with patch.object(log_buffer, "write") as mock_write:
-                final_event = buffer_writer(None, "debug", event_after_serialized)
-
-            # Verify it was written successfully
-            mock_write.assert_called_once()
-            # Verify final_event is returned
-            assert final_event == event_after_serialized
-
-            # Verify the written data is the decoded serialized field
-            call_args = mock_write.call_args[0]
-            written_json = call_args[0]
-            parsed = json.loads(written_json)
-
-            # Should contain the subset created by add_serialized
-            assert parsed["message"] == "End-to-end test message"
-            assert parsed["level"] == "DEBUG"
-            assert parsed["module"] == "test"
+        # Once the ring is full, the next writer fills the slot of the oldest entry before publishing
+        buffer.append(1002, "Log 2")
+        reads.clear()
 
-        finally:
-            # Restore buffer state
-            log_buffer.max = original_max
+        assert buffer._read(reader) == [(1000, "Log 0"), (1001, "Log 1"), (1002, "Log 2")]
+        assert reads == [False, True]
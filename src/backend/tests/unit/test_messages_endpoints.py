@@ -4,13 +4,14 @@ from uuid import UUID
 
 import pytest
 from httpx import AsyncClient
-from langflow.memory import aadd_messagetables
+from langflow.memory import aadd_messagetables, abuffer_message, aflush_messages, message_write_buffer
 
 # Assuming you have these imports available
 from langflow.services.database.models.flow.model import Flow
 from langflow.services.database.models.message import MessageCreate, MessageRead, MessageUpdate
 from langflow.services.database.models.message.model import MessageTable
 from langflow.services.deps import session_scope
+from lfx.schema.message import Message
 
 
 @pytest.fixture
@@ -262,3 +263,34 @@ async def test_get_messages_empty_result_with_encoded_nonexistent_session(client
     assert response.status_code == 200, response.text
     messages = response.json()
     assert len(messages) == 0
+
+
+async def test_get_messages_does_not_write_buffered_messages(client: AsyncClient, logged_in_headers, active_user):
+    async with session_scope() as session:
+        flow = Flow(name="test_flow_for_buffered_messages", user_id=active_user.id, data={"nodes": [], "edges": []})
+        session.add(flow)
+        await session.flush()
+        flow_id = flow.id
+
+    session_id = "buffered_endpoint_session_id"
+    buffered = await abuffer_message(
+        Message(text=iter(["stream"]), sender="AI", sender_name="AI", session_id=session_id), flow_id=flow_id
+    )
+
+    response = await client.get("api/v1/monitor/messages/sessions", headers=logged_in_headers)
+    assert response.status_code == 200, response.text
+    assert session_id not in response.json()
+
+    response = await client.get(
+        "api/v1/monitor/messages", params={"session_id": session_id}, headers=logged_in_headers
+    )
+    assert response.status_code == 200, response.text
+    assert response.json() == []
+    assert UUID(str(buffered.id)) in message_write_buffer
+
+    # The message is listed once the stream that buffered it writes it
+    await aflush_messages(message_id=buffered.id)
+    response = await client.get(
+        "api/v1/monitor/messages", params={"session_id": session_id}, headers=logged_in_headers
+    )
+    assert [message["id"] for message in response.json()] == [str(buffered.id)]
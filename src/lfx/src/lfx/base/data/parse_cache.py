@@ -0,0 +1,198 @@
+"""On-disk cache of parsed file contents.
+
+File components parse every file again on each flow run, and parsing PDFs, DOCX files and other documents
+is far more expensive than reading them. Parsed results are stored on disk under a key derived from the file
+content and the parser that produced them, so an unchanged file is parsed once, whatever its path. The cache
+is bounded in size and evicts the least recently used results once the bound is exceeded.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import pickle
+import threading
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from lfx.log.logger import logger
+from lfx.services.deps import get_settings_service
+
+if TYPE_CHECKING:
+    from lfx.schema.data import Data
+
+# Bump when parsers change in a way that invalidates results cached by previous versions
+PARSED_FILE_CACHE_VERSION = 1
+PARSED_FILE_CACHE_DIRNAME = "parsed_files"
+_ENTRY_SUFFIX = ".pkl"
+_HASH_CHUNK_SIZE = 1024 * 1024
+# Eviction removes entries until the cache is back under this fraction of its maximum size
+_EVICTION_LOW_WATERMARK = 0.9
+# Content digests remembered per (path, size, mtime), so unchanged files are not hashed on every run
+_MAX_REMEMBERED_DIGESTS = 10_000
+
+
+class ParsedFileCache:
+    """A size-bounded, least recently used cache of parsed files stored on disk.
+
+    Attributes:
+        directory (Path): Directory holding one file per cached result.
+        max_size (int): Maximum total size of the cached results in bytes.
+    """
+
+    def __init__(self, directory: Path, max_size: int):
+        self.directory = directory
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        self._total_size: int | None = None
+        self._digests: dict[tuple[str, int, int], str] = {}
+
+    def key(self, file_path: str, parser: str) -> str | None:
+        """Return the cache key of a file parsed by ``parser``, or None if the file cannot be read.
+
+        The file extension is part of the key because parsers pick the format from it.
+        """
+        try:
+            stat = Path(file_path).stat()
+        except OSError:
+            return None
+        stat_key = (file_path, stat.st_size, stat.st_mtime_ns)
+        digest = self._digests.get(stat_key)
+        if digest is None:
+            hasher = hashlib.sha256()
+            try:
+                with Path(file_path).open("rb") as f:
+                    while chunk := f.read(_HASH_CHUNK_SIZE):
+                        hasher.update(chunk)
+            except OSError:
+                return None
+            digest = hasher.hexdigest()
+            if len(self._digests) >= _MAX_REMEMBERED_DIGESTS:
+                self._digests.clear()
+            self._digests[stat_key] = digest
+        key = f"{PARSED_FILE_CACHE_VERSION}:{parser}:{Path(file_path).suffix}:{digest}"
+        return hashlib.sha256(key.encode()).hexdigest()
+
+    def get(self, key: str, file_path: str) -> Data | None:
+        """Return the cached result for ``key``, pointed at ``file_path``, or None on a miss."""
+        entry = self._entry_path(key)
+        try:
+            data = pickle.loads(entry.read_bytes())  # noqa: S301
+            # The modification time orders entries for eviction
+            os.utime(entry)
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        except Exception:  # noqa: BLE001
+            logger.debug(f"Discarding unreadable parsed file cache entry {entry}", exc_info=True)
+            self._remove(entry)
+            self.misses += 1
+            return None
+        self.hits += 1
+        # Files with the same content share a result, so it must carry the path it was requested for
+        if "file_path" in data.data:
+            data.data["file_path"] = file_path
+        return data
+
+    def put(self, key: str, data: Data) -> None:
+        """Store a parsed result, evicting the least recently used results if the cache grows too large."""
+        try:
+            payload = pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception:  # noqa: BLE001
+            logger.debug("Parsed file result cannot be cached", exc_info=True)
+            return
+        if len(payload) > self.max_size:
+            return
+        entry = self._entry_path(key)
+        temp_entry = entry.with_name(f"{entry.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            previous_size = entry.stat().st_size if entry.exists() else 0
+            temp_entry.write_bytes(payload)
+            temp_entry.replace(entry)
+        except OSError:
+            logger.debug(f"Could not write parsed file cache entry {entry}", exc_info=True)
+            self._remove(temp_entry)
+            return
+        with self._lock:
+            if self._total_size is None:
+                self._total_size = sum(size for _, size, _ in self._scan())
+            else:
+                self._total_size += len(payload) - previous_size
+            if self._total_size > self.max_size:
+                self._evict()
+
+    def clear(self) -> None:
+        with self._lock:
+            for entry, _, _ in self._scan():
+                self._remove(entry)
+            self._total_size = 0
+            self._digests.clear()
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "size": self._total_size or 0,
+            "max_size": self.max_size,
+        }
+
+    def _entry_path(self, key: str) -> Path:
+        return self.directory / f"{key}{_ENTRY_SUFFIX}"
+
+    def _scan(self) -> list[tuple[Path, int, float]]:
+        """Return the path, size and last use time of every entry, including entries of other processes."""
+        entries = []
+        if not self.directory.is_dir():
+            return entries
+        for entry in self.directory.glob(f"*{_ENTRY_SUFFIX}"):
+            try:
+                stat = entry.stat()
+            except OSError:
+                continue
+            entries.append((entry, stat.st_size, stat.st_mtime))
+        return entries
+
+    def _evict(self) -> None:
+        # Other processes may share the directory, so the sizes are taken from disk rather than memory
+        entries = sorted(self._scan(), key=lambda item: item[2])
+        total_size = sum(size for _, size, _ in entries)
+        target_size = self.max_size * _EVICTION_LOW_WATERMARK
+        for entry, size, _ in entries:
+            if total_size <= target_size:
+                break
+            self._remove(entry)
+            total_size -= size
+            self.evictions += 1
+        self._total_size = total_size
+
+    @staticmethod
+    def _remove(entry: Path) -> None:
+        try:
+            entry.unlink()
+        except FileNotFoundError:
+            pass
+        except OSError:
+            logger.debug(f"Could not remove parsed file cache entry {entry}", exc_info=True)
+
+
+_caches: dict[tuple[Path, int], ParsedFileCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_parsed_file_cache() -> ParsedFileCache | None:
+    """Return the shared parsed file cache, or None if it is disabled or files are not stored locally."""
+    settings = get_settings_service().settings
+    if settings.storage_type == "s3" or not settings.config_dir or settings.parsed_file_cache_max_size <= 0:
+        return None
+    directory = Path(settings.config_dir) / PARSED_FILE_CACHE_DIRNAME
+    max_size = settings.parsed_file_cache_max_size * 1024 * 1024
+    with _caches_lock:
+        cache = _caches.get((directory, max_size))
+        if cache is None:
+            cache = _caches[directory, max_size] = ParsedFileCache(directory, max_size)
+        return cache
@@ -3,7 +3,9 @@ import tempfile
 import unicodedata
 from collections.abc import Callable
 from concurrent import futures
+from functools import partial
 from io import BytesIO
+from multiprocessing import get_context
 from pathlib import Path
 
 import chardet
@@ -12,6 +14,7 @@ import yaml
 from defusedxml import ElementTree
 from pypdf import PdfReader
 
+from lfx.base.data.parse_cache import ParsedFileCache
 from lfx.base.data.storage_utils import read_file_bytes
 from lfx.schema.data import Data
 from lfx.services.deps import get_settings_service
@@ -352,11 +355,51 @@ def parallel_load_data(
     silent_errors: bool,
     max_concurrency: int,
     load_function: Callable = parse_text_file_to_data,
+    cache: ParsedFileCache | None = None,
+    use_processes: bool = False,
 ) -> list[Data | None]:
-    with futures.ThreadPoolExecutor(max_workers=max_concurrency) as executor:
-        loaded_files = executor.map(
-            lambda file_path: load_function(file_path, silent_errors=silent_errors),
-            file_paths,
-        )
-    # loaded_files is an iterator, so we need to convert it to a list
-    return list(loaded_files)
+    """Load files concurrently, in the order of ``file_paths``.
+
+    Args:
+        file_paths: Paths of the files to load.
+        silent_errors: If true, files that fail to load give None instead of raising.
+        max_concurrency: Maximum number of files loaded at the same time.
+        load_function: Function that parses one file into a Data object.
+        cache: Cache of parsed results. Files whose content was already parsed by ``load_function`` are
+            not parsed again.
+        use_processes: Parse in worker processes instead of threads, so that CPU-bound parsers such as
+            PDF text extraction run in parallel. ``load_function`` must then be a module-level function.
+    """
+    loaded_files: list[Data | None] = [None] * len(file_paths)
+    cache_keys: list[str | None] = [None] * len(file_paths)
+    pending: list[int] = []
+    parser = f"{load_function.__module__}.{load_function.__qualname__}"
+    for index, file_path in enumerate(file_paths):
+        cache_key = cache.key(file_path, parser) if cache is not None else None
+        cached = cache.get(cache_key, file_path) if cache is not None and cache_key is not None else None
+        if cached is None:
+            cache_keys[index] = cache_key
+            pending.append(index)
+        else:
+            loaded_files[index] = cached
+    if not pending:
+        return loaded_files
+
+    pending_paths = [file_paths[index] for index in pending]
+    max_workers = max(1, min(max_concurrency, len(pending_paths)))
+    if use_processes and max_workers > 1:
+        # Forking a process that runs threads and an event loop is unsafe, so workers are spawned
+        with futures.ProcessPoolExecutor(max_workers=max_workers, mp_context=get_context("spawn")) as executor:
+            loaded = list(executor.map(partial(load_function, silent_errors=silent_errors), pending_paths))
+    else:
+        with futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            loaded = list(
+                executor.map(lambda file_path: load_function(file_path, silent_errors=silent_errors), pending_paths)
+            )
+
+    for index, data in zip(pending, loaded, strict=True):
+        loaded_files[index] = data
+        cache_key = cache_keys[index]
+        if cache is not None and cache_key is not None and data is not None:
+            cache.put(cache_key, data)
+    return loaded_files
@@ -0,0 +1,154 @@
+"""Process-level cache of opened knowledge bases.
+
+Opening a knowledge base for retrieval resolves the owner's username, reads and decrypts its
+embedding metadata, builds an embedding client and a Chroma client. None of that changes between
+queries, so the opened handles are kept in a bounded LRU cache. Ingestion invalidates the handles of
+a knowledge base when it writes to it.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+from uuid import UUID
+
+from langflow.services.database.models.user.crud import get_user_by_id
+
+from lfx.services.deps import session_scope
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+KnowledgeBaseHandleKey = tuple[str, str, int | None, str]
+
+DEFAULT_KB_HANDLE_CACHE_SIZE = 16
+
+# How long a resolved username is reused before it is read from the database again
+USERNAME_CACHE_TTL_SECONDS = 60.0
+
+
+@dataclass
+class KnowledgeBaseHandle:
+    """An opened knowledge base: its vector store, embedder and decrypted embedding metadata."""
+
+    vector_store: Any
+    embedding_function: Any
+    metadata: dict[str, Any] = field(default_factory=dict)
+
+
+class KnowledgeBaseHandleCache:
+    """Bounded LRU cache of opened knowledge bases.
+
+    Handles are keyed by ``(kb_path, collection_name, metadata mtime, api key fingerprint)``, so
+    changing the embedding metadata or the runtime API key opens a new handle. ``invalidate`` drops
+    every handle of a knowledge base.
+
+    Attributes:
+        max_size (int): Maximum number of handles to keep. ``0`` disables the cache.
+        hits (int): Number of lookups served from a cached handle.
+        misses (int): Number of lookups that had to open the knowledge base.
+    """
+
+    def __init__(self, max_size: int = DEFAULT_KB_HANDLE_CACHE_SIZE) -> None:
+        self._handles: OrderedDict[KnowledgeBaseHandleKey, KnowledgeBaseHandle] = OrderedDict()
+        self._lock = threading.RLock()
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(
+        kb_path: Path,
+        collection_name: str,
+        metadata_file: Path,
+        api_key: str | None = None,
+    ) -> KnowledgeBaseHandleKey:
+        try:
+            metadata_mtime: int | None = metadata_file.stat().st_mtime_ns
+        except OSError:
+            metadata_mtime = None
+        # Only a fingerprint of the key is kept in the cache key
+        api_key_fingerprint = hashlib.sha256(api_key.encode()).hexdigest() if api_key else ""
+        return (str(kb_path), collection_name, metadata_mtime, api_key_fingerprint)
+
+    def get(self, key: KnowledgeBaseHandleKey) -> KnowledgeBaseHandle | None:
+        with self._lock:
+            handle = self._handles.get(key)
+            if handle is None:
+                self.misses += 1
+                return None
+            self._handles.move_to_end(key)
+            self.hits += 1
+            return handle
+
+    def put(self, key: KnowledgeBaseHandleKey, handle: KnowledgeBaseHandle) -> None:
+        if not self.max_size:
+            return
+        with self._lock:
+            self._handles[key] = handle
+            self._handles.move_to_end(key)
+            while len(self._handles) > self.max_size:
+                self._handles.popitem(last=False)
+
+    def invalidate(self, kb_path: Path) -> int:
+        """Drop every handle opened for ``kb_path``.
+
+        Returns:
+            int: The number of handles removed.
+        """
+        kb_path_str = str(kb_path)
+        with self._lock:
+            keys = [key for key in self._handles if key[0] == kb_path_str]
+            for key in keys:
+                del self._handles[key]
+        return len(keys)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._handles.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {"size": len(self._handles), "max_size": self.max_size, "hits": self.hits, "misses": self.misses}
+
+    def __len__(self) -> int:
+        return len(self._handles)
+
+
+kb_handle_cache = KnowledgeBaseHandleCache()
+
+_usernames: dict[UUID, tuple[str, float]] = {}
+
+
+def invalidate_kb_handles(kb_path: Path) -> int:
+    """Invalidate the cached handles of a knowledge base after it has been written to."""
+    return kb_handle_cache.invalidate(kb_path)
+
+
+async def get_kb_username(user_id: UUID | str) -> str:
+    """Return the username whose directory holds a user's knowledge bases.
+
+    The username is read from the database at most once every ``USERNAME_CACHE_TTL_SECONDS``.
+    """
+    if not user_id:
+        msg = "User ID is required for fetching Knowledge Base data."
+        raise ValueError(msg)
+    user_id = UUID(user_id) if isinstance(user_id, str) else user_id
+    cached = _usernames.get(user_id)
+    if cached is not None and time.monotonic() - cached[1] < USERNAME_CACHE_TTL_SECONDS:
+        return cached[0]
+
+    async with session_scope() as db:
+        current_user = await get_user_by_id(db, user_id)
+        if not current_user:
+            msg = f"User with ID {user_id} not found."
+            raise ValueError(msg)
+        username = current_user.username
+    _usernames[user_id] = (username, time.monotonic())
+    return username
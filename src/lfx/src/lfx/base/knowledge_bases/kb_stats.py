@@ -0,0 +1,156 @@
+"""Persisted statistics of a knowledge base.
+
+Listing knowledge bases used to read every document of every Chroma collection to count its words and
+characters. Ingestion keeps these counts in a small manifest next to the collection instead, and the
+collection is only read to rebuild the manifest of a knowledge base created before it existed.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import json
+import os
+import tempfile
+import threading
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Any
+
+from lfx.log.logger import logger
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from pathlib import Path
+
+KB_STATS_FILENAME = "kb_stats.json"
+KB_STATS_VERSION = 1
+
+# Number of documents read at a time when rebuilding a manifest from the collection
+REBUILD_PAGE_SIZE = 1000
+
+# Serializes the read-modify-write of the manifests of this process
+_stats_lock = threading.Lock()
+
+
+def count_text(texts: Iterable[str | None]) -> tuple[int, int]:
+    """Return the total number of words and characters of the texts."""
+    words = 0
+    characters = 0
+    for text in texts:
+        text_str = "" if text is None else str(text)
+        characters += len(text_str)
+        words += len(text_str.split())
+    return words, characters
+
+
+def read_kb_stats(kb_path: Path) -> dict[str, Any] | None:
+    """Read the stats manifest of a knowledge base.
+
+    Returns:
+        The manifest, or None if it is missing, unreadable or from another version.
+    """
+    stats_file = kb_path / KB_STATS_FILENAME
+    try:
+        stats = json.loads(stats_file.read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError):
+        logger.exception("Error reading knowledge base stats '%s'", stats_file)
+        return None
+    if not isinstance(stats, dict) or stats.get("version") != KB_STATS_VERSION:
+        return None
+    return stats
+
+
+def write_kb_stats(kb_path: Path, stats: dict[str, Any]) -> dict[str, Any]:
+    """Atomically replace the stats manifest of a knowledge base."""
+    stats = {**stats, "version": KB_STATS_VERSION, "updated_at": datetime.now(timezone.utc).isoformat()}
+    kb_path.mkdir(parents=True, exist_ok=True)
+    # Write to a temporary file first so readers never see a partial manifest
+    fd, tmp_name = tempfile.mkstemp(dir=kb_path, prefix=f".{KB_STATS_FILENAME}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as tmp_file:
+            json.dump(stats, tmp_file, indent=2)
+        os.replace(tmp_name, kb_path / KB_STATS_FILENAME)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.unlink(tmp_name)
+        raise
+    return stats
+
+
+def update_kb_stats(
+    kb_path: Path,
+    *,
+    chunks: int,
+    words: int,
+    characters: int,
+    embedding_provider: str | None = None,
+    embedding_model: str | None = None,
+    create: bool = False,
+) -> dict[str, Any] | None:
+    """Add newly ingested chunks to the stats manifest of a knowledge base.
+
+    Args:
+        kb_path: The knowledge base directory.
+        chunks: Number of chunks added.
+        words: Number of words in the added chunks.
+        characters: Number of characters in the added chunks.
+        embedding_provider: The embedding provider of the knowledge base, if known.
+        embedding_model: The embedding model of the knowledge base, if known.
+        create: Start a manifest from zero when there is none. Only pass this when the collection
+            was empty before these chunks were added; otherwise the manifest is left to a rebuild.
+
+    Returns:
+        The updated manifest, or None if there was no manifest to update.
+    """
+    with _stats_lock:
+        stats = read_kb_stats(kb_path)
+        if stats is None:
+            if not create:
+                return None
+            stats = {"chunks": 0, "words": 0, "characters": 0}
+        stats["chunks"] = int(stats.get("chunks", 0)) + chunks
+        stats["words"] = int(stats.get("words", 0)) + words
+        stats["characters"] = int(stats.get("characters", 0)) + characters
+        if embedding_provider:
+            stats["embedding_provider"] = embedding_provider
+        if embedding_model:
+            stats["embedding_model"] = embedding_model
+        return write_kb_stats(kb_path, stats)
+
+
+def compute_kb_stats(kb_path: Path, collection_name: str | None = None) -> dict[str, int]:
+    """Count the chunks, words and characters of a knowledge base from its Chroma collection.
+
+    Documents are read one page at a time, so memory use does not grow with the collection.
+    """
+    from langchain_chroma import Chroma
+
+    chroma = Chroma(persist_directory=str(kb_path), collection_name=collection_name or kb_path.name)
+    collection = chroma._collection  # noqa: SLF001
+    chunks = collection.count()
+    words = 0
+    characters = 0
+    for offset in range(0, chunks, REBUILD_PAGE_SIZE):
+        page = collection.get(include=["documents"], limit=REBUILD_PAGE_SIZE, offset=offset)
+        page_words, page_characters = count_text(page["documents"] or [])
+        words += page_words
+        characters += page_characters
+    return {"chunks": chunks, "words": words, "characters": characters}
+
+
+def rebuild_kb_stats(kb_path: Path, collection_name: str | None = None) -> dict[str, Any] | None:
+    """Recount a knowledge base from its collection and write its stats manifest.
+
+    Returns:
+        The new manifest, or None if the knowledge base no longer exists.
+    """
+    if not kb_path.is_dir():
+        return None
+    stats = compute_kb_stats(kb_path, collection_name)
+    with _stats_lock:
+        previous = read_kb_stats(kb_path) or {}
+        for key in ("embedding_provider", "embedding_model"):
+            if key in previous:
+                stats[key] = previous[key]
+        return write_kb_stats(kb_path, stats)
@@ -6,7 +6,8 @@ import json
 import os
 import sys
 import tempfile
-from functools import partial
+from collections.abc import Callable
+from functools import partial, wraps
 from pathlib import Path
 
 import typer
@@ -25,7 +26,9 @@ from lfx.cli.common import (
     is_port_in_use,
     load_graph_from_path,
 )
+from lfx.cli.graph_pool import DEFAULT_GRAPH_POOL_SIZE
 from lfx.cli.serve_app import FlowMeta, create_multi_serve_app
+from lfx.cli.workers import WorkerSupervisor, supports_workers
 
 # Initialize console
 console = Console()
@@ -34,6 +37,30 @@ console = Console()
 API_KEY_MASK_LENGTH = 8
 
 
+def run_worker_supervisor(serve: Callable[..., WorkerSupervisor | None]) -> Callable[..., None]:
+    """Run the worker supervisor returned by the serve command once the command's event loop has exited.
+
+    The workers are forked from the supervisor, which must not happen from inside a running event loop.
+    """
+
+    @wraps(serve)
+    def wrapper(*args, **kwargs) -> None:
+        supervisor = serve(*args, **kwargs)
+        if supervisor is None:
+            return
+        try:
+            supervisor.run()
+        except KeyboardInterrupt:
+            typer.echo("\n👋 Server stopped", err=True)
+            raise typer.Exit(0) from None
+        except Exception as e:
+            typer.echo(f"✗ Failed to start server: {e}", err=True)
+            raise typer.Exit(1) from e
+
+    return wrapper
+
+
+@run_worker_supervisor
 @partial(syncify, raise_sync_error=False)
 async def serve_command(
     script_path: str | None = typer.Argument(
@@ -72,7 +99,37 @@ async def serve_command(
         "--check-variables/--no-check-variables",
         help="Check global variables for environment compatibility",
     ),
-) -> None:
+    pool_size: int = typer.Option(
+        DEFAULT_GRAPH_POOL_SIZE,
+        "--pool-size",
+        min=1,
+        help="Number of pre-built graph instances per flow and worker, which bounds concurrent runs",
+    ),
+    pool_timeout: float | None = typer.Option(
+        None,
+        "--pool-timeout",
+        help="Seconds a request waits for a free graph instance before failing with 503 (default: wait)",
+    ),
+    workers: int = typer.Option(
+        1,
+        "--workers",
+        "-w",
+        min=1,
+        help="Number of worker processes forked after the flow is loaded (POSIX only)",
+    ),
+    max_requests: int | None = typer.Option(
+        None,
+        "--max-requests",
+        min=1,
+        help="Recycle a worker process after it has served this many requests",
+    ),
+    max_requests_jitter: int = typer.Option(
+        0,
+        "--max-requests-jitter",
+        min=0,
+        help="Maximum random number of requests added to --max-requests per worker",
+    ),
+) -> WorkerSupervisor | None:
     """Serve LFX flows as a web API.
 
     Supports single files, inline JSON, and stdin input.
@@ -87,6 +144,13 @@ async def serve_command(
         # Serve from stdin
         cat my_flow.json | lfx serve --stdin
         echo '{"nodes": [...]}' | lfx serve --stdin
+
+        # Serve with 4 worker processes, each recycled after 1000 requests
+        lfx serve my_flow.json --workers 4 --max-requests 1000
+
+    Returns:
+        WorkerSupervisor | None: The supervisor of the worker processes in worker mode, which
+        ``run_worker_supervisor`` runs once this command's event loop has exited.
     """
     # Configure logging with the specified level and import logger
     from lfx.log.logger import configure, logger
@@ -272,6 +336,8 @@ async def serve_command(
             graphs=graphs,
             metas=metas,
             verbose_print=verbose_print,
+            pool_size=pool_size,
+            pool_timeout=pool_timeout,
         )
 
         verbose_print("🚀 Starting single-flow server...")
@@ -313,8 +379,20 @@ async def serve_command(
                 port=port,
                 log_level=log_level,
             )
+            if (workers > 1 or max_requests) and supports_workers():
+                # The workers are forked from the loaded app, so they share the prepared flow copy-on-write
+                verbose_print(f"Starting {workers} worker process(es)...")
+                return WorkerSupervisor(
+                    config,
+                    workers,
+                    max_requests=max_requests,
+                    max_requests_jitter=max_requests_jitter,
+                )
+            if workers > 1 or max_requests:
+                verbose_print("Worker processes are not supported on this platform, serving in a single process")
             server = uvicorn.Server(config)
             await server.serve()
+            return None
         except KeyboardInterrupt:
             verbose_print("\n👋 Server stopped")
             raise typer.Exit(0) from None
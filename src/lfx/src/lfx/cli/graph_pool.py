@@ -0,0 +1,153 @@
+"""Pools of pre-built graph instances for the serve app.
+
+Running a flow mutates its graph, so every request needs its own instance. Copying the served graph
+on each request costs more than many runs, so each flow keeps a fixed number of pre-built instances
+instead. A request leases one, and once the run is over the used instance is discarded and a fresh
+clone of the served graph, built in a worker thread off the event loop, takes its place in the pool.
+When every instance is leased, requests wait for one to be released, which bounds the number of
+concurrent runs per flow.
+
+A used instance is never reset in place: resetting every vertex and edge costs about as much as a
+clone, and leftovers of a run could leak into the next one.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import TYPE_CHECKING, Any
+
+from lfx.log.logger import logger
+
+if TYPE_CHECKING:
+    from lfx.graph import Graph
+
+DEFAULT_GRAPH_POOL_SIZE = 4
+CLONE_ATTEMPTS = 3
+CLONE_RETRY_DELAY = 0.1
+
+
+class GraphPoolTimeoutError(Exception):
+    """Raised when no graph instance is released within the acquire timeout."""
+
+
+class GraphPoolUnavailableError(Exception):
+    """Raised when the pool lost every instance because the served graph could not be cloned."""
+
+
+class GraphPool:
+    """A fixed-size pool of clean instances of one graph.
+
+    Attributes:
+        template (Graph): The served graph. It is never run; instances are cloned from it.
+        size (int): Number of instances in the pool.
+        acquire_timeout (float | None): Seconds to wait for an instance. ``None`` waits forever.
+    """
+
+    def __init__(self, template: Graph, size: int = DEFAULT_GRAPH_POOL_SIZE, acquire_timeout: float | None = None):
+        if size < 1:
+            msg = "Graph pool size must be at least 1"
+            raise ValueError(msg)
+        self.template = template
+        self.size = size
+        self.acquire_timeout = acquire_timeout
+        # None is put in the queue once the last instance is lost, to wake up every waiting request
+        self._available: asyncio.Queue[Graph | None] = asyncio.Queue()
+        self._release_tasks: set[asyncio.Task] = set()
+        for _ in range(size):
+            self._available.put_nowait(template.clone())
+        self.acquisitions = 0
+        self.waits = 0
+        self.timeouts = 0
+        self.wait_seconds = 0.0
+        self.max_wait_seconds = 0.0
+        self.clones = 0
+        self.clone_failures = 0
+        self.clone_seconds = 0.0
+        self.max_clone_seconds = 0.0
+
+    async def acquire(self) -> Graph:
+        """Lease an instance, waiting for one to be released if the pool is exhausted.
+
+        Raises:
+            GraphPoolTimeoutError: If no instance is released within ``acquire_timeout`` seconds.
+            GraphPoolUnavailableError: If the pool has no instance left.
+        """
+        if not self.size:
+            raise self._unavailable_error()
+        start = time.perf_counter()
+        try:
+            graph = self._available.get_nowait()
+        except asyncio.QueueEmpty:
+            self.waits += 1
+            try:
+                graph = await asyncio.wait_for(self._available.get(), timeout=self.acquire_timeout)
+            except asyncio.TimeoutError as e:
+                self.timeouts += 1
+                msg = f"No instance of flow {self.template.flow_id} became available in {self.acquire_timeout}s"
+                raise GraphPoolTimeoutError(msg) from e
+        if graph is None:
+            self._available.put_nowait(None)
+            raise self._unavailable_error()
+        elapsed = time.perf_counter() - start
+        self.acquisitions += 1
+        self.wait_seconds += elapsed
+        self.max_wait_seconds = max(self.max_wait_seconds, elapsed)
+        return graph
+
+    async def release(self, graph: Graph) -> None:  # noqa: ARG002
+        """Replace a leased instance, which may hold the state of its run, with a fresh clone.
+
+        The clone is built in a worker thread, so it never blocks the event loop. A failed clone is
+        retried, and only once every attempt failed does the pool shrink by one instance.
+        """
+        for attempt in range(1, CLONE_ATTEMPTS + 1):
+            start = time.perf_counter()
+            try:
+                new_graph = await asyncio.to_thread(self.template.clone)
+                break
+            except Exception:  # noqa: BLE001
+                self.clone_failures += 1
+                if attempt < CLONE_ATTEMPTS:
+                    logger.warning(f"Could not clone flow {self.template.flow_id}, retrying", exc_info=True)
+                    await asyncio.sleep(CLONE_RETRY_DELAY * attempt)
+                    continue
+                self.size -= 1
+                logger.exception(f"Could not clone flow {self.template.flow_id}, its pool shrinks to {self.size}")
+                if not self.size:
+                    self._available.put_nowait(None)
+                return
+        elapsed = time.perf_counter() - start
+        self.clones += 1
+        self.clone_seconds += elapsed
+        self.max_clone_seconds = max(self.max_clone_seconds, elapsed)
+        self._available.put_nowait(new_graph)
+
+    def release_soon(self, graph: Graph) -> None:
+        """Release a leased instance in a background task, so the caller does not wait for the new clone."""
+        task = asyncio.create_task(self.release(graph))
+        self._release_tasks.add(task)
+        task.add_done_callback(self._release_tasks.discard)
+
+    @property
+    def available(self) -> int:
+        return self._available.qsize() if self.size else 0
+
+    def _unavailable_error(self) -> GraphPoolUnavailableError:
+        msg = f"No instance of flow {self.template.flow_id} is left, the flow could not be cloned"
+        return GraphPoolUnavailableError(msg)
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "size": self.size,
+            "available": self.available,
+            "acquisitions": self.acquisitions,
+            "waits": self.waits,
+            "timeouts": self.timeouts,
+            "avg_wait_ms": round(1000 * self.wait_seconds / self.acquisitions, 3) if self.acquisitions else 0.0,
+            "max_wait_ms": round(1000 * self.max_wait_seconds, 3),
+            "clones": self.clones,
+            "clone_failures": self.clone_failures,
+            "avg_clone_ms": round(1000 * self.clone_seconds / self.clones, 3) if self.clones else 0.0,
+            "max_clone_ms": round(1000 * self.max_clone_seconds, 3),
+        }
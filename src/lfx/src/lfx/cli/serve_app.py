@@ -19,7 +19,6 @@ from __future__ import annotations
 
 import asyncio
 import time
-from copy import deepcopy
 from typing import TYPE_CHECKING, Annotated, Any
 
 from fastapi import APIRouter, Depends, FastAPI, HTTPException, Security
@@ -28,6 +27,12 @@ from fastapi.security import APIKeyHeader, APIKeyQuery
 from pydantic import BaseModel, Field
 
 from lfx.cli.common import execute_graph_with_capture, extract_result_data, get_api_key
+from lfx.cli.graph_pool import (
+    DEFAULT_GRAPH_POOL_SIZE,
+    GraphPool,
+    GraphPoolTimeoutError,
+    GraphPoolUnavailableError,
+)
 from lfx.log.logger import logger
 
 if TYPE_CHECKING:
@@ -352,6 +357,8 @@ def create_multi_serve_app(
     graphs: dict[str, Graph],
     metas: dict[str, FlowMeta],
     verbose_print: Callable[[str], None],  # noqa: ARG001
+    pool_size: int = DEFAULT_GRAPH_POOL_SIZE,
+    pool_timeout: float | None = None,
 ) -> FastAPI:
     """Create a FastAPI app exposing multiple LFX flows.
 
@@ -366,11 +373,21 @@ def create_multi_serve_app(
         Mapping ``flow_id -> FlowMeta`` containing metadata for each flow.
     verbose_print
         Diagnostic printer inherited from the CLI (unused, kept for backward compatibility).
+    pool_size
+        Number of pre-built instances kept per flow, which is also the maximum
+        number of concurrent runs of a flow.
+    pool_timeout
+        Seconds a request waits for a free instance before failing with 503.
+        ``None`` waits indefinitely.
     """
     if set(graphs) != set(metas):  # pragma: no cover - sanity check
         msg = "graphs and metas must contain the same keys"
         raise ValueError(msg)
 
+    pools = {
+        flow_id: GraphPool(graph, size=pool_size, acquire_timeout=pool_timeout) for flow_id, graph in graphs.items()
+    }
+
     app = FastAPI(
         title=f"LFX Multi-Flow Server ({len(graphs)})",
         description=(
@@ -391,13 +408,27 @@ def create_multi_serve_app(
 
     @app.get("/health", tags=["info"], summary="Global health check")
     async def global_health():
-        return {"status": "healthy", "flow_count": len(graphs)}
+        return {
+            "status": "healthy",
+            "flow_count": len(graphs),
+            "graph_pools": {flow_id: pool.stats() for flow_id, pool in pools.items()},
+        }
 
     # ------------------------------------------------------------------
     # Per-flow routers
     # ------------------------------------------------------------------
 
-    def create_flow_router(flow_id: str, graph: Graph, meta: FlowMeta) -> APIRouter:
+    async def acquire_graph(flow_id: str, pool: GraphPool) -> Graph:
+        try:
+            return await pool.acquire()
+        except GraphPoolTimeoutError as exc:
+            logger.warning(f"Graph pool of flow {flow_id} exhausted: {exc}")
+            raise HTTPException(status_code=503, detail="Flow is busy, try again later") from exc
+        except GraphPoolUnavailableError as exc:
+            logger.error(f"Graph pool of flow {flow_id} is empty: {exc}")
+            raise HTTPException(status_code=503, detail="Flow is unavailable") from exc
+
+    def create_flow_router(flow_id: str, graph: Graph, meta: FlowMeta, pool: GraphPool) -> APIRouter:
         """Create a router for a specific flow to avoid loop variable binding issues."""
         analysis = _analyze_graph_structure(graph)
         run_description = _generate_dynamic_run_description(graph)
@@ -418,9 +449,9 @@ def create_multi_serve_app(
         async def run_flow(
             request: RunRequest,
         ) -> RunResponse:
+            graph_instance = await acquire_graph(flow_id, pool)
             try:
-                graph_copy = deepcopy(graph)
-                results, logs = await execute_graph_with_capture(graph_copy, request.input_value)
+                results, logs = await execute_graph_with_capture(graph_instance, request.input_value)
                 result_data = extract_result_data(results, logs)
 
                 # Debug logging
@@ -473,6 +504,9 @@ def create_multi_serve_app(
                     type="error",
                     component="",
                 )
+            finally:
+                # Also runs when the request is cancelled, so the instance never leaks from the pool
+                pool.release_soon(graph_instance)
 
         @router.post(
             "/stream",
@@ -484,6 +518,8 @@ def create_multi_serve_app(
             request: StreamRequest,
         ) -> StreamingResponse:
             """Stream the execution of the flow with real-time events."""
+            graph_instance = await acquire_graph(flow_id, pool)
+            released_by_task = False
             try:
                 # Import here to avoid potential circular imports
                 from lfx.events.event_manager import create_stream_tokens_event_manager
@@ -494,13 +530,16 @@ def create_multi_serve_app(
 
                 main_task = asyncio.create_task(
                     run_flow_generator_for_serve(
-                        graph=graph,
+                        graph=graph_instance,
                         input_request=request,
                         flow_id=flow_id,
                         event_manager=event_manager,
                         client_consumed_queue=asyncio_queue_client_consumed,
                     )
                 )
+                # Also runs when the client disconnects and the task is cancelled before it starts
+                main_task.add_done_callback(lambda _: pool.release_soon(graph_instance))
+                released_by_task = True
 
                 async def on_disconnect() -> None:
                     logger.debug(f"Client disconnected from flow {flow_id}, closing tasks")
@@ -512,6 +551,8 @@ def create_multi_serve_app(
                     media_type="text/event-stream",
                 )
             except Exception as exc:  # noqa: BLE001
+                if not released_by_task:
+                    pool.release_soon(graph_instance)
                 logger.error(f"Error setting up streaming for flow {flow_id}: {exc}")
                 # Return a simple error stream
                 error_message = f"Failed to start streaming: {exc!s}"
@@ -540,7 +581,7 @@ def create_multi_serve_app(
 
     for flow_id, graph in graphs.items():
         meta = metas[flow_id]
-        router = create_flow_router(flow_id, graph, meta)
+        router = create_flow_router(flow_id, graph, meta, pools[flow_id])
         app.include_router(router)
 
     return app
@@ -0,0 +1,167 @@
+"""Pre-fork worker processes for the serve command.
+
+A single server process runs every request on one event loop, so CPU-bound components serialize all
+requests on one core. In worker mode the serve command loads and prepares its flows and builds the app
+once, then, after its event loop has exited, forks worker processes that share the listening socket. The kernel spreads incoming
+connections over the workers, and the loaded flows, pre-warmed graph pools and imported component
+modules are shared copy-on-write with the parent instead of being loaded again in every worker.
+
+A worker that has served ``max_requests`` requests shuts down gracefully and is replaced by a fresh
+fork, which bounds the memory a long-running worker can accumulate.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import gc
+import os
+import random
+import signal
+import time
+from typing import TYPE_CHECKING
+
+from lfx.log.logger import logger
+
+if TYPE_CHECKING:
+    import socket
+
+    import uvicorn
+
+# A worker that exits sooner than this after being forked is respawned only after a back-off
+MIN_WORKER_LIFETIME_SECONDS = 1.0
+
+
+def supports_workers() -> bool:
+    """Return whether worker processes can be forked on this platform."""
+    return hasattr(os, "fork")
+
+
+def worker_request_limit(max_requests: int | None, max_requests_jitter: int = 0) -> int | None:
+    """Return how many requests a new worker serves before it is recycled.
+
+    A random jitter of up to ``max_requests_jitter`` is added so that workers started together are not
+    all recycled at the same time.
+    """
+    if not max_requests:
+        return None
+    return max_requests + random.randint(0, max(max_requests_jitter, 0))  # noqa: S311
+
+
+class WorkerSupervisor:
+    """Forks and supervises the worker processes of the serve command.
+
+    Attributes:
+        config (uvicorn.Config): Server configuration shared by every worker.
+        workers (int): Number of worker processes to keep running.
+        max_requests (int | None): Requests a worker serves before it is recycled. ``None`` disables recycling.
+        max_requests_jitter (int): Maximum random number of requests added to ``max_requests`` per worker.
+    """
+
+    def __init__(
+        self,
+        config: uvicorn.Config,
+        workers: int,
+        *,
+        max_requests: int | None = None,
+        max_requests_jitter: int = 0,
+    ) -> None:
+        if workers < 1:
+            msg = "At least one worker is required"
+            raise ValueError(msg)
+        self.config = config
+        self.workers = workers
+        self.max_requests = max_requests
+        self.max_requests_jitter = max_requests_jitter
+        self.recycled = 0
+        self._processes: dict[int, float] = {}
+        self._should_exit = False
+
+    def run(self) -> None:
+        """Bind the socket, fork the workers and replace them as they exit until a shutdown signal.
+
+        It must be called outside of any event loop: a forked worker would inherit the running loop,
+        and the locks held by the threads serving it, in whatever state they were at fork time.
+
+        Raises:
+            RuntimeError: If an event loop is running in the calling thread.
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            pass
+        else:
+            msg = "Worker processes must be forked outside of a running event loop"
+            raise RuntimeError(msg)
+        sock = self.config.bind_socket()
+        # Keep the objects loaded so far out of the garbage collector, which would otherwise write to
+        # them and defeat copy-on-write sharing with the workers
+        gc.collect()
+        gc.freeze()
+        previous_handlers = {sig: signal.signal(sig, self._handle_exit) for sig in (signal.SIGINT, signal.SIGTERM)}
+        try:
+            for _ in range(self.workers):
+                self._spawn_worker(sock)
+            while self._processes:
+                try:
+                    pid, status = os.wait()
+                except ChildProcessError:
+                    break
+                started_at = self._processes.pop(pid, None)
+                if started_at is None or self._should_exit:
+                    continue
+                exit_code = os.waitstatus_to_exitcode(status)
+                if exit_code == 0:
+                    self.recycled += 1
+                    logger.info(f"Worker {pid} exited after reaching its request limit, starting a new one")
+                else:
+                    logger.warning(f"Worker {pid} exited with code {exit_code}, starting a new one")
+                if time.monotonic() - started_at < MIN_WORKER_LIFETIME_SECONDS:
+                    # Avoid a busy loop of forks when workers fail during startup
+                    time.sleep(MIN_WORKER_LIFETIME_SECONDS)
+                if not self._should_exit:
+                    self._spawn_worker(sock)
+        finally:
+            for sig, handler in previous_handlers.items():
+                signal.signal(sig, handler)
+            gc.unfreeze()
+            sock.close()
+
+    def _handle_exit(self, sig: int, _frame) -> None:
+        self._should_exit = True
+        for pid in list(self._processes):
+            try:
+                os.kill(pid, sig)
+            except ProcessLookupError:
+                self._processes.pop(pid, None)
+
+    def _spawn_worker(self, sock: socket.socket) -> None:
+        pid = os.fork()
+        if pid == 0:
+            exit_code = 0
+            try:
+                self._run_worker(sock)
+            except BaseException:  # noqa: BLE001
+                logger.exception("Worker process failed")
+                exit_code = 1
+            finally:
+                # Never return into the parent's call stack from the forked process
+                os._exit(exit_code)
+        self._processes[pid] = time.monotonic()
+        logger.debug(f"Started worker {pid}")
+
+    def _run_worker(self, sock: socket.socket) -> None:
+        import uvicorn
+
+        # Forked workers share the parent's random state, which would give them the same jitter
+        random.seed()
+        self._processes.clear()
+        self.config.limit_max_requests = worker_request_limit(self.max_requests, self.max_requests_jitter)
+        server = uvicorn.Server(self.config)
+
+        def request_exit(*_args) -> None:
+            server.should_exit = True
+
+        # The server installs its own handlers once it runs, these cover the time until then
+        signal.signal(signal.SIGINT, request_exit)
+        signal.signal(signal.SIGTERM, request_exit)
+        server.run(sockets=[sock])
@@ -1,4 +1,5 @@
-from lfx.base.data.utils import TEXT_FILE_TYPES, parallel_load_data, parse_text_file_to_data, retrieve_file_paths
+from lfx.base.data.parse_cache import get_parsed_file_cache
+from lfx.base.data.utils import TEXT_FILE_TYPES, parallel_load_data, retrieve_file_paths
 from lfx.custom.custom_component.component import Component
 from lfx.io import BoolInput, IntInput, MessageTextInput, MultiselectInput
 from lfx.schema.data import Data
@@ -65,6 +66,20 @@ class DirectoryComponent(Component):
             advanced=True,
             info="If true, multithreading will be used.",
         ),
+        BoolInput(
+            name="cache_parsed_files",
+            display_name="Cache Parsed Files",
+            advanced=True,
+            value=True,
+            info="If true, files that were parsed before with the same content are not parsed again.",
+        ),
+        BoolInput(
+            name="parse_in_processes",
+            display_name="Parse in Separate Processes",
+            advanced=True,
+            value=False,
+            info="If true, multithreading parses files in separate processes, which speeds up CPU-heavy parsing.",
+        ),
     ]
 
     outputs = [
@@ -99,11 +114,13 @@ class DirectoryComponent(Component):
             resolved_path, load_hidden=load_hidden, recursive=recursive, depth=depth, types=valid_types
         )
 
-        loaded_data = []
-        if use_multithreading:
-            loaded_data = parallel_load_data(file_paths, silent_errors=silent_errors, max_concurrency=max_concurrency)
-        else:
-            loaded_data = [parse_text_file_to_data(file_path, silent_errors=silent_errors) for file_path in file_paths]
+        loaded_data = parallel_load_data(
+            file_paths,
+            silent_errors=silent_errors,
+            max_concurrency=max_concurrency if use_multithreading else 1,
+            cache=get_parsed_file_cache() if self.cache_parsed_files else None,
+            use_processes=bool(self.parse_in_processes),
+        )
 
         valid_data = [x for x in loaded_data if x is not None and isinstance(x, Data)]
         self.status = valid_data
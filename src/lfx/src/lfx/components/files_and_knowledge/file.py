@@ -21,6 +21,7 @@ from tempfile import NamedTemporaryFile
 from typing import Any
 
 from lfx.base.data.base_file import BaseFileComponent
+from lfx.base.data.parse_cache import get_parsed_file_cache
 from lfx.base.data.storage_utils import parse_storage_path, read_file_bytes, validate_image_content_type
 from lfx.base.data.utils import TEXT_FILE_TYPES, parallel_load_data, parse_text_file_to_data
 from lfx.inputs import SortableListInput
@@ -249,6 +250,23 @@ class FileComponent(BaseFileComponent):
             info="When multiple files are being processed, the number of files to process concurrently.",
             value=1,
         ),
+        BoolInput(
+            name="cache_parsed_files",
+            display_name="Cache Parsed Files",
+            advanced=True,
+            value=True,
+            info="Reuse the parsed content of files that were parsed before with the same content.",
+        ),
+        BoolInput(
+            name="parse_in_processes",
+            display_name="Parse in Separate Processes",
+            advanced=True,
+            value=False,
+            info=(
+                "Parse files in separate processes instead of threads. "
+                "Speeds up CPU-heavy parsing such as PDFs when 'Processing Concurrency' is greater than 1."
+            ),
+        ),
         BoolInput(
             name="markdown",
             display_name="Markdown Export",
@@ -1188,13 +1206,18 @@ class FileComponent(BaseFileComponent):
         # Standard multi-file (or single non-advanced) path
         concurrency = 1 if not self.use_multithreading else max(1, self.concurrency_multithreading)
 
+        # Worker processes cannot run the local helper, which only adds logging around the parser
+        use_processes = self.parse_in_processes and settings.storage_type != "s3"
+
         file_paths = [str(f.path) for f in file_list]
         self.log(f"Starting parallel processing of {len(file_paths)} files with concurrency: {concurrency}.")
         my_data = parallel_load_data(
             file_paths,
             silent_errors=self.silent_errors,
-            load_function=process_file_standard,
+            load_function=parse_text_file_to_data if use_processes else process_file_standard,
             max_concurrency=concurrency,
+            cache=get_parsed_file_cache() if self.cache_parsed_files else None,
+            use_processes=use_processes,
         )
         return self.rollup_data(file_list, my_data)
 
@@ -17,6 +17,8 @@ from langchain_chroma import Chroma
 from langflow.services.auth.utils import decrypt_api_key, encrypt_api_key
 from langflow.services.database.models.user.crud import get_user_by_id
 
+from lfx.base.knowledge_bases.kb_handles import invalidate_kb_handles
+from lfx.base.knowledge_bases.kb_stats import count_text, update_kb_stats
 from lfx.base.knowledge_bases.knowledge_base_utils import get_knowledge_bases
 from lfx.base.models.openai_constants import OPENAI_EMBEDDING_MODEL_NAMES
 from lfx.components.processing.converter import convert_to_dataframe
@@ -41,6 +43,8 @@ from lfx.services.deps import (
 from lfx.utils.validate_cloud import raise_error_if_astra_cloud_disable_component
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
+
     from lfx.schema.dataframe import DataFrame
 
 HUGGINGFACE_MODEL_NAMES = [
@@ -51,6 +55,9 @@ COHERE_MODEL_NAMES = ["embed-english-v3.0", "embed-multilingual-v3.0"]
 
 _KNOWLEDGE_BASES_ROOT_PATH: Path | None = None
 
+# Maximum number of hashes looked up in the collection with a single query
+DEDUP_QUERY_SIZE = 500
+
 # Error message to raise if we're in Astra cloud environment and the component is not supported.
 astra_error_msg = "Knowledge ingestion is not supported in Astra cloud environment."
 
@@ -319,6 +326,7 @@ class KnowledgeIngestionComponent(Component):
         embedding_metadata = self._build_embedding_metadata(embedding_model, api_key)
         metadata_path = kb_path / "embedding_metadata.json"
         metadata_path.write_text(json.dumps(embedding_metadata, indent=2))
+        invalidate_kb_handles(kb_path)
 
     def _save_kb_files(
         self,
@@ -377,8 +385,13 @@ class KnowledgeIngestionComponent(Component):
         config_list: list[dict[str, Any]],
         embedding_model: str,
         api_key: str,
-    ) -> None:
-        """Create vector store following Local DB component pattern."""
+    ) -> int:
+        """Embed and add the rows of the DataFrame to the vector store in batches.
+
+        Returns:
+            int: The number of documents added.
+        """
+        added_documents = 0
         try:
             # Set up vector store directory
             vector_store_dir = await self._kb_path()
@@ -390,9 +403,6 @@ class KnowledgeIngestionComponent(Component):
             # Create embeddings model
             embedding_function = self._build_embeddings(embedding_model, api_key)
 
-            # Convert DataFrame to Data objects (following Local DB pattern)
-            data_objects = await self._convert_df_to_data_objects(df_source, config_list)
-
             # Create vector store
             chroma = Chroma(
                 persist_directory=str(vector_store_dir),
@@ -400,42 +410,59 @@ class KnowledgeIngestionComponent(Component):
                 collection_name=self.knowledge_base,
             )
 
-            # Convert Data objects to LangChain Documents
-            documents = []
-            for data_obj in data_objects:
-                doc = data_obj.to_lc_document()
-                documents.append(doc)
-
-            # Add documents to vector store
-            if documents:
-                chroma.add_documents(documents)
-                self.log(f"Added {len(documents)} documents to vector store '{self.knowledge_base}'")
+            # A manifest can only be started from zero if the collection has no documents yet
+            create_stats = chroma._collection.count() == 0  # noqa: SLF001
+            total_rows = len(df_source)
+            processed_rows = 0
+            for rows_in_batch, data_objects in self._iter_data_batches(df_source, config_list, chroma):
+                processed_rows += rows_in_batch
+                if data_objects:
+                    documents = [data_obj.to_lc_document() for data_obj in data_objects]
+                    # Embedding is blocking network or model work, keep it off the event loop
+                    await asyncio.to_thread(chroma.add_documents, documents)
+                    added_documents += len(documents)
+                    words, characters = count_text(doc.page_content for doc in documents)
+                    update_kb_stats(
+                        vector_store_dir,
+                        chunks=len(documents),
+                        words=words,
+                        characters=characters,
+                        embedding_provider=self._get_embedding_provider(embedding_model),
+                        embedding_model=embedding_model,
+                        create=create_stats,
+                    )
+                self.log(
+                    f"Processed {processed_rows}/{total_rows} rows, "
+                    f"added {added_documents} documents to '{self.knowledge_base}'"
+                )
+            if added_documents:
+                # Retrieval must reopen the knowledge base to see what was written
+                invalidate_kb_handles(vector_store_dir)
 
         except (OSError, ValueError, RuntimeError) as e:
             self.log(f"Error creating vector store: {e}")
+        return added_documents
 
     async def _convert_df_to_data_objects(
         self, df_source: pd.DataFrame, config_list: list[dict[str, Any]]
     ) -> list[Data]:
         """Convert DataFrame to Data objects for vector store."""
-        data_objects: list[Data] = []
-
         # Set up vector store directory
         kb_path = await self._kb_path()
 
-        # If we don't allow duplicates, we need to get the existing hashes
+        # The collection is only used to look up the hashes that are already stored
         chroma = Chroma(
             persist_directory=str(kb_path),
             collection_name=self.knowledge_base,
         )
-
-        # Get all documents and their metadata
-        all_docs = chroma.get()
-
-        # Extract all _id values from metadata
-        id_list = [metadata.get("_id") for metadata in all_docs["metadatas"] if metadata.get("_id")]
-
-        # Get column roles
+        return [
+            data_obj
+            for _, data_objects in self._iter_data_batches(df_source, config_list, chroma)
+            for data_obj in data_objects
+        ]
+
+    def _get_column_roles(self, config_list: list[dict[str, Any]]) -> tuple[list[str], list[str]]:
+        """Return the vectorized (content) columns and the identifier columns."""
         content_cols = []
         identifier_cols = []
 
@@ -448,46 +475,82 @@ class KnowledgeIngestionComponent(Component):
                 content_cols.append(col_name)
             elif identifier:
                 identifier_cols.append(col_name)
+        return content_cols, identifier_cols
 
-        # Convert each row to a Data object
-        for _, row in df_source.iterrows():
-            # Build content text from identifier columns using list comprehension
-            identifier_parts = [str(row[col]) for col in content_cols if col in row and pd.notna(row[col])]
-
-            # Join all parts into a single string
-            page_content = " ".join(identifier_parts)
-
-            # Build metadata from NON-vectorized columns only (simple key-value pairs)
-            data_dict = {
-                "text": page_content,  # Main content for vectorization
-            }
-
-            # Add identifier columns if they exist
-            if identifier_cols:
-                identifier_parts = [str(row[col]) for col in identifier_cols if col in row and pd.notna(row[col])]
-                page_content = " ".join(identifier_parts)
+    def _iter_data_batches(
+        self, df_source: pd.DataFrame, config_list: list[dict[str, Any]], chroma: Chroma
+    ) -> Iterator[tuple[int, list[Data]]]:
+        """Yield the rows of the DataFrame as Data objects, one batch of ``chunk_size`` rows at a time.
 
-            # Add metadata columns as simple key-value pairs
-            for col in df_source.columns:
-                if col not in content_cols and col in row and pd.notna(row[col]):
-                    # Convert to simple types for Chroma metadata
-                    value = row[col]
-                    data_dict[col] = str(value)  # Convert complex types to string
+        Each item is the number of rows in the batch and the Data objects to add for them. When
+        duplicates are disallowed, rows whose hash is already in the collection or earlier in the
+        input are left out, so only the current batch is ever held in memory.
+        """
+        content_cols, identifier_cols = self._get_column_roles(config_list)
+        metadata_cols = [col for col in df_source.columns if col not in content_cols]
+        batch_size = max(int(self.chunk_size or 0), 1)
+        seen_hashes: set[str] = set()
+
+        for start in range(0, len(df_source), batch_size):
+            batch_df = df_source.iloc[start : start + batch_size]
+            data_objects = [
+                self._row_to_data_object(row, content_cols, identifier_cols, metadata_cols)
+                for row in batch_df.to_dict("records")
+            ]
+            if not self.allow_duplicates:
+                data_objects = self._drop_duplicate_rows(data_objects, chroma, seen_hashes)
+            yield len(batch_df), data_objects
+
+    @staticmethod
+    def _row_to_data_object(
+        row: dict[str, Any], content_cols: list[str], identifier_cols: list[str], metadata_cols: list[str]
+    ) -> Data:
+        # Build content text from the vectorized columns
+        page_content = " ".join(str(row[col]) for col in content_cols if col in row and pd.notna(row[col]))
+
+        # Build metadata from NON-vectorized columns only (simple key-value pairs)
+        data_dict = {
+            "text": page_content,  # Main content for vectorization
+        }
 
-            # Hash the page_content for unique ID
-            page_content_hash = hashlib.sha256(page_content.encode()).hexdigest()
-            data_dict["_id"] = page_content_hash
+        # Identifier columns, if any, decide what makes a row unique
+        hashed_content = page_content
+        if identifier_cols:
+            hashed_content = " ".join(str(row[col]) for col in identifier_cols if col in row and pd.notna(row[col]))
+
+        # Add metadata columns as simple key-value pairs
+        for col in metadata_cols:
+            value = row.get(col)
+            if pd.notna(value):
+                data_dict[col] = str(value)  # Convert complex types to string
+
+        # Hash the content for unique ID
+        data_dict["_id"] = hashlib.sha256(hashed_content.encode()).hexdigest()
+
+        # Create Data object - everything except "text" becomes metadata
+        return Data(data=data_dict)
+
+    def _drop_duplicate_rows(self, data_objects: list[Data], chroma: Chroma, seen_hashes: set[str]) -> list[Data]:
+        """Remove the Data objects whose hash is already stored or was seen earlier in this ingestion."""
+        batch_hashes = list({data_obj.data["_id"] for data_obj in data_objects} - seen_hashes)
+        for start in range(0, len(batch_hashes), DEDUP_QUERY_SIZE):
+            # Only the matching documents are read, not the whole collection
+            existing = chroma.get(
+                where={"_id": {"$in": batch_hashes[start : start + DEDUP_QUERY_SIZE]}}, include=["metadatas"]
+            )
+            seen_hashes.update(metadata.get("_id") for metadata in existing["metadatas"] if metadata)
 
+        unique_objects = []
+        for data_obj in data_objects:
+            page_content_hash = data_obj.data["_id"]
             # If duplicates are disallowed, and hash exists, prevent adding this row
-            if not self.allow_duplicates and page_content_hash in id_list:
-                self.log(f"Skipping duplicate row with hash {page_content_hash}")
+            if page_content_hash in seen_hashes:
                 continue
-
-            # Create Data object - everything except "text" becomes metadata
-            data_obj = Data(data=data_dict)
-            data_objects.append(data_obj)
-
-        return data_objects
+            seen_hashes.add(page_content_hash)
+            unique_objects.append(data_obj)
+        if skipped := len(data_objects) - len(unique_objects):
+            self.log(f"Skipped {skipped} duplicate rows")
+        return unique_objects
 
     def is_valid_collection_name(self, name, min_length: int = 3, max_length: int = 63) -> bool:
         """Validates collection name against conditions 1-3.
@@ -5,16 +5,16 @@ from typing import Any
 from cryptography.fernet import InvalidToken
 from langchain_chroma import Chroma
 from langflow.services.auth.utils import decrypt_api_key
-from langflow.services.database.models.user.crud import get_user_by_id
 from pydantic import SecretStr
 
+from lfx.base.knowledge_bases.kb_handles import KnowledgeBaseHandle, get_kb_username, kb_handle_cache
 from lfx.base.knowledge_bases.knowledge_base_utils import get_knowledge_bases
 from lfx.custom import Component
 from lfx.io import BoolInput, DropdownInput, IntInput, MessageTextInput, Output, SecretStrInput
 from lfx.log.logger import logger
 from lfx.schema.data import Data
 from lfx.schema.dataframe import DataFrame
-from lfx.services.deps import get_settings_service, session_scope
+from lfx.services.deps import get_settings_service
 from lfx.utils.validate_cloud import raise_error_if_astra_cloud_disable_component
 
 _KNOWLEDGE_BASES_ROOT_PATH: Path | None = None
@@ -186,25 +186,15 @@ class KnowledgeRetrievalComponent(Component):
         msg = f"Embedding provider '{provider}' is not supported for retrieval."
         raise NotImplementedError(msg)
 
-    async def retrieve_data(self) -> DataFrame:
-        """Retrieve data from the selected knowledge base by reading the Chroma collection.
-
-        Returns:
-            A DataFrame containing the data rows from the knowledge base.
-        """
-        # Check if we're in Astra cloud environment and raise an error if we are.
-        raise_error_if_astra_cloud_disable_component(astra_error_msg)
-        # Get the current user
-        async with session_scope() as db:
-            if not self.user_id:
-                msg = "User ID is required for fetching Knowledge Base data."
-                raise ValueError(msg)
-            current_user = await get_user_by_id(db, self.user_id)
-            if not current_user:
-                msg = f"User with ID {self.user_id} not found."
-                raise ValueError(msg)
-            kb_user = current_user.username
-        kb_path = _get_knowledge_bases_root_path() / kb_user / self.knowledge_base
+    def _open_knowledge_base(self, kb_path: Path) -> KnowledgeBaseHandle:
+        """Return the cached vector store and embedder of a knowledge base, opening it on a miss."""
+        runtime_api_key = self.api_key.get_secret_value() if isinstance(self.api_key, SecretStr) else self.api_key
+        key = kb_handle_cache.make_key(
+            kb_path, self.knowledge_base, kb_path / "embedding_metadata.json", api_key=runtime_api_key or None
+        )
+        handle = kb_handle_cache.get(key)
+        if handle is not None:
+            return handle
 
         metadata = self._get_kb_metadata(kb_path)
         if not metadata:
@@ -220,6 +210,48 @@ class KnowledgeRetrievalComponent(Component):
             embedding_function=embedding_function,
             collection_name=self.knowledge_base,
         )
+        handle = KnowledgeBaseHandle(vector_store=chroma, embedding_function=embedding_function, metadata=metadata)
+        kb_handle_cache.put(key, handle)
+        return handle
+
+    def _get_result_embeddings(self, chroma: Chroma, results: list) -> dict[str, Any]:
+        """Fetch the embeddings of every result with a single lookup, keyed by their ``_id``."""
+        id_to_embedding: dict[str, Any] = {}
+        # Results carry their Chroma ids, which are looked up by primary key
+        docs_by_id = {doc.id: doc for doc, _ in results if getattr(doc, "id", None)}
+        if docs_by_id:
+            embeddings_result = chroma._collection.get(ids=list(docs_by_id), include=["embeddings"])  # noqa: SLF001
+            for doc_id, embedding in zip(embeddings_result["ids"], embeddings_result["embeddings"], strict=False):
+                doc_hash = docs_by_id[doc_id].metadata.get("_id")
+                if doc_hash:
+                    id_to_embedding[doc_hash] = embedding
+            return id_to_embedding
+
+        doc_ids = [doc.metadata.get("_id") for doc, _ in results if doc.metadata.get("_id")]
+        # Only proceed if we have valid document IDs
+        if doc_ids:
+            # Access underlying collection to get embeddings
+            collection = chroma._collection  # noqa: SLF001
+            embeddings_result = collection.get(where={"_id": {"$in": doc_ids}}, include=["metadatas", "embeddings"])
+
+            # Create a mapping from document ID to embedding
+            for i, metadata in enumerate(embeddings_result.get("metadatas", [])):
+                if metadata and "_id" in metadata:
+                    id_to_embedding[metadata["_id"]] = embeddings_result["embeddings"][i]
+        return id_to_embedding
+
+    async def retrieve_data(self) -> DataFrame:
+        """Retrieve data from the selected knowledge base by reading the Chroma collection.
+
+        Returns:
+            A DataFrame containing the data rows from the knowledge base.
+        """
+        # Check if we're in Astra cloud environment and raise an error if we are.
+        raise_error_if_astra_cloud_disable_component(astra_error_msg)
+        kb_user = await get_kb_username(self.user_id)
+        kb_path = _get_knowledge_bases_root_path() / kb_user / self.knowledge_base
+
+        chroma = self._open_knowledge_base(kb_path).vector_store
 
         # If a search query is provided, perform a similarity search
         if self.search_query:
@@ -239,20 +271,7 @@ class KnowledgeRetrievalComponent(Component):
             results = [(doc, 0) for doc in results]  # Assign a dummy score of 0
 
         # If include_embeddings is enabled, get embeddings for the results
-        id_to_embedding = {}
-        if self.include_embeddings and results:
-            doc_ids = [doc[0].metadata.get("_id") for doc in results if doc[0].metadata.get("_id")]
-
-            # Only proceed if we have valid document IDs
-            if doc_ids:
-                # Access underlying collection to get embeddings
-                collection = chroma._collection  # noqa: SLF001
-                embeddings_result = collection.get(where={"_id": {"$in": doc_ids}}, include=["metadatas", "embeddings"])
-
-                # Create a mapping from document ID to embedding
-                for i, metadata in enumerate(embeddings_result.get("metadatas", [])):
-                    if metadata and "_id" in metadata:
-                        id_to_embedding[metadata["_id"]] = embeddings_result["embeddings"][i]
+        id_to_embedding = self._get_result_embeddings(chroma, results) if self.include_embeddings else {}
 
         # Build output data based on include_metadata setting
         data_list = []
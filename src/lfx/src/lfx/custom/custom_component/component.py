@@ -22,6 +22,7 @@ from lfx.base.tools.constants import (
     TOOLS_METADATA_INPUT_NAME,
 )
 from lfx.custom.tree_visitor import RequiredInputsVisitor
+from lfx.events.event_manager import TokenCoalescer
 from lfx.exceptions.component import StreamingError
 from lfx.field_typing import Tool  # noqa: TC001
 
@@ -30,13 +31,14 @@ from lfx.field_typing import Tool  # noqa: TC001
 # Lazy import to avoid circular dependency
 # from lfx.graph.utils import has_chat_output
 from lfx.helpers.custom import format_type
-from lfx.memory import astore_message, aupdate_messages, delete_message
+from lfx.memory import abuffer_message, aflush_messages, astore_message, aupsert_messages, delete_message
 from lfx.schema.artifact import get_artifact_type, post_process_raw
 from lfx.schema.data import Data
 from lfx.schema.log import Log
 from lfx.schema.message import ErrorMessage, Message
 from lfx.schema.properties import Source
 from lfx.serialization.serialization import serialize
+from lfx.services.deps import get_settings_service
 from lfx.template.field.base import UNDEFINED, Input, Output
 from lfx.template.frontend_node.custom_components import ComponentFrontendNode
 from lfx.utils.async_helpers import run_until_complete
@@ -1629,8 +1631,13 @@ class Component(CustomComponent):
             # Note: If this fails, we don't need DB cleanup since we didn't write to DB
             await self._send_message_event(stored_message, id_=id_)
         else:
-            # Normal flow: store/update in database
-            stored_message = await self._store_message(message)
+            # Normal flow: store/update in database. A message that is going to stream is only
+            # buffered here and written once, complete, by _update_stored_message
+            buffered = self._will_stream_message(message)
+            if buffered:
+                stored_message = await self._buffer_message(message)
+            else:
+                stored_message = await self._store_message(message)
 
             self._stored_message_id = stored_message.id
             try:
@@ -1655,6 +1662,11 @@ class Component(CustomComponent):
                 # remove the message from the database
                 await delete_message(stored_message.id)
                 raise
+            finally:
+                if buffered:
+                    # A stream that did not complete, e.g. because it was cancelled, must not
+                    # leave its message in the buffer
+                    await aflush_messages(message_id=stored_message.id)
         self.status = stored_message
         return stored_message
 
@@ -1670,6 +1682,13 @@ class Component(CustomComponent):
         stored_message = stored_messages[0]
         return await Message.create(**stored_message.model_dump())
 
+    async def _buffer_message(self, message: Message) -> Message:
+        flow_id: str | None = None
+        if hasattr(self, "graph"):
+            flow_id = str(self.graph.flow_id) if self.graph.flow_id else None
+        buffered_message = await abuffer_message(message, flow_id=flow_id)
+        return await Message.create(**buffered_message.model_dump())
+
     async def _send_message_event(self, message: Message, id_: str | None = None, category: str | None = None) -> None:
         if hasattr(self, "_event_manager") and self._event_manager:
             data_dict = message.model_dump()["data"] if hasattr(message, "data") else message.model_dump()
@@ -1695,6 +1714,13 @@ class Component(CustomComponent):
 
             await asyncio.to_thread(_send_event)
 
+    def _will_stream_message(self, message: Message) -> bool:
+        return bool(
+            hasattr(self, "_event_manager")
+            and self._event_manager
+            and isinstance(message.text, AsyncIterator | Iterator)
+        )
+
     def _should_stream_message(self, stored_message: Message, original_message: Message) -> bool:
         return bool(
             hasattr(self, "_event_manager")
@@ -1704,7 +1730,7 @@ class Component(CustomComponent):
         )
 
     async def _update_stored_message(self, message: Message) -> Message:
-        """Update the stored message."""
+        """Write the complete message, replacing the buffered or stored one."""
         if hasattr(self, "_vertex") and self._vertex is not None and hasattr(self._vertex, "graph"):
             flow_id = (
                 UUID(self._vertex.graph.flow_id)
@@ -1714,45 +1740,87 @@ class Component(CustomComponent):
 
             message.flow_id = flow_id
 
-        message_tables = await aupdate_messages(message)
+        message_tables = await aupsert_messages(message)
         if not message_tables:
             msg = "Failed to update message"
             raise ValueError(msg)
         message_table = message_tables[0]
         return await Message.create(**message_table.model_dump())
 
+    def _create_token_coalescer(self, message_id: str) -> TokenCoalescer:
+        """Create the token coalescer used to batch the token events of a streamed message."""
+        interval = 0.0
+        max_bytes = 0
+        settings_service = get_settings_service()
+        if settings_service:
+            interval = settings_service.settings.token_coalesce_interval_ms / 1000
+            max_bytes = settings_service.settings.token_coalesce_max_bytes
+        return TokenCoalescer(self._event_manager, str(message_id), interval=interval, max_bytes=max_bytes)
+
     async def _stream_message(self, iterator: AsyncIterator | Iterator, message: Message) -> str:
         if not isinstance(iterator, AsyncIterator | Iterator):
             msg = "The message must be an iterator or an async iterator."
             raise TypeError(msg)
 
+        token_coalescer = self._create_token_coalescer(message.id) if self._event_manager else None
         if isinstance(iterator, AsyncIterator):
-            return await self._handle_async_iterator(iterator, message.id, message)
+            return await self._handle_async_iterator(iterator, message.id, message, token_coalescer=token_coalescer)
         try:
             complete_message = ""
             first_chunk = True
             for chunk in iterator:
                 complete_message = await self._process_chunk(
-                    chunk.content, complete_message, message.id, message, first_chunk=first_chunk
+                    chunk.content,
+                    complete_message,
+                    message.id,
+                    message,
+                    first_chunk=first_chunk,
+                    token_coalescer=token_coalescer,
                 )
                 first_chunk = False
         except Exception as e:
             raise StreamingError(cause=e, source=message.properties.source) from e
         else:
             return complete_message
+        finally:
+            if token_coalescer:
+                token_coalescer.flush()
 
-    async def _handle_async_iterator(self, iterator: AsyncIterator, message_id: str, message: Message) -> str:
+    async def _handle_async_iterator(
+        self,
+        iterator: AsyncIterator,
+        message_id: str,
+        message: Message,
+        *,
+        token_coalescer: TokenCoalescer | None = None,
+    ) -> str:
         complete_message = ""
         first_chunk = True
-        async for chunk in iterator:
-            complete_message = await self._process_chunk(
-                chunk.content, complete_message, message_id, message, first_chunk=first_chunk
-            )
-            first_chunk = False
+        try:
+            async for chunk in iterator:
+                complete_message = await self._process_chunk(
+                    chunk.content,
+                    complete_message,
+                    message_id,
+                    message,
+                    first_chunk=first_chunk,
+                    token_coalescer=token_coalescer,
+                )
+                first_chunk = False
+        finally:
+            if token_coalescer:
+                token_coalescer.flush()
         return complete_message
 
     async def _process_chunk(
-        self, chunk: str, complete_message: str, message_id: str, message: Message, *, first_chunk: bool = False
+        self,
+        chunk: str,
+        complete_message: str,
+        message_id: str,
+        message: Message,
+        *,
+        first_chunk: bool = False,
+        token_coalescer: TokenCoalescer | None = None,
     ) -> str:
         complete_message += chunk
         if self._event_manager:
@@ -1761,13 +1829,14 @@ class Component(CustomComponent):
                 msg_copy = message.model_copy()
                 msg_copy.text = complete_message
                 await self._send_message_event(msg_copy, id_=message_id)
-            await asyncio.to_thread(
-                self._event_manager.on_token,
-                data={
-                    "chunk": chunk,
-                    "id": str(message_id),
-                },
-            )
+            # Token events are only queued, so they are sent inline instead of hopping to a thread
+            if token_coalescer is None:
+                self._event_manager.on_token(data={"chunk": chunk, "id": str(message_id)})
+            else:
+                token_coalescer.add(chunk)
+                if first_chunk:
+                    # Don't delay the first token
+                    token_coalescer.flush()
         return complete_message
 
     async def send_error(
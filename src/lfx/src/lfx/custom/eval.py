@@ -1,3 +1,6 @@
+import hashlib
+import threading
+from collections import OrderedDict
 from typing import TYPE_CHECKING
 
 from lfx.custom import validate
@@ -5,8 +8,89 @@ from lfx.custom import validate
 if TYPE_CHECKING:
     from lfx.custom.custom_component.custom_component import CustomComponent
 
+DEFAULT_COMPONENT_CLASS_CACHE_SIZE = 256
+
+
+def hash_component_code(code: str) -> str:
+    """Return the content hash used to key compiled component classes."""
+    return hashlib.sha256(code.encode("utf-8")).hexdigest()
+
+
+class ComponentClassCache:
+    """Process-wide LRU cache of compiled custom component classes.
+
+    Classes are keyed by a SHA-256 hash of their source code, so two vertices running the
+    same component code share a single compiled class instead of re-parsing and re-executing
+    the code for every instantiation.
+
+    Attributes:
+        max_size (int): Maximum number of classes to keep. Least recently used entries are evicted first.
+        hits (int): Number of lookups served from the cache.
+        misses (int): Number of lookups that required compiling the code.
+    """
+
+    def __init__(self, max_size: int = DEFAULT_COMPONENT_CLASS_CACHE_SIZE) -> None:
+        self._cache: OrderedDict[str, type] = OrderedDict()
+        self._lock = threading.RLock()
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_create(self, code: str) -> type["CustomComponent"]:
+        """Return the compiled class for ``code``, compiling and caching it on a miss."""
+        key = hash_component_code(code)
+        with self._lock:
+            if (cached_class := self._cache.get(key)) is not None:
+                self._cache.move_to_end(key)
+                self.hits += 1
+                return cached_class
+            self.misses += 1
+
+        # Compile outside the lock so a slow import does not block other lookups.
+        class_name = validate.extract_class_name(code)
+        component_class = validate.create_class(code, class_name)
+
+        with self._lock:
+            self._cache[key] = component_class
+            self._cache.move_to_end(key)
+            while self.max_size and len(self._cache) > self.max_size:
+                self._cache.popitem(last=False)
+        return component_class
+
+    def invalidate(self, code: str) -> bool:
+        """Drop the cached class for ``code``.
+
+        Returns:
+            bool: True if an entry was removed.
+        """
+        with self._lock:
+            return self._cache.pop(hash_component_code(code), None) is not None
+
+    def clear(self) -> None:
+        """Remove every cached class and reset the counters."""
+        with self._lock:
+            self._cache.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> dict[str, int]:
+        """Return the cache size and hit/miss counters."""
+        with self._lock:
+            return {"size": len(self._cache), "max_size": self.max_size, "hits": self.hits, "misses": self.misses}
+
+    def __contains__(self, code: str) -> bool:
+        key = hash_component_code(code)
+        with self._lock:
+            return key in self._cache
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._cache)
+
+
+component_class_cache = ComponentClassCache()
+
 
 def eval_custom_component_code(code: str) -> type["CustomComponent"]:
-    """Evaluate custom component code."""
-    class_name = validate.extract_class_name(code)
-    return validate.create_class(code, class_name)
+    """Evaluate custom component code, reusing the compiled class when the code is unchanged."""
+    return component_class_cache.get_or_create(code)
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import inspect
+import itertools
 import json
 import time
 import uuid
@@ -16,6 +17,8 @@ if TYPE_CHECKING:
     # Lightweight type stub for log types
     LoggableType = dict | str | int | float | bool | list | None
 
+_JSON_SCALARS = (str, int, float, bool, type(None))
+
 
 class EventCallback(Protocol):
     def __call__(self, *, manager: EventManager, event_type: str, data: LoggableType): ...
@@ -29,6 +32,9 @@ class EventManager:
     def __init__(self, queue):
         self.queue = queue
         self.events: dict[str, PartialEventCallback] = {}
+        # Event ids only need to be unique per manager, so a counter avoids a uuid4 per event
+        self._event_id_prefix = uuid.uuid4().hex[:8]
+        self._event_counter = itertools.count()
 
     @staticmethod
     def _validate_callback(callback: EventCallback) -> None:
@@ -71,9 +77,13 @@ class EventManager:
                 pass
         except Exception:  # noqa: BLE001
             logger.debug(f"Error processing event: {event_type}")
-        jsonable_data = jsonable_encoder(data)
+        # Flat dicts of JSON scalars (e.g. token chunks) don't need the jsonable_encoder round trip
+        if isinstance(data, dict) and all(isinstance(value, _JSON_SCALARS) for value in data.values()):
+            jsonable_data = data
+        else:
+            jsonable_data = jsonable_encoder(data)
         json_data = {"event": event_type, "data": jsonable_data}
-        event_id = f"{event_type}-{uuid.uuid4()}"
+        event_id = f"{event_type}-{self._event_id_prefix}-{next(self._event_counter)}"
         str_data = json.dumps(json_data) + "\n\n"
         if self.queue:
             try:
@@ -88,6 +98,51 @@ class EventManager:
         return self.events.get(name, self.noop)
 
 
+class TokenCoalescer:
+    """Batches streamed LLM tokens into fewer ``token`` events.
+
+    Chunks are buffered until either ``interval`` seconds have passed since the last flush or the
+    buffered text reaches ``max_bytes``. A value of ``0`` disables the respective limit; with both
+    limits disabled every chunk is sent as soon as it is added. Each flush sends a regular ``token``
+    event whose ``chunk`` is the concatenation of the buffered chunks, so consumers of the event
+    stream do not need to know whether coalescing is enabled.
+    """
+
+    def __init__(self, event_manager: EventManager, message_id: str, *, interval: float = 0, max_bytes: int = 0):
+        self.event_manager = event_manager
+        self.message_id = message_id
+        self.interval = interval
+        self.max_bytes = max_bytes
+        self._chunks: list[str] = []
+        self._size = 0
+        self._last_flush = time.monotonic()
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.interval or self.max_bytes)
+
+    def add(self, chunk: str) -> None:
+        if not chunk:
+            return
+        self._chunks.append(chunk)
+        self._size += len(chunk.encode("utf-8")) if self.max_bytes else len(chunk)
+        if (
+            not self.enabled
+            or (self.max_bytes and self._size >= self.max_bytes)
+            or (self.interval and time.monotonic() - self._last_flush >= self.interval)
+        ):
+            self.flush()
+
+    def flush(self) -> None:
+        self._last_flush = time.monotonic()
+        if not self._chunks:
+            return
+        chunk = "".join(self._chunks)
+        self._chunks.clear()
+        self._size = 0
+        self.event_manager.on_token(data={"chunk": chunk, "id": self.message_id})
+
+
 def create_default_event_manager(queue=None):
     manager = EventManager(queue)
     manager.register_event("on_token", "token")
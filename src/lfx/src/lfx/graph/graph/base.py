@@ -4,6 +4,7 @@ import asyncio
 import contextlib
 import contextvars
 import copy
+import hashlib
 import json
 import queue
 import threading
@@ -13,11 +14,13 @@ from collections import defaultdict, deque
 from datetime import datetime, timezone
 from functools import partial
 from itertools import chain
-from typing import TYPE_CHECKING, Any, cast
+from typing import TYPE_CHECKING, Any, Literal, cast
+
+import orjson
 
 from lfx.exceptions.component import ComponentBuildError
 from lfx.graph.edge.base import CycleEdge, Edge
-from lfx.graph.graph.constants import Finish, lazy_load_vertex_dict
+from lfx.graph.graph.constants import GRAPH_RUN_STATE_VERSION, Finish, lazy_load_vertex_dict
 from lfx.graph.graph.runnable_vertices_manager import RunnableVerticesManager
 from lfx.graph.graph.schema import GraphData, GraphDump, StartConfigDict, VertexBuildResult
 from lfx.graph.graph.state_model import create_state_model_from_graph
@@ -38,7 +41,14 @@ from lfx.log.logger import LogConfig, configure, logger
 from lfx.schema.dotdict import dotdict
 from lfx.schema.schema import INPUT_FIELD_NAME, InputType, OutputValue
 from lfx.services.cache.utils import CacheMiss
-from lfx.services.deps import get_chat_service, get_tracing_service
+from lfx.services.deps import (
+    get_chat_service,
+    get_settings_service,
+    get_tracing_service,
+    get_variable_service,
+    session_scope_readonly,
+)
+from lfx.services.session import NoopSession
 from lfx.utils.async_helpers import run_until_complete
 
 if TYPE_CHECKING:
@@ -106,6 +116,9 @@ class Graph:
         self.conditionally_excluded_vertices: set = set()  # Vertices excluded by conditional routing
         self.conditional_exclusion_sources: dict[str, set[str]] = {}  # Maps source vertex -> excluded vertices
         self.edges: list[CycleEdge] = []
+        # Edge indexes kept in sync with self.edges, see _build_edge_indexes
+        self._vertex_edges: dict[str, list[CycleEdge]] = {}
+        self._edge_by_vertices: dict[tuple[str, str], CycleEdge] = {}
         self.vertices: list[Vertex] = []
         self.run_manager = RunnableVerticesManager()
         self._vertices: list[NodeData] = []
@@ -121,6 +134,8 @@ class Graph:
         self._first_layer: list[str] = []
         self._lock: asyncio.Lock | None = None
         self.raw_graph_data: GraphData = {"nodes": [], "edges": []}
+        # The payload the fingerprint was computed from, and the fingerprint
+        self._payload_fingerprint: tuple[GraphData, str] | None = None
         self._is_cyclic: bool | None = None
         self._cycles: list[tuple[str, str]] | None = None
         self._cycle_vertices: set[str] | None = None
@@ -650,6 +665,43 @@ class Graph:
                 user_id=self.user_id,
                 session_id=self.session_id,
             )
+        await self.prefetch_variables()
+
+    def get_referenced_variable_names(self) -> set[str]:
+        """Return the names of the global variables that fields of the graph load from the database."""
+        request_variables = (self.context or {}).get("request_variables") or {}
+        names = set()
+        for vertex in self.vertices:
+            for field in vertex.load_from_db_fields:
+                name = vertex.params.get(field)
+                if isinstance(name, str) and name and name not in request_variables:
+                    names.add(name)
+        return names
+
+    async def prefetch_variables(self) -> None:
+        """Load the global variables referenced by the graph in one query before its vertices are built.
+
+        Building each vertex then resolves its variables from the variable service's cache instead of
+        querying and decrypting them one field at a time.
+        """
+        settings_service = get_settings_service()
+        if not self.user_id or (settings_service and settings_service.settings.use_noop_database):
+            return
+        variable_service = get_variable_service()
+        if not hasattr(variable_service, "prefetch_variables"):
+            return
+        names = self.get_referenced_variable_names()
+        if not names:
+            return
+        try:
+            user_id = uuid.UUID(self.user_id) if isinstance(self.user_id, str) else self.user_id
+            async with session_scope_readonly() as session:
+                if isinstance(session, NoopSession):
+                    return
+                await variable_service.prefetch_variables(user_id=user_id, names=names, session=session)
+        except Exception:  # noqa: BLE001
+            # Variables that could not be prefetched are still loaded one by one when their vertex is built
+            logger.debug("Could not prefetch global variables", exc_info=True)
 
     def _end_all_traces_async(self, outputs: dict[str, Any] | None = None, error: Exception | None = None) -> None:
         task = asyncio.create_task(self.end_all_traces(outputs, error))
@@ -909,6 +961,7 @@ class Graph:
             vertices = self.vertices
 
         self.predecessor_map, self.successor_map = self.build_adjacency_maps(edges)
+        self._build_edge_indexes()
 
         self.in_degree_map = self.build_in_degree(edges)
         self.parent_child_map = self.build_parent_child_map(vertices)
@@ -1024,10 +1077,21 @@ class Graph:
 
     def get_edge(self, source_id: str, target_id: str) -> CycleEdge | None:
         """Returns the edge between two vertices."""
+        return self._edge_by_vertices.get((source_id, target_id))
+
+    def _build_edge_indexes(self) -> None:
+        """Rebuilds the indexes used to look up edges by vertex."""
+        self._vertex_edges = {}
+        self._edge_by_vertices = {}
         for edge in self.edges:
-            if edge.source_id == source_id and edge.target_id == target_id:
-                return edge
-        return None
+            self._index_edge(edge)
+
+    def _index_edge(self, edge: CycleEdge) -> None:
+        """Adds an edge to the indexes used to look up edges by vertex."""
+        self._vertex_edges.setdefault(edge.source_id, []).append(edge)
+        if edge.target_id != edge.source_id:
+            self._vertex_edges.setdefault(edge.target_id, []).append(edge)
+        self._edge_by_vertices.setdefault((edge.source_id, edge.target_id), edge)
 
     def build_parent_child_map(self, vertices: list[Vertex]):
         parent_child_map = defaultdict(list)
@@ -1108,6 +1172,72 @@ class Graph:
 
         return new_graph
 
+    def clone(self, *, user_id: str | None = None, context: dict[str, Any] | None = None) -> Graph:
+        """Creates an unbuilt copy of this graph that is ready for a new run.
+
+        Unlike ``copy.deepcopy``, this does not go through ``add_nodes_and_edges`` again: the
+        flattened payload, edge handle validation and vertex parameters of this graph are reused,
+        and only the per-run state (vertices, edges, maps and run manager) is copied. The raw node
+        payloads are shared with this graph and must be treated as read-only. Component instances
+        are never shared; they are re-instantiated for the clone.
+
+        Args:
+            user_id: The user ID for the clone. Defaults to this graph's user ID.
+            context: Optional context dictionary for request-specific data.
+
+        Returns:
+            Graph: A new graph with the same topology and fresh run state.
+        """
+        if self._start is not None or self._end is not None:
+            # Graphs built from component instances cannot be re-instantiated from their payload
+            new_graph = copy.deepcopy(self)
+            new_graph.user_id = user_id if user_id is not None else self.user_id
+            new_graph.context = context or {}
+            return new_graph
+
+        new_graph = type(self)(
+            flow_id=self.flow_id,
+            flow_name=self.flow_name,
+            description=self.description,
+            user_id=user_id if user_id is not None else self.user_id,
+            context=context,
+        )
+        new_graph.__dict__.update(self._copy_run_state(new_graph))
+        new_graph.build_graph_maps(new_graph.edges)
+        new_graph.run_manager.cycle_vertices = set(self.run_manager.cycle_vertices)
+        for vertex in new_graph.vertices:
+            vertex.instantiate_component(new_graph.user_id)
+        return new_graph
+
+    def _copy_run_state(self, new_graph: Graph) -> dict[str, Any]:
+        """Returns the attributes ``clone`` copies from this graph into ``new_graph``."""
+        memo: dict[int, Any] = {id(self): new_graph}
+        for vertex in self.vertices:
+            # Node payloads are read-only and component instances must not leak between runs
+            memo[id(vertex.full_data)] = vertex.full_data
+            memo[id(vertex.data)] = vertex.data
+            if vertex.custom_component is not None:
+                memo[id(vertex.custom_component)] = None
+
+        vertices = copy.deepcopy(self.vertices, memo)
+        return {
+            "vertices": vertices,
+            "edges": copy.deepcopy(self.edges, memo),
+            "vertex_map": {vertex.id: vertex for vertex in vertices},
+            "_vertices": list(self._vertices),
+            "_edges": list(self._edges),
+            "raw_graph_data": self.raw_graph_data,
+            "_payload_fingerprint": getattr(self, "_payload_fingerprint", None),
+            "top_level_vertices": list(self.top_level_vertices),
+            "_is_input_vertices": list(self._is_input_vertices),
+            "_is_output_vertices": list(self._is_output_vertices),
+            "_is_state_vertices": None if self._is_state_vertices is None else list(self._is_state_vertices),
+            "has_session_id_vertices": list(self.has_session_id_vertices),
+            "_is_cyclic": self._is_cyclic,
+            "_cycles": None if self._cycles is None else list(self._cycles),
+            "_cycle_vertices": None if self._cycle_vertices is None else set(self._cycle_vertices),
+        }
+
     def __setstate__(self, state):
         run_manager = state["run_manager"]
         if isinstance(run_manager, RunnableVerticesManager):
@@ -1116,9 +1246,129 @@ class Graph:
             state["run_manager"] = RunnableVerticesManager.from_dict(run_manager)
         self.__dict__.update(state)
         self.vertex_map = {vertex.id: vertex for vertex in self.vertices}
+        self._build_edge_indexes()
         # Tracing service will be lazily initialized via property when needed
         self.set_run_id(self._run_id)
 
+    @property
+    def payload_fingerprint(self) -> str:
+        """Hash of the payload the graph was built from.
+
+        It is computed once per payload, which is treated as read-only like in ``clone``.
+        """
+        cached = getattr(self, "_payload_fingerprint", None)
+        if cached is not None and cached[0] is self.raw_graph_data:
+            return cached[1]
+        payload = orjson.dumps(self.raw_graph_data, option=orjson.OPT_SORT_KEYS, default=str)
+        fingerprint = hashlib.sha256(payload).hexdigest()
+        self._payload_fingerprint = (self.raw_graph_data, fingerprint)
+        return fingerprint
+
+    def get_run_state(self) -> dict[str, Any]:
+        """Returns a compact, versioned snapshot of the current run.
+
+        The snapshot holds the fingerprint of the payload the graph was built from, the run manager
+        state and the results of the vertices that ran, but not the payload itself, vertex
+        parameters, built objects, component instances or edges, so it stays small whatever the size
+        of the flow. ``from_run_state`` restores it into a graph built from the same payload.
+
+        Returns:
+            dict[str, Any]: The run-state snapshot.
+        """
+        return {
+            "version": GRAPH_RUN_STATE_VERSION,
+            "flow_id": self.flow_id,
+            "flow_name": self.flow_name,
+            "description": self.description,
+            "user_id": self.user_id,
+            "session_id": self._session_id,
+            "run_id": self._run_id,
+            "graph_fingerprint": self.payload_fingerprint,
+            "prepared": self._prepared,
+            "runs": self._runs,
+            "run_manager": self.run_manager.to_dict(),
+            "first_layer": self._first_layer,
+            "run_queue": list(self._run_queue),
+            "vertices_layers": self.vertices_layers,
+            "sorted_vertices_layers": self._sorted_vertices_layers,
+            "vertices_to_run": self.vertices_to_run,
+            "stop_vertex": self.stop_vertex,
+            "inactivated_vertices": self.inactivated_vertices,
+            "activated_vertices": self.activated_vertices,
+            "conditionally_excluded_vertices": self.conditionally_excluded_vertices,
+            "conditional_exclusion_sources": self.conditional_exclusion_sources,
+            "vertices": {
+                vertex.id: vertex.get_run_state()
+                for vertex in self.vertices
+                if vertex.built or vertex.result is not None or vertex.state != VertexStates.ACTIVE
+            },
+        }
+
+    @classmethod
+    def from_run_state(cls, run_state: dict[str, Any], template: Graph) -> Graph:
+        """Rebuilds a graph from a snapshot created by ``get_run_state``.
+
+        Args:
+            run_state: The run-state snapshot.
+            template: An unbuilt graph created from the payload of the snapshot. It is cloned, and
+                the run state is restored into the clone.
+
+        Returns:
+            Graph: The graph in the state it had when the snapshot was taken.
+
+        Raises:
+            ValueError: If the snapshot was created with another snapshot version, or from
+                another payload than the template.
+        """
+        version = run_state.get("version")
+        if version != GRAPH_RUN_STATE_VERSION:
+            msg = f"Unsupported graph run state version: {version}. Expected {GRAPH_RUN_STATE_VERSION}"
+            raise ValueError(msg)
+        if template.payload_fingerprint != run_state["graph_fingerprint"]:
+            msg = "The graph run state was not created from the payload of the template"
+            raise ValueError(msg)
+        graph = template.clone(user_id=run_state["user_id"])
+        graph.load_run_state(run_state)
+        return graph
+
+    def load_run_state(self, run_state: dict[str, Any]) -> None:
+        """Restores the run state saved by ``get_run_state`` into this graph.
+
+        The graph must have been built from the payload the snapshot was created from. The snapshot
+        is copied, so it can be restored again, for instance when it is kept in an in-process cache.
+        """
+        state = copy.deepcopy(run_state)
+        self.flow_id = state["flow_id"]
+        self.flow_name = state["flow_name"]
+        self.description = state["description"]
+        self.user_id = state["user_id"]
+        self._prepared = state["prepared"]
+        self._runs = state["runs"]
+        if state["run_id"]:
+            self.set_run_id(state["run_id"])
+        cycle_vertices = self.run_manager.cycle_vertices
+        self.run_manager = RunnableVerticesManager.from_dict(state["run_manager"])
+        self.run_manager.cycle_vertices = cycle_vertices
+        self._first_layer = state["first_layer"]
+        self._run_queue = deque(state["run_queue"])
+        self.vertices_layers = state["vertices_layers"]
+        self._sorted_vertices_layers = state["sorted_vertices_layers"]
+        self.vertices_to_run = state["vertices_to_run"]
+        self.stop_vertex = state["stop_vertex"]
+        self.inactivated_vertices = state["inactivated_vertices"]
+        self.activated_vertices = state["activated_vertices"]
+        self.conditionally_excluded_vertices = state["conditionally_excluded_vertices"]
+        self.conditional_exclusion_sources = state["conditional_exclusion_sources"]
+        if session_id := state["session_id"]:
+            self.session_id = session_id
+            for vertex_id in self.has_session_id_vertices:
+                vertex = self.get_vertex(vertex_id)
+                if not vertex.raw_params.get("session_id"):
+                    vertex.update_raw_params({"session_id": session_id}, overwrite=True)
+        for vertex_id, vertex_state in state["vertices"].items():
+            if vertex_id in self.vertex_map:
+                self.vertex_map[vertex_id].load_run_state(vertex_state)
+
     @classmethod
     def from_payload(
         cls,
@@ -1178,6 +1428,7 @@ class Graph:
             new_edges.append(edge)
         new_edges += other_vertex.edges
         self.edges = new_edges
+        self._build_edge_indexes()
 
     def vertex_data_is_identical(self, vertex: Vertex, other_vertex: Vertex) -> bool:
         data_is_equivalent = vertex == other_vertex
@@ -1288,12 +1539,14 @@ class Graph:
         for edge in vertex.edges:
             if edge not in self.edges and edge.source_id in self.vertex_map and edge.target_id in self.vertex_map:
                 self.edges.append(edge)
+                self._index_edge(edge)
 
     def _build_graph(self) -> None:
         """Builds the graph from the vertices and edges."""
         self.vertices = self._build_vertices()
         self.vertex_map = {vertex.id: vertex for vertex in self.vertices}
         self.edges = self._build_edges()
+        self._build_edge_indexes()
 
         # This is a hack to make sure that the LLM vertex is sent to
         # the toolkit vertex
@@ -1350,6 +1603,7 @@ class Graph:
         self.vertices.remove(vertex)
         self.vertex_map.pop(vertex_id)
         self.edges = [edge for edge in self.edges if vertex_id not in {edge.source_id, edge.target_id}]
+        self._build_edge_indexes()
 
     def _build_vertex_params(self) -> None:
         """Identifies and handles the LLM vertex within the graph."""
@@ -1603,7 +1857,7 @@ class Graph:
         # or both
         return [
             edge
-            for edge in self.edges
+            for edge in self._vertex_edges.get(vertex_id, [])
             if (edge.source_id == vertex_id and is_source is not False)
             or (edge.target_id == vertex_id and is_target is not False)
         ]
@@ -1611,7 +1865,7 @@ class Graph:
     def get_vertices_with_target(self, vertex_id: str) -> list[Vertex]:
         """Returns the vertices connected to a vertex."""
         vertices: list[Vertex] = []
-        for edge in self.edges:
+        for edge in self._vertex_edges.get(vertex_id, []):
             if edge.target_id == vertex_id:
                 vertex = self.get_vertex(edge.source_id)
                 if vertex is None:
@@ -1625,13 +1879,27 @@ class Graph:
         fallback_to_env_vars: bool,
         start_component_id: str | None = None,
         event_manager: EventManager | None = None,
+        scheduler: Literal["layered", "dataflow"] | None = None,
+        max_concurrency: int | None = None,
     ) -> Graph:
-        """Processes the graph with vertices in each layer run in parallel."""
+        """Processes the graph, running independent vertices in parallel.
+
+        The ``layered`` scheduler runs the vertices of each layer in parallel and waits for the whole layer
+        before starting the next one. The ``dataflow`` scheduler starts each vertex as soon as its predecessors
+        are built, building at most ``max_concurrency`` vertices at once (0 means no limit).
+        Both default to the ``graph_scheduler`` and ``graph_max_concurrency`` settings.
+        """
+        if scheduler is None or max_concurrency is None:
+            settings_service = get_settings_service()
+            settings = settings_service.settings if settings_service else None
+            if scheduler is None:
+                scheduler = settings.graph_scheduler if settings else "layered"
+            if max_concurrency is None:
+                max_concurrency = settings.graph_max_concurrency if settings else 0
+
         has_webhook_component = "webhook" in start_component_id.lower() if start_component_id else False
         first_layer = self.sort_vertices(start_component_id=start_component_id)
         vertex_task_run_count: dict[str, int] = {}
-        to_process = deque(first_layer)
-        layer_index = 0
         chat_service = get_chat_service()
 
         # Provide fallback cache functions if chat service is unavailable
@@ -1646,28 +1914,42 @@ class Graph:
             async def set_cache_func(*args, **kwargs):
                 pass
 
+        def create_build_task(vertex_id: str) -> asyncio.Task:
+            vertex = self.get_vertex(vertex_id)
+            task = asyncio.create_task(
+                self.build_vertex(
+                    vertex_id=vertex_id,
+                    user_id=self.user_id,
+                    inputs_dict={},
+                    fallback_to_env_vars=fallback_to_env_vars,
+                    get_cache=get_cache_func,
+                    set_cache=set_cache_func,
+                    event_manager=event_manager,
+                ),
+                name=f"{vertex.id} Run {vertex_task_run_count.get(vertex_id, 0)}",
+            )
+            vertex_task_run_count[vertex_id] = vertex_task_run_count.get(vertex_id, 0) + 1
+            return task
+
         await self.initialize_run()
         lock = asyncio.Lock()
+        if scheduler == "dataflow":
+            await self._process_dataflow(
+                first_layer,
+                create_build_task,
+                lock=lock,
+                max_concurrency=max_concurrency,
+                has_webhook_component=has_webhook_component,
+            )
+            await logger.adebug("Graph processing complete")
+            return self
+
+        to_process = deque(first_layer)
+        layer_index = 0
         while to_process:
             current_batch = list(to_process)  # Copy current deque items to a list
             to_process.clear()  # Clear the deque for new items
-            tasks = []
-            for vertex_id in current_batch:
-                vertex = self.get_vertex(vertex_id)
-                task = asyncio.create_task(
-                    self.build_vertex(
-                        vertex_id=vertex_id,
-                        user_id=self.user_id,
-                        inputs_dict={},
-                        fallback_to_env_vars=fallback_to_env_vars,
-                        get_cache=get_cache_func,
-                        set_cache=set_cache_func,
-                        event_manager=event_manager,
-                    ),
-                    name=f"{vertex.id} Run {vertex_task_run_count.get(vertex_id, 0)}",
-                )
-                tasks.append(task)
-                vertex_task_run_count[vertex_id] = vertex_task_run_count.get(vertex_id, 0) + 1
+            tasks = [create_build_task(vertex_id) for vertex_id in current_batch]
 
             await logger.adebug(f"Running layer {layer_index} with {len(tasks)} tasks, {current_batch}")
             try:
@@ -1685,6 +1967,84 @@ class Graph:
         await logger.adebug("Graph processing complete")
         return self
 
+    async def _process_dataflow(
+        self,
+        first_layer: list[str],
+        create_build_task: Callable[[str], asyncio.Task],
+        *,
+        lock: asyncio.Lock,
+        max_concurrency: int,
+        has_webhook_component: bool = False,
+    ) -> None:
+        """Builds each vertex as soon as all of its predecessors are built.
+
+        Every completed vertex is removed from the pending predecessors of its successors in the run manager,
+        and the successors left without pending predecessors are started right away instead of waiting for
+        the rest of the layer.
+
+        Args:
+            first_layer: The IDs of the vertices to start with
+            create_build_task: Creates the task that builds a vertex
+            lock: Async lock for synchronization
+            max_concurrency: Maximum number of vertices built at once, 0 means no limit
+            has_webhook_component: Whether the graph has a webhook component
+        """
+        ready: deque[str] = deque()
+        running: dict[asyncio.Task, str] = {}
+        rerun: set[str] = set()
+
+        def schedule(vertex_ids: Iterable[str]) -> None:
+            for vertex_id in vertex_ids:
+                if vertex_id in ready:
+                    continue
+                if vertex_id in running.values():
+                    # Activated again while being built, run it once more when it is done
+                    rerun.add(vertex_id)
+                    continue
+                # Mark it as being run so it is not picked again as a runnable predecessor while it waits
+                self.run_manager.add_to_vertices_being_run(vertex_id)
+                ready.append(vertex_id)
+
+        schedule(first_layer)
+        try:
+            while ready or running:
+                while ready and (not max_concurrency or len(running) < max_concurrency):
+                    vertex_id = ready.popleft()
+                    self.run_manager.add_to_vertices_being_run(vertex_id)
+                    running[create_build_task(vertex_id)] = vertex_id
+
+                await logger.adebug(f"Running {len(running)} tasks, {len(ready)} waiting: {sorted(running.values())}")
+                done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    vertex_id = running.pop(task)
+                    task_name = task.get_name()
+                    result = task.exception() or task.result()
+                    if isinstance(result, BaseException):
+                        await logger.aerror(f"Task {task_name} failed with exception: {result}")
+                        if has_webhook_component:
+                            await self._log_vertex_build_from_exception(vertex_id, result)
+                        raise result
+                    if not isinstance(result, VertexBuildResult):
+                        msg = f"Invalid result from task {task_name}: {result}"
+                        raise TypeError(msg)
+                    await self._log_vertex_build_result(result)
+
+                    vertex = result.vertex
+                    await logger.adebug(
+                        f"Vertex {vertex.id}, result: {vertex.built_result}, object: {vertex.built_object}"
+                    )
+                    next_runnable_vertices = await self.get_next_runnable_vertices(lock, vertex=vertex, cache=False)
+                    if vertex_id in rerun:
+                        rerun.discard(vertex_id)
+                        next_runnable_vertices.append(vertex_id)
+                    schedule(next_runnable_vertices)
+        except Exception:
+            await logger.aexception("Error executing tasks")
+            raise
+        finally:
+            for task in running:
+                task.cancel()
+
     def find_next_runnable_vertices(self, vertex_successors_ids: list[str]) -> list[str]:
         """Determines the next set of runnable vertices from a list of successor vertex IDs.
 
@@ -1773,6 +2133,18 @@ class Graph:
             artifacts={},
         )
 
+    async def _log_vertex_build_result(self, result: VertexBuildResult) -> None:
+        """Records a successful vertex build using the vertex build logging system."""
+        if self.flow_id is not None:
+            await log_vertex_build(
+                flow_id=self.flow_id,
+                vertex_id=result.vertex.id,
+                valid=result.valid,
+                params=result.params,
+                data=result.result_dict,
+                artifacts=result.artifacts,
+            )
+
     async def _execute_tasks(
         self, tasks: list[asyncio.Task], lock: asyncio.Lock, *, has_webhook_component: bool = False
     ) -> list[str]:
@@ -1801,16 +2173,7 @@ class Graph:
                     t.cancel()
                 raise result
             if isinstance(result, VertexBuildResult):
-                if self.flow_id is not None:
-                    await log_vertex_build(
-                        flow_id=self.flow_id,
-                        vertex_id=result.vertex.id,
-                        valid=result.valid,
-                        params=result.params,
-                        data=result.result_dict,
-                        artifacts=result.artifacts,
-                    )
-
+                await self._log_vertex_build_result(result)
                 vertices.append(result.vertex)
             else:
                 msg = f"Invalid result from task {task_name}: {result}"
@@ -1949,7 +2312,7 @@ class Graph:
         The count reflects the number of edges between the input vertex and each neighbor.
         """
         neighbors: dict[Vertex, int] = {}
-        for edge in self.edges:
+        for edge in self._vertex_edges.get(vertex.id, []):
             if edge.source_id == vertex.id:
                 neighbor = self.get_vertex(edge.target_id)
                 if neighbor is None:
@@ -8,6 +8,9 @@ if TYPE_CHECKING:
     from lfx.graph.vertex.base import Vertex
     from lfx.graph.vertex.vertex_types import CustomComponentVertex
 
+# Bump when the layout of Graph.get_run_state changes so old snapshots are rebuilt instead of loaded
+GRAPH_RUN_STATE_VERSION = 2
+
 
 class Finish:
     def __bool__(self) -> bool:
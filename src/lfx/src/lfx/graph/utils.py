@@ -150,14 +150,15 @@ async def log_vertex_build(
     """Asynchronously logs a vertex build record if vertex build storage is enabled.
 
     This is a lightweight implementation that only logs if database service is available.
-    When running within langflow, it will use langflow's database service to persist the build.
+    When running within langflow, the build is handed to langflow's vertex build logger service,
+    which buffers it and persists it with the next bulk write.
     When running standalone (lfx only), it will only log debug messages.
     """
     try:
         # Try to use langflow's services if available (when running within langflow)
         try:
-            from langflow.services.deps import get_db_service as langflow_get_db_service
             from langflow.services.deps import get_settings_service as langflow_get_settings_service
+            from langflow.services.deps import get_vertex_build_logger_service
 
             settings_service = langflow_get_settings_service()
             if not settings_service:
@@ -168,9 +169,6 @@ async def log_vertex_build(
             if isinstance(flow_id, str):
                 flow_id = UUID(flow_id)
 
-            from langflow.services.database.models.vertex_builds.crud import (
-                log_vertex_build as crud_log_vertex_build,
-            )
             from langflow.services.database.models.vertex_builds.model import VertexBuildBase
 
             # Convert data to dict if it's a pydantic model
@@ -197,12 +195,8 @@ async def log_vertex_build(
                 artifacts=artifacts_dict,
             )
 
-            db_service = langflow_get_db_service()
-            if db_service is None:
-                return
-
-            async with db_service._with_session() as session:  # noqa: SLF001
-                await crud_log_vertex_build(session, vertex_build)
+            # Builds are buffered and written in bulk by the write-behind vertex build logger
+            await get_vertex_build_logger_service().log_vertex_build(vertex_build)
 
         except ImportError:
             # Fallback for standalone lfx usage (without langflow)
@@ -234,6 +234,40 @@ class Vertex:
         self.built_object = state.get("built_object") or UnbuiltObject()
         self.built_result = state.get("built_result") or UnbuiltResult()
 
+    def get_run_state(self) -> dict[str, Any]:
+        """Returns the build state of the vertex for a graph run-state snapshot.
+
+        The built object is left out, as it can hold clients and other heavy objects; successors
+        read the outputs of a built vertex from its results.
+        """
+        return {
+            "state": self.state.name,
+            "built": self.built,
+            "results": self.results,
+            "result": self.result,
+            "artifacts": self.artifacts,
+            "artifacts_raw": self.artifacts_raw,
+            "artifacts_type": self.artifacts_type,
+            "outputs_logs": self.outputs_logs,
+            "logs": self.logs,
+            "build_times": self.build_times,
+        }
+
+    def load_run_state(self, state: dict[str, Any]) -> None:
+        """Restores the build state saved by ``get_run_state``."""
+        self.state = VertexStates[state["state"]]
+        self.built = state["built"]
+        self.results = state["results"]
+        self.built_object = dict(self.results) if self.built else UnbuiltObject()
+        self.built_result = UnbuiltResult()
+        self.result = state["result"]
+        self.artifacts = state["artifacts"]
+        self.artifacts_raw = state["artifacts_raw"]
+        self.artifacts_type = state["artifacts_type"]
+        self.outputs_logs = state["outputs_logs"]
+        self.logs = state["logs"]
+        self.build_times = state["build_times"]
+
     def set_top_level(self, top_level_vertices: list[str]) -> None:
         self.parent_is_top_level = self.parent_node_id in top_level_vertices
 
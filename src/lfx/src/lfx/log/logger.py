@@ -5,13 +5,13 @@ import logging
 import logging.handlers
 import os
 import sys
-from collections import deque
+import time
+from collections.abc import Callable
 from datetime import datetime
 from pathlib import Path
 from threading import Lock, Semaphore
 from typing import Any, TypedDict
 
-import orjson
 import structlog
 from platformdirs import user_cache_dir
 from typing_extensions import NotRequired
@@ -30,8 +30,27 @@ LOG_LEVEL_MAP = {
 }
 
 
+# Lock-free reads that keep racing with writers fall back to reading under the write lock
+MAX_LOCK_FREE_READS = 3
+
+
+def _to_epoch_ms(timestamp: Any) -> int:
+    """Convert a structlog timestamp (ISO string or seconds) to epoch milliseconds."""
+    if isinstance(timestamp, str):
+        # Parse ISO format timestamp
+        dt = datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
+        return int(dt.timestamp() * 1000)
+    return int((timestamp or 0) * 1000)
+
+
 class SizedLogBuffer:
-    """A buffer for storing log messages for the log retrieval API."""
+    """A buffer for storing log messages for the log retrieval API.
+
+    Entries are ``(epoch_ms, message)`` tuples kept in a fixed-size ring indexed by a global sequence
+    number, so the entry with sequence ``seq`` lives in slot ``seq % max``. Timestamps never decrease,
+    which lets range queries binary search the ring. Writers serialize on the write lock; readers copy
+    what they need without it and retry if a writer overwrote the entries they read in the meantime.
+    """
 
     def __init__(
         self,
@@ -42,7 +61,10 @@ class SizedLogBuffer:
         The buffer can be overwritten by an env variable LANGFLOW_LOG_RETRIEVER_BUFFER_SIZE
         because the logger is initialized before the settings_service are loaded.
         """
-        self.buffer: deque = deque()
+        # The slots and the sequence number of the oldest entry kept in them, swapped together on resize
+        self._ring: tuple[list[tuple[int, Any] | None], int] = ([], 0)
+        self._seq = 0
+        self._last_epoch = 0
 
         self._max_readers = max_readers
         self._wlock = Lock()
@@ -54,7 +76,7 @@ class SizedLogBuffer:
         return self._wlock
 
     def write(self, message: str) -> None:
-        """Write a message to the buffer."""
+        """Parse a serialized log record and write it to the buffer."""
         record = json.loads(message)
         log_entry = record.get("event", record.get("msg", record.get("text", "")))
 
@@ -65,72 +87,140 @@ class SizedLogBuffer:
             time_info = record["record"].get("time", {})
             timestamp = time_info.get("timestamp", 0)
 
-        if isinstance(timestamp, str):
-            # Parse ISO format timestamp
-            dt = datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
-            epoch = int(dt.timestamp() * 1000)
-        else:
-            epoch = int(timestamp * 1000)
+        self.append(_to_epoch_ms(timestamp), log_entry)
 
+    def append(self, epoch: int, message: Any) -> None:
+        """Append a log entry to the buffer, overwriting the oldest one when it is full."""
+        capacity = self.max
+        if capacity <= 0:
+            return
+        with self._wlock:
+            slots, _ = self._ring
+            if len(slots) != capacity:
+                slots = self._resize(capacity)
+            # Keep the timestamps sorted for the range queries, even if the clock goes back
+            epoch = max(epoch, self._last_epoch)
+            self._last_epoch = epoch
+            seq = self._seq
+            slots[seq % capacity] = (epoch, message)
+            # Publish the entry only once its slot has been written
+            self._seq = seq + 1
+
+    def _resize(self, capacity: int) -> list[tuple[int, Any] | None]:
+        old_slots, old_first = self._ring
+        first = max(self._seq - capacity, old_first, self._seq - len(old_slots))
+        slots: list[tuple[int, Any] | None] = [None] * capacity
+        for seq in range(first, self._seq):
+            slots[seq % capacity] = old_slots[seq % len(old_slots)]
+        self._ring = (slots, first)
+        return slots
+
+    def _read(self, reader: Callable[[list, int, int], tuple[Any, int]]) -> Any:
+        """Run ``reader(slots, first, end)`` over a consistent view of the entries.
+
+        ``reader`` returns its result and the lowest sequence number it read. The result is only used
+        if no writer has overwritten that entry in the meantime, which means every entry read was valid.
+        A writer may be filling the slot of the next sequence number while it is read, so the oldest entry
+        of a full ring can only be read under the lock.
+        """
+        for _ in range(MAX_LOCK_FREE_READS):
+            slots, first = self._ring
+            end = self._seq
+            if not slots:
+                return reader(slots, end, end)[0]
+            result, lowest = reader(slots, max(first, end - len(slots)), end)
+            if self._ring[0] is not slots:
+                continue
+            if self._seq + 1 - len(slots) <= lowest:
+                return result
+            if self._seq == end:
+                # Nothing was written meanwhile, so only the oldest entry was at risk and retrying won't help
+                break
         with self._wlock:
-            if len(self.buffer) >= self.max:
-                for _ in range(len(self.buffer) - self.max + 1):
-                    self.buffer.popleft()
-            self.buffer.append((epoch, log_entry))
+            slots, first = self._ring
+            end = self._seq
+            return reader(slots, max(first, end - len(slots)) if slots else end, end)[0]
+
+    @staticmethod
+    def _entries(slots: list, start: int, stop: int) -> list[tuple[int, Any]]:
+        capacity = len(slots)
+        return [slots[seq % capacity] for seq in range(start, stop)]
+
+    @staticmethod
+    def _bisect(slots: list, first: int, end: int, timestamp: int) -> tuple[int, int]:
+        """Return the sequence number of the first entry at or after ``timestamp`` and the lowest one read."""
+        capacity = len(slots)
+        lo, hi = first, end
+        lowest = end
+        while lo < hi:
+            mid = (lo + hi) // 2
+            lowest = min(lowest, mid)
+            if slots[mid % capacity][0] < timestamp:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo, lowest
+
+    @property
+    def buffer(self) -> list[tuple[int, Any]]:
+        """Snapshot of the buffered entries, oldest first."""
+        return self._read(lambda slots, first, end: (self._entries(slots, first, end), first))
 
     def __len__(self) -> int:
         """Get the length of the buffer."""
-        return len(self.buffer)
+        slots, first = self._ring
+        end = self._seq
+        return end - max(first, end - len(slots)) if slots else 0
+
+    @property
+    def next_sequence(self) -> int:
+        """Sequence number the next entry will be written with."""
+        return self._seq
+
+    def get_since(self, seq: int) -> tuple[list[tuple[int, Any]], int]:
+        """Get the entries written since sequence number ``seq``, and the sequence number to continue from.
+
+        Entries that were overwritten before they could be read are skipped.
+        """
+
+        def reader(slots, first, end):
+            start = max(seq, first)
+            return (self._entries(slots, start, end), end), start
+
+        return self._read(reader)
 
     def get_after_timestamp(self, timestamp: int, lines: int = 5) -> dict[int, str]:
         """Get log entries after a timestamp."""
-        rc = {}
-
-        self._rsemaphore.acquire()
-        try:
-            with self._wlock:
-                for ts, msg in self.buffer:
-                    if lines == 0:
-                        break
-                    if ts >= timestamp and lines > 0:
-                        rc[ts] = msg
-                        lines -= 1
-        finally:
-            self._rsemaphore.release()
-
-        return rc
+
+        def reader(slots, first, end):
+            start, lowest = self._bisect(slots, first, end, timestamp)
+            stop = min(start + max(lines, 0), end)
+            return dict(self._entries(slots, start, stop)), min(lowest, start)
+
+        with self._rsemaphore:
+            return self._read(reader)
 
     def get_before_timestamp(self, timestamp: int, lines: int = 5) -> dict[int, str]:
         """Get log entries before a timestamp."""
-        self._rsemaphore.acquire()
-        try:
-            with self._wlock:
-                as_list = list(self.buffer)
-            max_index = -1
-            for i, (ts, _) in enumerate(as_list):
-                if ts >= timestamp:
-                    max_index = i
-                    break
-            if max_index == -1:
-                return self.get_last_n(lines)
-            rc = {}
-            start_from = max(max_index - lines, 0)
-            for i, (ts, msg) in enumerate(as_list):
-                if start_from <= i < max_index:
-                    rc[ts] = msg
-            return rc
-        finally:
-            self._rsemaphore.release()
+
+        def reader(slots, first, end):
+            stop, lowest = self._bisect(slots, first, end, timestamp)
+            # When every entry is older than the timestamp this behaves like get_last_n
+            start = first if stop == end and lines <= 0 else max(stop - lines, first)
+            return dict(self._entries(slots, start, stop)), min(lowest, start)
+
+        with self._rsemaphore:
+            return self._read(reader)
 
     def get_last_n(self, last_idx: int) -> dict[int, str]:
         """Get the last n log entries."""
-        self._rsemaphore.acquire()
-        try:
-            with self._wlock:
-                as_list = list(self.buffer)
-            return dict(as_list[-last_idx:])
-        finally:
-            self._rsemaphore.release()
+
+        def reader(slots, first, end):
+            start = first if last_idx <= 0 else max(end - last_idx, first)
+            return dict(self._entries(slots, start, end)), start
+
+        with self._rsemaphore:
+            return self._read(reader)
 
     @property
     def max(self) -> int:
@@ -160,20 +250,6 @@ class SizedLogBuffer:
 log_buffer = SizedLogBuffer()
 
 
-def add_serialized(_logger: Any, _method_name: str, event_dict: dict[str, Any]) -> dict[str, Any]:
-    """Add serialized version of the log entry."""
-    # Only add serialized if we're in JSON mode (for log buffer)
-    if log_buffer.enabled():
-        subset = {
-            "timestamp": event_dict.get("timestamp", 0),
-            "message": event_dict.get("event", ""),
-            "level": _method_name.upper(),
-            "module": event_dict.get("module", ""),
-        }
-        event_dict["serialized"] = orjson.dumps(subset)
-    return event_dict
-
-
 def remove_exception_in_production(_logger: Any, _method_name: str, event_dict: dict[str, Any]) -> dict[str, Any]:
     """Remove exception details in production."""
     if DEV is False:
@@ -184,11 +260,14 @@ def remove_exception_in_production(_logger: Any, _method_name: str, event_dict:
 
 def buffer_writer(_logger: Any, _method_name: str, event_dict: dict[str, Any]) -> dict[str, Any]:
     """Write to log buffer if enabled."""
-    if log_buffer.enabled() and "serialized" in event_dict:
-        # Use the already-serialized version prepared by add_serialized()
-        # This avoids duplicate serialization and ensures consistency
-        serialized_bytes = event_dict["serialized"]
-        log_buffer.write(serialized_bytes.decode("utf-8"))
+    if log_buffer.enabled():
+        # Take the entry straight from the event dict instead of serializing and parsing it again
+        event = event_dict.get("event", "")
+        timestamp = event_dict.get("timestamp")
+        log_buffer.append(
+            _to_epoch_ms(timestamp) if timestamp else int(time.time() * 1000),
+            event if isinstance(event, str) else str(event),
+        )
     return event_dict
 
 
@@ -264,7 +343,6 @@ def configure(
 
     processors.extend(
         [
-            add_serialized,
             remove_exception_in_production,
             buffer_writer,
         ]
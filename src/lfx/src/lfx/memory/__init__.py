@@ -13,11 +13,14 @@ if has_langflow_memory():
         from langflow.memory import (
             aadd_messages,
             aadd_messagetables,
+            abuffer_message,
             add_messages,
             adelete_messages,
+            aflush_messages,
             aget_messages,
             astore_message,
             aupdate_messages,
+            aupsert_messages,
             delete_message,
             delete_messages,
             get_messages,
@@ -28,11 +31,14 @@ if has_langflow_memory():
         from lfx.memory.stubs import (
             aadd_messages,
             aadd_messagetables,
+            abuffer_message,
             add_messages,
             adelete_messages,
+            aflush_messages,
             aget_messages,
             astore_message,
             aupdate_messages,
+            aupsert_messages,
             delete_message,
             delete_messages,
             get_messages,
@@ -43,11 +49,14 @@ else:
     from lfx.memory.stubs import (
         aadd_messages,
         aadd_messagetables,
+        abuffer_message,
         add_messages,
         adelete_messages,
+        aflush_messages,
         aget_messages,
         astore_message,
         aupdate_messages,
+        aupsert_messages,
         delete_message,
         delete_messages,
         get_messages,
@@ -58,11 +67,14 @@ else:
 __all__ = [
     "aadd_messages",
     "aadd_messagetables",
+    "abuffer_message",
     "add_messages",
     "adelete_messages",
+    "aflush_messages",
     "aget_messages",
     "astore_message",
     "aupdate_messages",
+    "aupsert_messages",
     "delete_message",
     "delete_messages",
     "get_messages",
@@ -300,3 +300,56 @@ async def aadd_messagetables(messages: Message | list[Message]) -> list[Message]
         List[Message]: Added messages.
     """
     return await aadd_messages(messages)
+
+
+async def abuffer_message(message: Message, flow_id: str | UUID | None = None) -> Message:
+    """Hold a message until its final write.
+
+    Without a database there is no write to save, so the message is stored directly.
+
+    Args:
+        message (Message): The message to buffer.
+        flow_id (Optional[str | UUID]): The flow ID associated with the message.
+
+    Returns:
+        Message: The message with its ID set.
+    """
+    return (await astore_message(message, flow_id=flow_id))[0]
+
+
+async def aupsert_messages(messages: Message | list[Message], flow_id: str | UUID | None = None) -> list[Message]:
+    """Insert or update messages.
+
+    Args:
+        messages: Message or list of messages to write.
+        flow_id (Optional[str | UUID]): The flow ID associated with the messages.
+
+    Returns:
+        List[Message]: Written messages.
+    """
+    if not isinstance(messages, list):
+        messages = [messages]
+
+    result = []
+    for message in messages:
+        stored = await astore_message(message, flow_id=flow_id)
+        result.extend(stored)
+    return result
+
+
+async def aflush_messages(
+    session_id: str | None = None,  # noqa: ARG001
+    message_id: str | UUID | None = None,  # noqa: ARG001
+) -> list[Message]:
+    """Write buffered messages.
+
+    Messages are never buffered without a database, so there is nothing to flush.
+
+    Args:
+        session_id (Optional[str]): The session whose buffered messages to write.
+        message_id (Optional[str | UUID]): The buffered message to write.
+
+    Returns:
+        List[Message]: An empty list.
+    """
+    return []
@@ -151,6 +151,13 @@ class Settings(BaseSettings):
     """The cache type can be 'async' or 'redis'."""
     cache_expire: int = 3600
     """The cache expire in seconds."""
+    cache_local_tier: bool = False
+    """If set to True, the 'redis' and 'disk' caches get an in-process LRU tier for hot items.
+    With 'redis', workers invalidate each other's local tier through Redis pub/sub."""
+    cache_local_tier_max_size: int = Field(default=1024, ge=1)
+    """Maximum number of items kept in the in-process cache tier."""
+    cache_local_tier_expire: float = Field(default=30.0, gt=0)
+    """Seconds after which an item of the in-process cache tier is read from the shared cache again."""
     variable_store: str = "db"
     """The store can be 'db' or 'kubernetes'."""
 
@@ -160,6 +167,14 @@ class Settings(BaseSettings):
     """The port on which Langflow will expose Prometheus metrics. 9090 is the default port."""
 
     disable_track_apikey_usage: bool = False
+    api_key_cache_ttl: float = Field(default=10.0, ge=0)
+    """Seconds a validated API key and its user are kept in memory. A deleted key or changed user takes effect
+    in other worker processes once this expires. Set to 0 to look up every API key in the database."""
+    api_key_cache_max_size: int = Field(default=1000, ge=1)
+    """Maximum number of validated API keys kept in memory."""
+    api_key_usage_flush_interval: float = Field(default=5.0, ge=0)
+    """Seconds API key uses are counted in memory before the usage counters are written in one batch.
+    Set to 0 to write the counters on every use."""
     remove_api_keys: bool = False
     components_path: list[str] = []
     components_index_path: str | None = None
@@ -209,6 +224,9 @@ class Settings(BaseSettings):
     """Whether to store environment variables as Global Variables in the database."""
     variables_to_get_from_environment: list[str] = VARIABLES_TO_GET_FROM_ENVIRONMENT
     """List of environment variables to get from the environment and store in the database."""
+    variable_cache_ttl: float = Field(default=30.0, ge=0)
+    """Seconds decrypted Global Variable values are kept in memory per user. Changes made through another
+    worker process become visible once this expires. Set to 0 to read every variable from the database."""
     worker_timeout: int = 300
     """Timeout for the API calls in seconds."""
     frontend_timeout: int = 0
@@ -270,18 +288,39 @@ class Settings(BaseSettings):
     """The maximum number of retries for the health check."""
     max_file_size_upload: int = 1024
     """The maximum file size for the upload in MB."""
+    parsed_file_cache_max_size: int = Field(default=512, ge=0)
+    """Maximum size in MB of the on-disk cache of parsed file contents kept by file components in the config
+    directory. Set to 0 to parse files again on every run."""
     deactivate_tracing: bool = False
     """If set to True, tracing will be deactivated."""
+    tracing_export_workers: int = Field(default=2, ge=1)
+    """Number of threads that run tracer callbacks, so tracer network I/O never blocks the event loop."""
+    tracing_queue_size: int = Field(default=1000, ge=1)
+    """Maximum number of tracer callbacks queued for export per run. A component span started while the queue
+    is full is dropped; the end of a span whose start was queued is always queued."""
+    tracing_export_batch_size: int = Field(default=50, ge=1)
+    """Maximum number of queued tracer callbacks handed to an export thread at once."""
     max_transactions_to_keep: int = 3000
     """The maximum number of transactions to keep in the database."""
     max_vertex_builds_to_keep: int = 3000
     """The maximum number of vertex builds to keep in the database."""
     max_vertex_builds_per_vertex: int = 2
     """The maximum number of builds to keep per vertex. Older builds will be deleted."""
+    vertex_build_flush_interval: float = Field(default=1.0, ge=0)
+    """Seconds vertex builds are buffered in memory before being written to the database in bulk.
+    Set to 0 to write each build as soon as it is logged."""
+    vertex_build_batch_size: int = Field(default=100, ge=1)
+    """Number of buffered vertex builds that triggers a flush before the flush interval elapses."""
+    vertex_build_prune_interval: float = Field(default=60.0, gt=0)
+    """Seconds between the background jobs that enforce max_vertex_builds_to_keep and max_vertex_builds_per_vertex."""
     webhook_polling_interval: int = 5000
     """The polling interval for the webhook in ms."""
     fs_flows_polling_interval: int = 10000
     """The polling interval in milliseconds for synchronizing flows from the file system."""
+    fs_flows_watch: bool = True
+    """If set to True and watchfiles is installed, flow files are watched with filesystem notifications and
+    synchronized as soon as they change. New file-backed flows are still picked up every fs_flows_polling_interval.
+    If False, the flow files are polled every fs_flows_polling_interval."""
     ssl_cert_file: str | None = None
     """Path to the SSL certificate file on the local system."""
     ssl_key_file: str | None = None
@@ -322,9 +361,23 @@ class Settings(BaseSettings):
     Default is 24 hours (86400 seconds). Minimum is 600 seconds (10 minutes)."""
     event_delivery: Literal["polling", "streaming", "direct"] = "streaming"
     """How to deliver build events to the frontend. Can be 'polling', 'streaming' or 'direct'."""
+    token_coalesce_interval_ms: int = Field(default=0, ge=0)
+    """Time window in milliseconds used to batch streamed LLM tokens into a single token event.
+    0 sends every token as its own event."""
+    token_coalesce_max_bytes: int = Field(default=0, ge=0)
+    """Send the batched tokens once they reach this many bytes, even if the time window has not elapsed.
+    0 disables the size limit."""
+    graph_scheduler: Literal["layered", "dataflow"] = "layered"
+    """How Graph.process schedules vertices. 'layered' runs the graph one layer at a time and waits for
+    the whole layer to finish. 'dataflow' starts each vertex as soon as its predecessors have been built."""
+    graph_max_concurrency: int = Field(default=0, ge=0)
+    """Maximum number of vertices built at the same time by the 'dataflow' scheduler. 0 means no limit."""
     lazy_load_components: bool = False
     """If set to True, Langflow will only partially load components at startup and fully load them on demand.
     This significantly reduces startup time but may cause a slight delay when a component is first used."""
+    startup_profile_path: str | None = None
+    """If set, the server startup is profiled with cProfile and the stats are written to this file.
+    The file can be inspected with pstats or tools such as snakeviz."""
 
     # Starter Projects
     create_starter_projects: bool = True
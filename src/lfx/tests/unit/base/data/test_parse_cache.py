@@ -0,0 +1,121 @@
+"""Tests for the on-disk cache of parsed files."""
+
+import os
+import pickle
+from pathlib import Path
+
+import pytest
+from lfx.base.data.parse_cache import ParsedFileCache
+from lfx.base.data.utils import parallel_load_data
+from lfx.schema.data import Data
+
+
+def _parse(file_path: str, *, silent_errors: bool) -> Data | None:  # noqa: ARG001
+    return Data(data={"file_path": file_path, "text": Path(file_path).read_text(encoding="utf-8")})
+
+
+def _write_files(directory, count: int) -> list[str]:
+    paths = []
+    for i in range(count):
+        path = directory / f"doc_{i}.txt"
+        path.write_text(f"document {i}\n" * 50, encoding="utf-8")
+        paths.append(str(path))
+    return paths
+
+
+def test_cache_is_keyed_by_content_not_path(tmp_path):
+    cache = ParsedFileCache(tmp_path / "cache", max_size=1024 * 1024)
+    first = tmp_path / "first.txt"
+    second = tmp_path / "second.txt"
+    first.write_text("same content", encoding="utf-8")
+    second.write_text("same content", encoding="utf-8")
+
+    key = cache.key(str(first), "parser")
+    cache.put(key, Data(data={"file_path": str(first), "text": "parsed"}))
+
+    assert cache.key(str(second), "parser") == key
+    assert cache.key(str(first), "other-parser") != key
+    cached = cache.get(key, str(second))
+    assert cached.data == {"file_path": str(second), "text": "parsed"}
+    assert cache.stats()["hits"] == 1
+
+
+def test_cache_misses_after_content_changes(tmp_path):
+    cache = ParsedFileCache(tmp_path / "cache", max_size=1024 * 1024)
+    path = tmp_path / "doc.txt"
+    path.write_text("before", encoding="utf-8")
+    key = cache.key(str(path), "parser")
+    cache.put(key, Data(data={"file_path": str(path), "text": "before"}))
+
+    path.write_text("after!", encoding="utf-8")
+    os.utime(path, ns=(path.stat().st_atime_ns, path.stat().st_mtime_ns + 1_000_000))
+
+    new_key = cache.key(str(path), "parser")
+    assert new_key != key
+    assert cache.get(new_key, str(path)) is None
+    assert cache.key(str(tmp_path / "missing.txt"), "parser") is None
+
+
+def test_cache_evicts_least_recently_used_entries(tmp_path):
+    entry_size = len(pickle.dumps(Data(data={"text": "x" * 1000}), protocol=pickle.HIGHEST_PROTOCOL))
+    cache = ParsedFileCache(tmp_path / "cache", max_size=int(entry_size * 2.5))
+    for i, key in enumerate(["a", "b"]):
+        cache.put(key, Data(data={"text": "x" * 1000}))
+        os.utime(cache._entry_path(key), (i, i))
+    # Reading "a" makes "b" the least recently used entry
+    assert cache.get("a", "a.txt") is not None
+
+    cache.put("c", Data(data={"text": "x" * 1000}))
+
+    assert cache.get("b", "b.txt") is None
+    assert cache.get("a", "a.txt") is not None
+    assert cache.get("c", "c.txt") is not None
+    assert cache.stats()["evictions"] == 1
+
+
+def test_parallel_load_data_skips_cached_files(tmp_path):
+    cache = ParsedFileCache(tmp_path / "cache", max_size=1024 * 1024)
+    paths = _write_files(tmp_path, 5)
+    calls = []
+
+    def parse(file_path: str, *, silent_errors: bool) -> Data | None:
+        calls.append(file_path)
+        return _parse(file_path, silent_errors=silent_errors)
+
+    first = parallel_load_data(paths, silent_errors=False, max_concurrency=2, load_function=parse, cache=cache)
+    second = parallel_load_data(paths, silent_errors=False, max_concurrency=2, load_function=parse, cache=cache)
+
+    assert len(calls) == len(paths)
+    assert [data.data for data in second] == [data.data for data in first]
+    assert [data.data["file_path"] for data in second] == paths
+
+
+def test_parallel_load_data_in_processes(tmp_path):
+    paths = _write_files(tmp_path, 3)
+
+    loaded = parallel_load_data(paths, silent_errors=False, max_concurrency=2, load_function=_parse, use_processes=True)
+
+    assert [data.data["file_path"] for data in loaded] == paths
+    assert loaded[0].data["text"].startswith("document 0")
+
+
+@pytest.mark.benchmark
+def test_parallel_load_data_cached_folder(tmp_path):
+    """Loading a 500-document folder again is served from the cache without parsing a single file."""
+    cache = ParsedFileCache(tmp_path / "cache", max_size=64 * 1024 * 1024)
+    paths = _write_files(tmp_path, 500)
+    parsed_paths = []
+
+    def parse(file_path: str, *, silent_errors: bool) -> Data | None:
+        parsed_paths.append(file_path)
+        return _parse(file_path, silent_errors=silent_errors)
+
+    parsed = parallel_load_data(paths, silent_errors=False, max_concurrency=4, load_function=parse, cache=cache)
+    assert sorted(parsed_paths) == sorted(paths)
+
+    parsed_paths.clear()
+    cached = parallel_load_data(paths, silent_errors=False, max_concurrency=4, load_function=parse, cache=cache)
+
+    assert parsed_paths == []
+    assert [data.data for data in cached] == [data.data for data in parsed]
+    assert cache.stats()["hits"] == len(paths)
@@ -0,0 +1,130 @@
+"""Unit tests for the graph instance pool of the serve app."""
+
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+from lfx.cli import graph_pool
+from lfx.cli.graph_pool import GraphPool, GraphPoolTimeoutError, GraphPoolUnavailableError
+
+
+@pytest.fixture
+def template():
+    graph = MagicMock()
+    graph.flow_id = "flow-id"
+    graph.clone.side_effect = lambda: MagicMock()
+    return graph
+
+
+def test_pool_is_prebuilt(template):
+    pool = GraphPool(template, size=3)
+
+    assert template.clone.call_count == 3
+    assert pool.available == 3
+
+    with pytest.raises(ValueError, match="at least 1"):
+        GraphPool(template, size=0)
+
+
+async def test_release_replaces_instance_with_a_fresh_clone(template):
+    pool = GraphPool(template, size=1)
+
+    graph = await pool.acquire()
+    assert pool.available == 0
+    await pool.release(graph)
+
+    assert template.clone.call_count == 2
+    assert await pool.acquire() is not graph
+    stats = pool.stats()
+    assert stats["acquisitions"] == 2
+    assert stats["clones"] == 1
+    assert stats["clone_failures"] == 0
+
+
+async def test_release_clones_off_the_event_loop(template):
+    import threading
+
+    clone_threads = []
+    template.clone.side_effect = lambda: clone_threads.append(threading.current_thread()) or MagicMock()
+    pool = GraphPool(template, size=1)
+    clone_threads.clear()
+
+    pool.release_soon(await pool.acquire())
+    await pool.acquire()
+
+    assert clone_threads
+    assert threading.current_thread() not in clone_threads
+
+
+@pytest.fixture
+def no_clone_retry_delay(monkeypatch):
+    monkeypatch.setattr(graph_pool, "CLONE_RETRY_DELAY", 0)
+
+
+@pytest.mark.usefixtures("no_clone_retry_delay")
+async def test_release_retries_failed_clone(template):
+    pool = GraphPool(template, size=1)
+    graph = await pool.acquire()
+    clone = MagicMock()
+    template.clone.side_effect = [ValueError("cannot clone"), clone]
+
+    await pool.release(graph)
+
+    assert pool.size == 1
+    assert await pool.acquire() is clone
+    assert pool.stats()["clone_failures"] == 1
+
+
+@pytest.mark.usefixtures("no_clone_retry_delay")
+async def test_release_shrinks_pool_when_every_clone_attempt_fails(template):
+    pool = GraphPool(template, size=2)
+    graph = await pool.acquire()
+    template.clone.side_effect = ValueError("cannot clone")
+
+    await pool.release(graph)
+
+    assert pool.size == 1
+    assert pool.available == 1
+    assert pool.stats()["clone_failures"] == graph_pool.CLONE_ATTEMPTS
+
+
+@pytest.mark.usefixtures("no_clone_retry_delay")
+async def test_acquire_fails_fast_once_pool_is_empty(template):
+    pool = GraphPool(template, size=1)
+    graph = await pool.acquire()
+    template.clone.side_effect = ValueError("cannot clone")
+    # Waits forever if no instance is released
+    waiter = asyncio.create_task(pool.acquire())
+    await asyncio.sleep(0)
+
+    await pool.release(graph)
+
+    with pytest.raises(GraphPoolUnavailableError):
+        await waiter
+    with pytest.raises(GraphPoolUnavailableError):
+        await pool.acquire()
+    assert pool.available == 0
+
+
+async def test_acquire_waits_for_release(template):
+    pool = GraphPool(template, size=1)
+    graph = await pool.acquire()
+
+    waiter = asyncio.create_task(pool.acquire())
+    await asyncio.sleep(0)
+    assert not waiter.done()
+
+    await pool.release(graph)
+
+    assert await waiter is not graph
+    assert pool.stats()["waits"] == 1
+
+
+async def test_acquire_times_out_when_exhausted(template):
+    pool = GraphPool(template, size=1, acquire_timeout=0.01)
+    await pool.acquire()
+
+    with pytest.raises(GraphPoolTimeoutError):
+        await pool.acquire()
+
+    assert pool.stats()["timeouts"] == 1
@@ -112,7 +112,10 @@ def test_create_multi_serve_app_single_flow(mock_graph, test_flow_meta):
         # Test health endpoint
         response = client.get("/health")
         assert response.status_code == 200
-        assert response.json() == {"status": "healthy", "flow_count": 1}
+        health = response.json()
+        assert health["status"] == "healthy"
+        assert health["flow_count"] == 1
+        assert health["graph_pools"]["test-flow-id"]["available"] == health["graph_pools"]["test-flow-id"]["size"]
 
         # Test run endpoint without auth
         response = client.post("/flows/test-flow-id/run", json={"input_value": "test"})
@@ -0,0 +1,135 @@
+"""Unit tests for the worker processes of the serve command."""
+
+import asyncio
+import multiprocessing
+import os
+import socket
+import time
+import urllib.error
+import urllib.request
+from unittest.mock import MagicMock
+
+import pytest
+import uvicorn
+from lfx.cli.workers import WorkerSupervisor, supports_workers, worker_request_limit
+
+
+async def pid_app(scope, receive, send):  # noqa: ARG001
+    """Serves the pid of its worker, and makes the worker crash on /crash."""
+    if scope["path"] == "/crash":
+        os._exit(1)
+    await send({"type": "http.response.start", "status": 200, "headers": []})
+    await send({"type": "http.response.body", "body": str(os.getpid()).encode()})
+
+
+def run_supervisor(port: int, recycled) -> None:
+    config = uvicorn.Config(pid_app, host="127.0.0.1", port=port, log_level="error", lifespan="off")
+    supervisor = WorkerSupervisor(config, 1, max_requests=2)
+    supervisor.run()
+    recycled.value = supervisor.recycled
+
+
+def test_worker_request_limit():
+    assert worker_request_limit(None) is None
+    assert worker_request_limit(0, 10) is None
+    assert worker_request_limit(100) == 100
+
+    limits = {worker_request_limit(100, 5) for _ in range(200)}
+    assert limits <= set(range(100, 106))
+    assert len(limits) > 1
+
+
+def test_supervisor_requires_a_worker():
+    with pytest.raises(ValueError, match="At least one worker"):
+        WorkerSupervisor(MagicMock(), 0)
+
+
+def test_handle_exit_forwards_signal_to_workers(monkeypatch):
+    killed = []
+    monkeypatch.setattr("lfx.cli.workers.os.kill", lambda pid, sig: killed.append((pid, sig)))
+    supervisor = WorkerSupervisor(MagicMock(), 2)
+    supervisor._processes = {101: 0.0, 102: 0.0}
+
+    supervisor._handle_exit(15, None)
+
+    assert supervisor._should_exit
+    assert killed == [(101, 15), (102, 15)]
+
+
+def test_supervisor_refuses_to_fork_inside_an_event_loop():
+    supervisor = WorkerSupervisor(MagicMock(), 1)
+
+    async def run_supervisor():
+        supervisor.run()
+
+    with pytest.raises(RuntimeError, match="outside of a running event loop"):
+        asyncio.run(run_supervisor())
+    supervisor.config.bind_socket.assert_not_called()
+
+
+@pytest.fixture
+def supervisor_process():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    context = multiprocessing.get_context("fork")
+    recycled = context.Value("i", -1)
+    process = context.Process(target=run_supervisor, args=(port, recycled))
+    process.start()
+    try:
+        yield process, f"http://127.0.0.1:{port}", recycled
+    finally:
+        if process.is_alive():
+            process.kill()
+        process.join()
+
+
+def get_worker_pid(base_url: str, timeout: float = 15) -> int:
+    """Return the pid of the worker serving the next request, waiting for one to be started."""
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            with urllib.request.urlopen(base_url, timeout=5) as response:  # noqa: S310
+                return int(response.read())
+        except (urllib.error.URLError, ConnectionError):
+            if time.monotonic() > deadline:
+                raise
+            time.sleep(0.1)
+
+
+def stop_supervisor(process: multiprocessing.Process) -> None:
+    process.terminate()
+    process.join(15)
+    assert process.exitcode == 0
+
+
+@pytest.mark.skipif(not supports_workers(), reason="Worker processes need os.fork")
+def test_supervisor_recycles_workers_after_their_request_limit(supervisor_process):
+    process, base_url, recycled = supervisor_process
+
+    first_worker = get_worker_pid(base_url)
+    assert get_worker_pid(base_url) == first_worker
+    # The first worker exits once it has served its second request and a new one is forked
+    deadline = time.monotonic() + 15
+    second_worker = first_worker
+    while second_worker == first_worker and time.monotonic() < deadline:
+        second_worker = get_worker_pid(base_url)
+
+    assert second_worker not in {first_worker, process.pid}
+    stop_supervisor(process)
+    assert recycled.value == 1
+
+
+@pytest.mark.skipif(not supports_workers(), reason="Worker processes need os.fork")
+def test_supervisor_restarts_crashed_workers(supervisor_process):
+    process, base_url, recycled = supervisor_process
+
+    first_worker = get_worker_pid(base_url)
+    with pytest.raises((urllib.error.URLError, ConnectionError)):
+        urllib.request.urlopen(f"{base_url}/crash", timeout=5)  # noqa: S310
+    second_worker = get_worker_pid(base_url)
+
+    assert second_worker not in {first_worker, process.pid}
+    stop_supervisor(process)
+    # A crashed worker is replaced, but not counted as recycled
+    assert recycled.value == 0
@@ -0,0 +1,63 @@
+from textwrap import dedent
+
+import pytest
+from lfx.custom.eval import ComponentClassCache, component_class_cache, eval_custom_component_code
+
+CODE = dedent("""
+from lfx.custom import Component
+
+class CachedComponent(Component):
+    def some_method(self):
+        return "ok"
+""")
+
+OTHER_CODE = CODE.replace("CachedComponent", "OtherComponent")
+
+
+def test_cache_returns_same_class_for_same_code():
+    cache = ComponentClassCache()
+
+    first = cache.get_or_create(CODE)
+    second = cache.get_or_create(CODE)
+
+    assert first is second
+    assert first.__name__ == "CachedComponent"
+    assert cache.stats() == {"size": 1, "max_size": cache.max_size, "hits": 1, "misses": 1}
+
+
+def test_cache_evicts_least_recently_used():
+    cache = ComponentClassCache(max_size=1)
+
+    cache.get_or_create(CODE)
+    cache.get_or_create(OTHER_CODE)
+
+    assert OTHER_CODE in cache
+    assert CODE not in cache
+    assert len(cache) == 1
+
+
+def test_invalidate_forces_recompile():
+    cache = ComponentClassCache()
+    first = cache.get_or_create(CODE)
+
+    assert cache.invalidate(CODE) is True
+    assert cache.invalidate(CODE) is False
+    assert cache.get_or_create(CODE) is not first
+    assert cache.misses == 2
+
+
+def test_errors_are_not_cached():
+    cache = ComponentClassCache()
+    broken = "class Broken(Component):\n    def oops(self)\n"
+
+    with pytest.raises(ValueError, match="Invalid Python code"):
+        cache.get_or_create(broken)
+
+    assert len(cache) == 0
+
+
+def test_eval_custom_component_code_uses_module_cache():
+    component_class_cache.invalidate(CODE)
+
+    assert eval_custom_component_code(CODE) is eval_custom_component_code(CODE)
+    assert CODE in component_class_cache
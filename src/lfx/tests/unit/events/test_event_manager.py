@@ -7,6 +7,7 @@ from unittest.mock import MagicMock
 import pytest
 from lfx.events.event_manager import (
     EventManager,
+    TokenCoalescer,
     create_default_event_manager,
     create_stream_tokens_event_manager,
 )
@@ -368,3 +369,59 @@ class TestEventManagerAsync:
         for sent, received in zip(events_to_send, received_events, strict=False):
             assert sent[0] == received[0]  # event type
             assert sent[1] == received[1]  # data
+
+
+class TestTokenCoalescer:
+    """Test batching of token events."""
+
+    @staticmethod
+    def _tokens(queue: asyncio.Queue) -> list[dict]:
+        tokens = []
+        while not queue.empty():
+            _, data_bytes, _ = queue.get_nowait()
+            parsed = json.loads(data_bytes.decode("utf-8").strip())
+            assert parsed["event"] == "token"
+            tokens.append(parsed["data"])
+        return tokens
+
+    def test_disabled_coalescer_sends_every_chunk(self):
+        queue = asyncio.Queue()
+        coalescer = TokenCoalescer(create_stream_tokens_event_manager(queue), "msg-1")
+
+        coalescer.add("Hello")
+        coalescer.add(" world")
+        coalescer.flush()
+
+        assert self._tokens(queue) == [{"chunk": "Hello", "id": "msg-1"}, {"chunk": " world", "id": "msg-1"}]
+
+    def test_max_bytes_batches_chunks(self):
+        queue = asyncio.Queue()
+        coalescer = TokenCoalescer(create_stream_tokens_event_manager(queue), "msg-1", max_bytes=6)
+
+        for chunk in ["ab", "cd", "ef", "g"]:
+            coalescer.add(chunk)
+        assert self._tokens(queue) == [{"chunk": "abcdef", "id": "msg-1"}]
+
+        coalescer.flush()
+        assert self._tokens(queue) == [{"chunk": "g", "id": "msg-1"}]
+
+    def test_interval_batches_chunks(self):
+        queue = asyncio.Queue()
+        coalescer = TokenCoalescer(create_stream_tokens_event_manager(queue), "msg-1", interval=3600)
+
+        coalescer.add("a")
+        coalescer.add("b")
+        assert queue.empty()
+
+        coalescer.interval = 1e-9
+        coalescer.add("c")
+        assert self._tokens(queue) == [{"chunk": "abc", "id": "msg-1"}]
+
+    def test_flush_without_chunks_sends_nothing(self):
+        queue = asyncio.Queue()
+        coalescer = TokenCoalescer(create_stream_tokens_event_manager(queue), "msg-1", max_bytes=10)
+
+        coalescer.add("")
+        coalescer.flush()
+
+        assert queue.empty()
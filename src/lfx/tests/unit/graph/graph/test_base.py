@@ -1,9 +1,54 @@
+import asyncio
 from collections import deque
 
 import pytest
 from lfx.components.input_output import ChatInput, ChatOutput, TextOutputComponent
+from lfx.custom.custom_component.component import Component
 from lfx.graph import Graph
 from lfx.graph.graph.constants import Finish
+from lfx.io import MessageTextInput, Output
+from lfx.schema.message import Message
+
+
+class GatedComponent(Component):
+    """Is only built once ``gate`` is opened by a ``GateOpenerComponent``."""
+
+    gate: asyncio.Event
+
+    inputs = [MessageTextInput(name="input_value")]
+    outputs = [Output(name="text", method="wait_for_gate")]
+
+    async def wait_for_gate(self) -> Message:
+        await GatedComponent.gate.wait()
+        return Message(text=self.input_value)
+
+
+class GateOpenerComponent(Component):
+    inputs = [MessageTextInput(name="input_value")]
+    outputs = [Output(name="text", method="open_gate")]
+
+    def open_gate(self) -> Message:
+        GatedComponent.gate.set()
+        return Message(text=self.input_value)
+
+
+class InFlightComponent(Component):
+    """Records the highest number of its instances being built at once."""
+
+    in_flight = 0
+    peak = 0
+
+    inputs = [MessageTextInput(name="input_value")]
+    outputs = [Output(name="text", method="build_text")]
+
+    async def build_text(self) -> Message:
+        InFlightComponent.in_flight += 1
+        InFlightComponent.peak = max(InFlightComponent.peak, InFlightComponent.in_flight)
+        try:
+            await asyncio.sleep(0.05)
+        finally:
+            InFlightComponent.in_flight -= 1
+        return Message(text=self.input_value)
 
 
 @pytest.mark.asyncio
@@ -72,6 +117,72 @@ async def test_graph_functional_async_start():
     assert results[-1] == Finish()
 
 
+@pytest.mark.asyncio
+@pytest.mark.parametrize("max_concurrency", [0, 1])
+async def test_graph_process_dataflow_scheduler(max_concurrency):
+    chat_input = ChatInput(_id="chat_input")
+    chat_input.set(should_store_message=False)
+    text_output = TextOutputComponent(_id="text_output")
+    text_output.set(input_value=chat_input.message_response)
+    chat_output = ChatOutput(_id="chat_output")
+    chat_output.set(
+        input_value=text_output.text_response, sender_name=chat_input.message_response, should_store_message=False
+    )
+    graph = Graph(chat_input, chat_output)
+
+    await graph.process(fallback_to_env_vars=False, scheduler="dataflow", max_concurrency=max_concurrency)
+
+    assert all(vertex.built for vertex in graph.vertices)
+    assert graph.run_manager.vertices_being_run == set()
+
+
+@pytest.mark.asyncio
+async def test_graph_process_dataflow_does_not_wait_for_slow_vertices():
+    GatedComponent.gate = asyncio.Event()
+    chat_input = ChatInput(_id="chat_input")
+    chat_input.set(should_store_message=False)
+    # The slow branch only finishes once the second vertex of the other branch ran, which the
+    # layered scheduler would only start after the whole first layer, slow vertex included
+    slow = GatedComponent(_id="slow")
+    slow.set(input_value=chat_input.message_response)
+    fast = TextOutputComponent(_id="fast")
+    fast.set(input_value=chat_input.message_response)
+    opener = GateOpenerComponent(_id="opener")
+    opener.set(input_value=fast.text_response)
+    graph = Graph()
+    for component in (chat_input, slow, fast, opener):
+        graph.add_component(component)
+    graph.add_component_edge("chat_input", ("message", "input_value"), "slow")
+    graph.add_component_edge("chat_input", ("message", "input_value"), "fast")
+    graph.add_component_edge("fast", ("text", "input_value"), "opener")
+    graph.prepare()
+
+    await asyncio.wait_for(graph.process(fallback_to_env_vars=False, scheduler="dataflow", max_concurrency=0), 10)
+
+    assert all(vertex.built for vertex in graph.vertices)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("max_concurrency", [1, 2])
+async def test_graph_process_dataflow_caps_builds_in_flight(max_concurrency):
+    InFlightComponent.in_flight = InFlightComponent.peak = 0
+    chat_input = ChatInput(_id="chat_input")
+    chat_input.set(should_store_message=False)
+    graph = Graph()
+    graph.add_component(chat_input)
+    for index in range(4):
+        component = InFlightComponent(_id=f"in_flight_{index}")
+        component.set(input_value=chat_input.message_response)
+        graph.add_component(component)
+        graph.add_component_edge("chat_input", ("message", "input_value"), component._id)
+    graph.prepare()
+
+    await graph.process(fallback_to_env_vars=False, scheduler="dataflow", max_concurrency=max_concurrency)
+
+    assert all(vertex.built for vertex in graph.vertices)
+    assert InFlightComponent.peak == max_concurrency
+
+
 def test_graph_functional_start_end():
     chat_input = ChatInput(_id="chat_input")
     text_output = TextOutputComponent(_id="text_output")
@@ -111,3 +222,166 @@ def test_graph_set_with_valid_component():
     tool = YfinanceToolComponent()
     tool_calling_agent = ToolCallingAgentComponent()
     tool_calling_agent.set(tools=[tool])
+
+
+def test_graph_clone_shares_payload_but_not_run_state(json_memory_chatbot_no_llm):
+    import json
+
+    graph = Graph.from_payload(json.loads(json_memory_chatbot_no_llm), flow_id="flow", user_id="user")
+
+    clone = graph.clone(context={"request": "value"})
+
+    assert clone.flow_id == graph.flow_id
+    assert clone.user_id == graph.user_id
+    assert clone.context == {"request": "value"}
+    assert [vertex.id for vertex in clone.vertices] == [vertex.id for vertex in graph.vertices]
+    assert {(edge.source_id, edge.target_id) for edge in clone.edges} == {
+        (edge.source_id, edge.target_id) for edge in graph.edges
+    }
+    assert clone.predecessor_map == graph.predecessor_map
+    assert clone.in_degree_map == graph.in_degree_map
+    for vertex, cloned_vertex in zip(graph.vertices, clone.vertices, strict=True):
+        assert cloned_vertex is not vertex
+        assert cloned_vertex.graph is clone
+        assert cloned_vertex.full_data is vertex.full_data
+        assert cloned_vertex.custom_component is not None
+        assert cloned_vertex.custom_component is not vertex.custom_component
+        assert cloned_vertex.params is not vertex.params
+    assert all(edge is not original for edge in clone.edges for original in graph.edges)
+
+
+def test_graph_edge_indexes_follow_vertex_removal():
+    chat_input = ChatInput(_id="chat_input")
+    text_output = TextOutputComponent(_id="text_output")
+    text_output.set(input_value=chat_input.message_response)
+    chat_output = ChatOutput(_id="chat_output")
+    chat_output.set(input_value=text_output.text_response, sender_name=chat_input.message_response)
+    graph = Graph(chat_input, chat_output)
+    graph.prepare()
+
+    assert graph.get_edge("chat_input", "text_output") is not None
+    assert {edge.target_id for edge in graph.get_vertex_edges("chat_input")} == {"text_output", "chat_output"}
+    assert [edge.source_id for edge in graph.get_vertex_edges("chat_output", is_source=False)] == [
+        edge.source_id for edge in graph.edges if edge.target_id == "chat_output"
+    ]
+    assert {vertex.id for vertex in graph.get_vertices_with_target("chat_output")} == {"chat_input", "text_output"}
+
+    graph.remove_vertex("text_output")
+
+    assert graph.get_edge("chat_input", "text_output") is None
+    assert graph.get_vertex_edges("text_output") == []
+    assert {vertex.id for vertex in graph.get_vertices_with_target("chat_output")} == {"chat_input"}
+
+
+async def test_graph_prefetches_referenced_variables():
+    from types import SimpleNamespace
+    from unittest.mock import AsyncMock, MagicMock, patch
+
+    graph = Graph(user_id="00000000-0000-0000-0000-000000000001")
+    graph.vertices = [
+        SimpleNamespace(load_from_db_fields=["api_key", "table:rows"], params={"api_key": "OPENAI_API_KEY"}),
+        SimpleNamespace(load_from_db_fields=["api_key", "model"], params={"api_key": "OVERRIDDEN", "model": ""}),
+    ]
+    graph.context = {"request_variables": {"OVERRIDDEN": "value"}}
+    variable_service = MagicMock(prefetch_variables=AsyncMock())
+    session_scope = MagicMock()
+    session_scope.return_value.__aenter__ = AsyncMock(return_value=MagicMock())
+    session_scope.return_value.__aexit__ = AsyncMock(return_value=False)
+
+    assert graph.get_referenced_variable_names() == {"OPENAI_API_KEY"}
+    settings_service = MagicMock()
+    settings_service.settings.use_noop_database = False
+    with (
+        patch("lfx.graph.graph.base.get_settings_service", return_value=settings_service),
+        patch("lfx.graph.graph.base.get_variable_service", return_value=variable_service),
+        patch("lfx.graph.graph.base.session_scope_readonly", session_scope),
+    ):
+        await graph.prefetch_variables()
+
+    variable_service.prefetch_variables.assert_awaited_once()
+    assert variable_service.prefetch_variables.await_args.kwargs["names"] == {"OPENAI_API_KEY"}
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("num_vertices", [10, 100, 1000, 5000])
+def test_graph_edge_lookup_scaling(num_vertices):
+    """Compare indexed edge lookups for every vertex against a linear scan of the edges."""
+    import time
+    from types import SimpleNamespace
+
+    graph = Graph()
+    vertex_ids = [f"vertex-{i}" for i in range(num_vertices)]
+    graph.vertex_map = {vertex_id: SimpleNamespace(id=vertex_id) for vertex_id in vertex_ids}
+    # Each vertex feeds the next two, like a wide chain of components
+    graph.edges = [
+        SimpleNamespace(source_id=vertex_ids[i], target_id=vertex_ids[j])
+        for i in range(num_vertices)
+        for j in (i + 1, i + 2)
+        if j < num_vertices
+    ]
+    graph.build_graph_maps(vertices=[])
+
+    start_time = time.perf_counter()
+    indexed = [graph.get_vertex_edges(vertex_id) for vertex_id in vertex_ids]
+    for vertex_id in vertex_ids:
+        graph.get_vertices_with_target(vertex_id)
+    indexed_duration = time.perf_counter() - start_time
+
+    scanned_vertex_ids = vertex_ids[: min(num_vertices, 200)]
+    start_time = time.perf_counter()
+    scanned = [
+        [edge for edge in graph.edges if vertex_id in {edge.source_id, edge.target_id}]
+        for vertex_id in scanned_vertex_ids
+    ]
+    scan_duration = (time.perf_counter() - start_time) * num_vertices / len(scanned_vertex_ids)
+
+    assert indexed[: len(scanned)] == scanned
+    assert graph.get_edge(vertex_ids[0], vertex_ids[1]) is graph.edges[0]
+
+
+def test_graph_run_state_round_trip(json_memory_chatbot_no_llm):
+    import json
+    import pickle
+
+    from lfx.graph.graph.constants import GRAPH_RUN_STATE_VERSION
+
+    graph = Graph.from_payload(json.loads(json_memory_chatbot_no_llm), flow_id="flow", user_id="user")
+    graph.prepare()
+    graph.set_run_id("run")
+    built_vertex = graph.vertices[0]
+    built_vertex.built = True
+    built_vertex.results = {"message": "hello"}
+    built_vertex.artifacts = {"message": {"repr": "hello"}}
+    built_vertex.built_object = object()
+    graph.run_manager.remove_vertex_from_runnables(built_vertex.id)
+
+    run_state = graph.get_run_state()
+    assert run_state["version"] == GRAPH_RUN_STATE_VERSION
+    assert list(run_state["vertices"]) == [built_vertex.id]
+    # Neither the payload nor the built objects are stored, only plain data and the payload fingerprint
+    assert "graph_data" not in run_state
+    assert run_state["graph_fingerprint"] == graph.payload_fingerprint
+    assert "built_object" not in run_state["vertices"][built_vertex.id]
+    run_state = pickle.loads(pickle.dumps(run_state))
+
+    template = Graph.from_payload(json.loads(json_memory_chatbot_no_llm), flow_id="flow", user_id="user")
+    restored = Graph.from_run_state(run_state, template=template)
+    assert restored.run_id == "run"
+    assert restored.user_id == "user"
+    assert [vertex.id for vertex in restored.vertices] == [vertex.id for vertex in graph.vertices]
+    assert restored.run_manager.to_dict() == graph.run_manager.to_dict()
+    restored_vertex = restored.get_vertex(built_vertex.id)
+    assert restored_vertex.built
+    assert restored_vertex.results == {"message": "hello"}
+    assert restored_vertex.built_object == {"message": "hello"}
+    assert restored_vertex.artifacts == {"message": {"repr": "hello"}}
+    assert not any(vertex.built for vertex in restored.vertices if vertex.id != built_vertex.id)
+    assert not template.get_vertex(built_vertex.id).built
+
+    other_payload = json.loads(json_memory_chatbot_no_llm)
+    other_payload["data"]["nodes"][0]["position"] = {"x": -1.5, "y": -1.5}
+    with pytest.raises(ValueError, match="not created from the payload of the template"):
+        Graph.from_run_state(run_state, template=Graph.from_payload(other_payload, flow_id="flow"))
+
+    with pytest.raises(ValueError, match="Unsupported graph run state version"):
+        Graph.from_run_state({**run_state, "version": GRAPH_RUN_STATE_VERSION + 1}, template=template)